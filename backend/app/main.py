@@ -3,6 +3,7 @@ FastAPI Application Entry Point
 Strategic Build Planner MVP
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -32,11 +33,28 @@ from app.routers import (
     lessons,
     review,
 )
+from app.services.confluence import get_confluence_service
+from app.services.openai_service import get_async_openai_client
+from app.services.document_processor import get_docx_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared clients on shutdown"""
+    yield
+    if get_confluence_service.cache_info().currsize:
+        get_confluence_service().close()
+    if get_async_openai_client.cache_info().currsize:
+        await get_async_openai_client().close()
+    if get_docx_executor.cache_info().currsize:
+        get_docx_executor().shutdown(wait=False, cancel_futures=True)
+
 
 app = FastAPI(
     title="Strategic Build Planner API",
     description="AI-powered APQP Strategic Build Plan generator for Northern Manufacturing",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS - allow common dev ports
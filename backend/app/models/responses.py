@@ -90,6 +90,22 @@ class MeetingApplyRequest(BaseModel):
     attendees: Optional[List[str]] = Field(None, description="List of attendee names")
 
 
+# Every transcript is merged into a full plan by the LLM and all items run
+# at once, so keep a single request to what one client reasonably submits
+MEETING_BATCH_MAX_ITEMS = 10
+
+
+class MeetingBatchApplyRequest(BaseModel):
+    """Request to apply several meeting transcripts, each to its own plan"""
+
+    items: List[MeetingApplyRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MEETING_BATCH_MAX_ITEMS,
+        description="Independent transcript/plan pairs",
+    )
+
+
 class MeetingApplyResponse(BaseModel):
     """Response after applying meeting transcript"""
 
@@ -150,6 +166,58 @@ class QAGradeResponse(BaseModel):
     graded_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+# Synchronous batch grading: at 4 plans per completion, 20 plans is five
+# concurrent LLM calls, which still answers within an interactive timeout
+QA_BATCH_MAX_ITEMS = 20
+
+# Batch API jobs run offline, so the cap only bounds the JSONL file built in
+# memory for the upload
+QA_BATCH_JOB_MAX_ITEMS = 1000
+
+
+class QABatchGradeRequest(BaseModel):
+    """Request to grade several Strategic Build Plans at once"""
+
+    items: List[QAGradeRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=QA_BATCH_MAX_ITEMS,
+        description="Plans to grade",
+    )
+
+
+class QABatchJobRequest(BaseModel):
+    """Request to queue Strategic Build Plans for Batch API grading"""
+
+    items: List[QAGradeRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=QA_BATCH_JOB_MAX_ITEMS,
+        description="Plans to grade",
+    )
+
+
+class QABatchJobResponse(BaseModel):
+    """Status (and, once finished, results) of a Batch API grading job"""
+
+    batch_id: str = Field(..., description="OpenAI batch ID, used to poll the job")
+    status: str = Field(
+        ...,
+        description="validating, in_progress, finalizing, completed, failed, expired, cancelling or cancelled",
+    )
+    total_plans: int = Field(..., description="Plans submitted in the job")
+    completed_plans: int = Field(default=0, description="Plans graded so far")
+    failed_plans: int = Field(default=0, description="Plans that failed to grade")
+    created_at: datetime
+    results: Dict[str, QAGradeResponse] = Field(
+        default_factory=dict,
+        description="Grades keyed by the plan's index in the submitted items",
+    )
+    errors: Dict[str, str] = Field(
+        default_factory=dict, description="Failures keyed by the plan's index"
+    )
+
+
 class ErrorResponse(BaseModel):
     """Standard error response"""
 
@@ -167,28 +235,35 @@ class MissingItem(BaseModel):
     """Item from transcript missing from the plan"""
 
     category: str = Field(
-        ..., description="Category: decision, action_item, requirement, question, risk"
+        default="requirement",
+        description="Category: decision, action_item, requirement, question, risk",
+    )
+    content: str = Field(default="", description="What is missing")
+    transcript_excerpt: str = Field(
+        default="", description="Relevant quote from transcript"
+    )
+    importance: str = Field(
+        default="important", description="Importance: critical, important, minor"
     )
-    content: str = Field(..., description="What is missing")
-    transcript_excerpt: str = Field(..., description="Relevant quote from transcript")
-    importance: str = Field(..., description="Importance: critical, important, minor")
 
 
 class Discrepancy(BaseModel):
     """Discrepancy between transcript and plan"""
 
-    topic: str = Field(..., description="What the discrepancy is about")
-    transcript_says: str = Field(..., description="What was said in the meeting")
-    plan_says: str = Field(..., description="What the plan currently states")
-    severity: str = Field(..., description="Severity: major, minor")
+    topic: str = Field(default="", description="What the discrepancy is about")
+    transcript_says: str = Field(default="", description="What was said in the meeting")
+    plan_says: str = Field(default="", description="What the plan currently states")
+    severity: str = Field(default="minor", description="Severity: major, minor")
 
 
 class CapturedItem(BaseModel):
     """Item correctly captured in the plan"""
 
-    topic: str = Field(..., description="What was captured correctly")
-    plan_location: str = Field(..., description="Which section of the plan")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
+    topic: str = Field(default="", description="What was captured correctly")
+    plan_location: str = Field(default="", description="Which section of the plan")
+    confidence: float = Field(
+        default=0.8, ge=0.0, le=1.0, description="Confidence score"
+    )
 
 
 class CompareRequest(BaseModel):
@@ -205,7 +280,10 @@ class ComparisonResponse(BaseModel):
     """Response from transcript-to-plan comparison"""
 
     coverage_score: float = Field(
-        ..., ge=0, le=100, description="How well the plan covers transcript content"
+        default=50.0,
+        ge=0,
+        le=100,
+        description="How well the plan covers transcript content",
     )
     missing_items: List[MissingItem] = Field(
         default_factory=list, description="Items from transcript not in plan"
@@ -216,7 +294,13 @@ class ComparisonResponse(BaseModel):
     captured_items: List[CapturedItem] = Field(
         default_factory=list, description="Items correctly documented"
     )
-    summary: str = Field(..., description="Brief overall assessment")
+    summary: str = Field(
+        default="Comparison complete.", description="Brief overall assessment"
+    )
+    transcript_truncated: bool = Field(
+        default=False,
+        description="Whether the transcript was shortened to fit the model budget",
+    )
     compared_at: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -224,21 +308,32 @@ class ProcessDimensionScores(BaseModel):
     """Individual dimension scores for process grading"""
 
     discussion_coverage: int = Field(
-        ..., ge=0, le=20, description="Discussion coverage score (0-20)"
+        default=10, ge=0, le=20, description="Discussion coverage score (0-20)"
     )
     stakeholder_participation: int = Field(
-        ..., ge=0, le=20, description="Stakeholder participation score (0-20)"
+        default=10, ge=0, le=20, description="Stakeholder participation score (0-20)"
     )
     decision_quality: int = Field(
-        ..., ge=0, le=20, description="Decision quality score (0-20)"
+        default=10, ge=0, le=20, description="Decision quality score (0-20)"
     )
     action_assignment: int = Field(
-        ..., ge=0, le=20, description="Action assignment score (0-20)"
+        default=10, ge=0, le=20, description="Action assignment score (0-20)"
     )
     risk_discussion: int = Field(
-        ..., ge=0, le=20, description="Risk discussion score (0-20)"
+        default=10, ge=0, le=20, description="Risk discussion score (0-20)"
     )
 
+    @property
+    def total(self) -> int:
+        """Sum of the five dimension scores (0-100)"""
+        return (
+            self.discussion_coverage
+            + self.stakeholder_participation
+            + self.decision_quality
+            + self.action_assignment
+            + self.risk_discussion
+        )
+
 
 class ProcessGradeRequest(BaseModel):
     """Request to grade APQP meeting process quality"""
@@ -271,4 +366,8 @@ class ProcessGradeResponse(BaseModel):
     topics_missing: List[str] = Field(
         default_factory=list, description="APQP topics that were not discussed"
     )
+    transcript_truncated: bool = Field(
+        default=False,
+        description="Whether the transcript was shortened to fit the model budget",
+    )
     graded_at: datetime = Field(default_factory=datetime.utcnow)
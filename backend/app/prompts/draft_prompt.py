@@ -2,6 +2,8 @@
 System Prompts for Strategic Build Plan Generation
 """
 
+from typing import Optional
+
 DRAFT_SYSTEM_PROMPT = """You are Northern Manufacturing's APQP (Advanced Product Quality Planning) assistant, specializing in strategic build planning for manufacturing projects.
 
 **Your Role:**
@@ -167,3 +169,74 @@ If transcript information conflicts with existing plan:
 
 Return the updated Strategic Build Plan JSON.
 """
+
+MEETING_CHUNK_SYSTEM_PROMPT = """You are condensing one part of a long meeting transcript for Northern Manufacturing's APQP process.
+
+**Your Task:**
+Extract only what was said in this part. Do not summarize small talk and do not invent details.
+
+Return JSON:
+```json
+{
+  "decisions": ["..."],
+  "action_items": [{"action": "...", "assignee": "...", "due": "...", "urgency": "..."}],
+  "open_questions": ["..."],
+  "requirements": ["..."],
+  "timeline_changes": ["..."],
+  "technical_clarifications": ["..."]
+}
+```
+
+Keep names, part numbers, quantities, dates and specs exactly as spoken. Use empty lists for anything not discussed.
+"""
+
+
+DRAFT_USER_PROMPT_TEMPLATE = """Generate a comprehensive Strategic Build Plan for:
+
+**Project:** {project_name}
+**Customer:** {customer}
+**Family of Parts:** {family_of_parts}
+
+{additional_context}
+
+Analyze all uploaded documents in the Vector Store and extract:
+- Critical project requirements and constraints
+- Quality requirements and PPAP needs
+- Material specifications and suppliers
+- Historical context from similar projects
+- Manufacturing process recommendations
+- Timeline and milestone suggestions
+- Risks and mitigation strategies
+- Action items that need resolution
+
+Return the complete StrategicBuildPlan JSON structure with all sections populated.
+For any missing or unclear information, flag it with low confidence and create an Asana task.
+"""
+
+
+def build_draft_prompt(
+    project_name: str,
+    customer: str,
+    family_of_parts: str,
+    additional_context: Optional[str] = None,
+) -> str:
+    """
+    Build the user prompt for Strategic Build Plan drafting.
+
+    Args:
+        project_name: Name of the project
+        customer: Customer name
+        family_of_parts: Family of Parts the project belongs to
+        additional_context: Optional free-text context from the user
+
+    Returns:
+        Formatted user prompt string
+    """
+    return DRAFT_USER_PROMPT_TEMPLATE.format(
+        project_name=project_name,
+        customer=customer,
+        family_of_parts=family_of_parts,
+        additional_context=(
+            f"Additional Context: {additional_context}" if additional_context else ""
+        ),
+    )
@@ -2,6 +2,8 @@
 Process Grading Prompt - APQP Meeting Quality Assessment
 """
 
+from functools import lru_cache
+
 PROCESS_GRADE_SYSTEM_PROMPT = """You are an APQP process quality auditor evaluating meeting effectiveness.
 
 Your task is to grade the quality of an APQP meeting based on the transcript.
@@ -110,23 +112,17 @@ Return JSON with these exact fields:
 """
 
 
-def build_process_grade_prompt(
-    transcript: str,
-    meeting_type: str = "kickoff",
-    expected_attendees: list[str] | None = None,
-) -> str:
-    """Build the user prompt for process grading."""
-    attendee_context = ""
-    if expected_attendees:
-        attendee_context = f"\n**Expected Attendees:** {', '.join(expected_attendees)}"
+_PG_PREFIX = """Grade the quality of this APQP meeting based on the transcript.
 
-    return f"""Grade the quality of this APQP meeting based on the transcript.
+**Meeting Type:** """
 
-**Meeting Type:** {meeting_type}{attendee_context}
+_PG_MID = """
 
 **Meeting Transcript:**
 ```
-{transcript}
+"""
+
+_PG_SUFFIX = """
 ```
 
 Evaluate the meeting on all 5 dimensions of the rubric:
@@ -138,3 +134,23 @@ Evaluate the meeting on all 5 dimensions of the rubric:
 
 Return your assessment as JSON matching the specified format.
 """
+
+
+@lru_cache(maxsize=64)
+def _attendee_context(attendees: tuple[str, ...]) -> str:
+    """Format the expected-attendees line (cached across repeated grades)."""
+    return "\n**Expected Attendees:** " + ", ".join(attendees)
+
+
+def build_process_grade_prompt(
+    transcript: str,
+    meeting_type: str = "kickoff",
+    expected_attendees: list[str] | None = None,
+) -> str:
+    """Build the user prompt for process grading."""
+    attendee_context = (
+        _attendee_context(tuple(expected_attendees)) if expected_attendees else ""
+    )
+    return (
+        _PG_PREFIX + meeting_type + attendee_context + _PG_MID + transcript + _PG_SUFFIX
+    )
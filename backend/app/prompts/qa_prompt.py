@@ -128,3 +128,23 @@ Return JSON:
 - Provide specific, actionable improvements (not "add more detail")
 - Reference specific sections when suggesting improvements
 """
+
+QA_BATCH_INSTRUCTIONS = """
+
+**Batch Grading:**
+You will receive a JSON array of plans, each as {"index": <n>, "plan": {...}}.
+Grade every plan independently against the rubric above - never let one plan's
+content influence another plan's scores.
+
+Return JSON with one grade object (in the Output Format above) per input plan,
+each carrying the input's index:
+```json
+{
+  "results": [
+    {"index": 0, "overall_score": 78, "dimension_scores": {...}, "grade": "Acceptable", "strengths": [...], "improvements": [...], "critical_gaps": [...]}
+  ]
+}
+```
+"""
+
+QA_BATCH_SYSTEM_PROMPT = QA_SYSTEM_PROMPT + QA_BATCH_INSTRUCTIONS
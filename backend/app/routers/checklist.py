@@ -1,23 +1,39 @@
 """
 Checklist Router - Pre-Meeting Checklist Generation API
 
-Supports two implementations:
-- Original: Individual prompts via Assistants API (slower, more accurate for edge cases)
-- Optimized: Category-batched via Chat Completions (faster, recommended)
+Checklists are generated by the category-batched service in one of two modes:
+- Fast: Batches of up to 8 prompts per call (default)
+- Accurate: Smaller batches with stricter extraction rules for edge cases
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-
-from datetime import datetime
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+
+from datetime import datetime, timezone
 from app.services.checklist_service import ChecklistService
 from app.services.checklist_service_optimized import OptimizedChecklistService
-from app.services.confluence import ConfluenceService
+from app.services.confluence import ConfluenceService, get_confluence_service
+
+logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/checklist", tags=["checklist"])
+router = APIRouter(
+    prefix="/api/checklist",
+    tags=["checklist"],
+    default_response_class=ORJSONResponse,
+)
 
-# Initialize both services
+# Initialize services once per process
 checklist_service = ChecklistService()
 optimized_checklist_service = OptimizedChecklistService()
 
@@ -25,11 +41,26 @@ optimized_checklist_service = OptimizedChecklistService()
 class ChecklistRequest(BaseModel):
     """Request model for checklist generation"""
 
+    model_config = ConfigDict(extra="ignore")
+
     vector_store_id: str
     project_name: str
     customer: Optional[str] = None
     category_ids: Optional[List[str]] = None
-    optimized: bool = True  # Use optimized batched processing by default
+    optimized: bool = True  # False selects the slower "accurate" batching mode
+
+
+# Each checklist is ~9 batched LLM calls on one shared thread pool, so a
+# handful of projects already saturates it
+CHECKLIST_BATCH_MAX_ITEMS = 5
+
+
+class BatchChecklistRequest(BaseModel):
+    """Request model for generating checklists for several projects at once"""
+
+    items: List[ChecklistRequest] = Field(
+        ..., min_length=1, max_length=CHECKLIST_BATCH_MAX_ITEMS
+    )
 
 
 class ChecklistItem(BaseModel):
@@ -102,38 +133,88 @@ async def generate_checklist(request: ChecklistRequest):
     - `optimized=true` (default): Category-batched processing via Chat Completions API
       - ~10 API calls instead of 37
       - Typical duration: 10-20 seconds
-    - `optimized=false`: Individual prompts via Assistants API
-      - 37 separate API calls
-      - Typical duration: 60-90 seconds
+    - `optimized=false`: Same batched pipeline in "accurate" mode
+      - Smaller batches (3 prompts) with stricter extraction rules
+      - Typical duration: 20-30 seconds
       - May be more accurate for complex edge cases
 
     **Rate limiting**: Prompts run with controlled concurrency (default 10)
     to avoid hitting OpenAI rate limits.
     """
     try:
-        if request.optimized:
-            # Use optimized category-batched processing
-            result = await optimized_checklist_service.generate_checklist(
-                vector_store_id=request.vector_store_id,
-                project_name=request.project_name,
-                customer=request.customer,
-                category_ids=request.category_ids,
-            )
-        else:
-            # Use original individual prompt processing
-            result = await checklist_service.generate_checklist(
-                vector_store_id=request.vector_store_id,
-                project_name=request.project_name,
-                customer=request.customer,
-                category_ids=request.category_ids,
-            )
+        result = await optimized_checklist_service.generate_checklist(
+            vector_store_id=request.vector_store_id,
+            project_name=request.project_name,
+            customer=request.customer,
+            category_ids=request.category_ids,
+            mode="fast" if request.optimized else "accurate",
+        )
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Prompts only change through the admin UI, so let browsers revalidate cheaply
+PROMPTS_CACHE_CONTROL = "max-age=60, must-revalidate"
+
+
+def _prompts_not_modified(request: Request, response: Response) -> Optional[Response]:
+    """Return a 304 if the client already has the current prompts, else tag the response"""
+    etag = checklist_service.get_prompts_etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": PROMPTS_CACHE_CONTROL},
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PROMPTS_CACHE_CONTROL
+    return None
+
+
+@router.post("/batch")
+async def generate_checklists_batch(request: BatchChecklistRequest):
+    """
+    Generate pre-meeting checklists for several projects in one call
+
+    All projects are processed concurrently and share the service's thread
+    pool, so the combined run stays within the same OpenAI concurrency limit
+    as a single checklist.
+
+    Returns one entry per requested item, in order. Failed items carry an
+    `error` field instead of failing the whole batch.
+    """
+    results = await asyncio.gather(
+        *(
+            optimized_checklist_service.generate_checklist(
+                vector_store_id=item.vector_store_id,
+                project_name=item.project_name,
+                customer=item.customer,
+                category_ids=item.category_ids,
+                mode="fast" if item.optimized else "accurate",
+            )
+            for item in request.items
+        ),
+        return_exceptions=True,
+    )
+
+    return {
+        "results": [
+            (
+                {
+                    "project_name": item.project_name,
+                    "vector_store_id": item.vector_store_id,
+                    "error": str(result),
+                }
+                if isinstance(result, Exception)
+                else result
+            )
+            for item, result in zip(request.items, results)
+        ]
+    }
+
+
 @router.get("/prompts", response_model=PromptsResponse)
-async def get_prompts():
+async def get_prompts(request: Request, response: Response):
     """
     Get all checklist prompts
 
@@ -143,18 +224,24 @@ async def get_prompts():
     - Admin interface for editing prompts
     - Filtering which prompts to run
     """
+    not_modified = _prompts_not_modified(request, response)
+    if not_modified:
+        return not_modified
     prompts = checklist_service.get_prompts()
     return prompts
 
 
 @router.get("/prompts/active")
-async def get_active_prompts():
+async def get_active_prompts(request: Request, response: Response):
     """
     Get only active prompts as a flat list
 
     Returns prompts that have active=true, with their category information.
     Useful for showing which prompts will actually run.
     """
+    not_modified = _prompts_not_modified(request, response)
+    if not_modified:
+        return not_modified
     return checklist_service.get_active_prompts()
 
 
@@ -178,6 +265,10 @@ async def update_prompts(prompts_data: dict):
 class PublishChecklistRequest(BaseModel):
     """Request to publish checklist to Confluence"""
 
+    model_config = ConfigDict(extra="ignore")
+
+    # Kept as a raw dict on purpose: Pydantic checks the top-level type only
+    # and never walks the (potentially hundreds of) nested checklist items
     checklist: dict
     parent_page_id: Optional[str] = None
 
@@ -192,7 +283,10 @@ class PublishResponse(BaseModel):
 
 
 @router.post("/publish", response_model=PublishResponse)
-async def publish_checklist_to_confluence(request: PublishChecklistRequest):
+async def publish_checklist_to_confluence(
+    request: PublishChecklistRequest,
+    confluence: ConfluenceService = Depends(get_confluence_service),
+):
     """
     Publish a Pre-Meeting Checklist to Confluence
 
@@ -204,10 +298,6 @@ async def publish_checklist_to_confluence(request: PublishChecklistRequest):
     **Prerequisites:**
     - Confluence credentials configured in .env
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     try:
         checklist = request.checklist
         if not checklist:
@@ -222,14 +312,16 @@ async def publish_checklist_to_confluence(request: PublishChecklistRequest):
         )
 
         # Log first item from first category to verify data
-        if checklist.get("categories") and checklist["categories"][0].get("items"):
-            first_item = checklist["categories"][0]["items"][0]
-            logger.info(
-                f"Sample item - Q: {first_item.get('question', 'N/A')[:50]}, A: {first_item.get('answer', 'N/A')[:50]}, Resolution: {first_item.get('resolution', 'None')}"
-            )
-
-        # Initialize Confluence service
-        confluence = ConfluenceService()
+        if logger.isEnabledFor(logging.INFO):
+            categories = checklist.get("categories") or ()
+            if categories and (items := categories[0].get("items")):
+                first_item = items[0]
+                logger.info(
+                    "Sample item - Q: %s, A: %s, Resolution: %s",
+                    (first_item.get("question") or "N/A")[:50],
+                    (first_item.get("answer") or "N/A")[:50],
+                    first_item.get("resolution", "None"),
+                )
 
         # Convert checklist to Confluence storage format
         checklist_content = confluence.checklist_to_confluence_storage(checklist)
@@ -253,7 +345,7 @@ async def publish_checklist_to_confluence(request: PublishChecklistRequest):
             page_id=result["id"],
             page_url=result["url"],
             page_title=result["title"],
-            published_at=datetime.utcnow(),
+            published_at=datetime.now(timezone.utc),
         )
 
     except ValueError as e:
@@ -270,16 +362,58 @@ async def publish_checklist_to_confluence(request: PublishChecklistRequest):
 
 
 class UpdateTemplateRequest(BaseModel):
-    """Request to update an existing Confluence template with checklist data"""
+    """
+    Request to update an existing Confluence template with checklist data
 
-    checklist: dict
+    Documents the request body only; the endpoint parses the raw JSON itself
+    so large checklists are never copied through Pydantic.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    checklist: dict  # Raw dict - see PublishChecklistRequest
     page_id: str  # The existing page to update
     quote_assumptions: Optional[List[str]] = None  # List of quote assumptions to add
     lessons: Optional[List[dict]] = None  # List of accepted lessons learned to inject
 
 
-@router.post("/publish/template", response_model=PublishResponse)
-async def update_template_with_checklist(request: UpdateTemplateRequest):
+# Last successful template fill per page, most recently used last:
+# page_id -> (expires_at, payload hash, page version written, response)
+TEMPLATE_PUBLISH_CACHE_SIZE = 256
+TEMPLATE_PUBLISH_CACHE_TTL = float(os.getenv("TEMPLATE_PUBLISH_CACHE_TTL", "900"))
+_template_publish_cache: (
+    "OrderedDict[str, Tuple[float, str, Optional[int], PublishResponse]]"
+) = OrderedDict()
+
+
+def _template_payload_hash(
+    checklist: dict, quote_assumptions: List[str], lessons: List[dict]
+) -> str:
+    """Stable content hash of everything that goes into a template fill"""
+    payload = json.dumps(
+        [checklist, quote_assumptions, lessons], sort_keys=True, default=str
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@router.post(
+    "/publish/template",
+    response_model=PublishResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": UpdateTemplateRequest.model_json_schema()
+                }
+            },
+        }
+    },
+)
+async def update_template_with_checklist(
+    request: Request,
+    confluence: ConfluenceService = Depends(get_confluence_service),
+):
     """
     Update an existing Confluence template page with checklist data.
 
@@ -294,49 +428,70 @@ async def update_template_with_checklist(request: UpdateTemplateRequest):
     - User has selected an existing project page to update
     - The page follows the standard template format
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     try:
-        checklist = request.checklist
+        # Decode straight from the raw body and check only the top-level shape
+        payload = orjson.loads(await request.body())
+        if not isinstance(payload, dict):
+            raise HTTPException(status_code=400, detail="Expected a JSON object")
+
+        checklist = payload.get("checklist")
         if not checklist:
             raise HTTPException(status_code=400, detail="No checklist provided")
+        if not isinstance(checklist, dict):
+            raise HTTPException(status_code=400, detail="checklist must be an object")
 
-        if not request.page_id:
+        page_id = payload.get("page_id")
+        if not page_id:
             raise HTTPException(status_code=400, detail="No page_id provided")
+        page_id = str(page_id)
 
         project_name = checklist.get("project_name", "Unknown Project")
-        logger.info(
-            f"Updating template page {request.page_id} with checklist: {project_name}"
-        )
+        logger.info(f"Updating template page {page_id} with checklist: {project_name}")
 
         # Extract quote assumptions from comparison data if available
-        quote_assumptions = request.quote_assumptions or []
+        quote_assumptions = payload.get("quote_assumptions") or []
 
         # Extract lessons learned if available
-        lessons = request.lessons or []
-
-        # Log what we're working with
-        categories = checklist.get("categories", [])
-        items_with_answers = sum(
-            1
-            for cat in categories
-            for item in cat.get("items", [])
-            if item.get("answer") and item.get("status") == "requirement_found"
-        )
-        logger.info(
-            f"Checklist has {len(categories)} categories, {items_with_answers} items with answers"
-        )
+        lessons = payload.get("lessons") or []
+
+        if not isinstance(quote_assumptions, list) or not isinstance(lessons, list):
+            raise HTTPException(
+                status_code=400, detail="quote_assumptions and lessons must be lists"
+            )
+
+        # Log what we're working with (skip the full item walk when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            categories = checklist.get("categories", [])
+            items_with_answers = sum(
+                1
+                for cat in categories
+                for item in cat.get("items", [])
+                if item.get("answer") and item.get("status") == "requirement_found"
+            )
+            logger.info(
+                f"Checklist has {len(categories)} categories, {items_with_answers} items with answers"
+            )
         logger.info(f"Quote assumptions: {len(quote_assumptions)}")
         logger.info(f"Lessons learned: {len(lessons)}")
 
-        # Initialize Confluence service
-        confluence = ConfluenceService()
+        # Skip the update if this exact payload was already injected into
+        # this page (re-injecting would duplicate the items) and nobody has
+        # edited the page in Confluence since
+        payload_hash = _template_payload_hash(checklist, quote_assumptions, lessons)
+        cached = _template_publish_cache.get(page_id)
+        if cached and cached[0] > time.monotonic() and cached[1] == payload_hash:
+            page = await confluence.get_page(page_id)
+            if page and page.get("version") == cached[2]:
+                _template_publish_cache.move_to_end(page_id)
+                logger.info(
+                    f"Template page {page_id} already has this checklist, "
+                    "skipping update"
+                )
+                return cached[3]
 
         # Fill the template with checklist data
         result = await confluence.fill_template_with_checklist(
-            page_id=request.page_id,
+            page_id=page_id,
             checklist=checklist,
             quote_assumptions=quote_assumptions,
             lessons=lessons,
@@ -347,12 +502,22 @@ async def update_template_with_checklist(request: UpdateTemplateRequest):
             f"({result['id']}) - {result['url']}"
         )
 
-        return PublishResponse(
+        response = PublishResponse(
             page_id=result["id"],
             page_url=result["url"],
             page_title=result["title"],
-            published_at=datetime.utcnow(),
+            published_at=datetime.now(timezone.utc),
+        )
+        _template_publish_cache[page_id] = (
+            time.monotonic() + TEMPLATE_PUBLISH_CACHE_TTL,
+            payload_hash,
+            result.get("version"),
+            response,
         )
+        _template_publish_cache.move_to_end(page_id)
+        if len(_template_publish_cache) > TEMPLATE_PUBLISH_CACHE_SIZE:
+            _template_publish_cache.popitem(last=False)
+        return response
 
     except ValueError as e:
         logger.error(f"Template update error: {str(e)}")
@@ -7,16 +7,35 @@ Provides endpoints for:
 - Reading page content for context
 """
 
+import asyncio
+import logging
+import os
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from app.services.confluence import ConfluenceService
+from app.services.confluence import get_confluence_service
 
-router = APIRouter(prefix="/api/confluence", tags=["confluence"])
+logger = logging.getLogger(__name__)
 
-# Initialize service
-confluence_service = ConfluenceService()
+router = APIRouter(
+    prefix="/api/confluence",
+    tags=["confluence"],
+    default_response_class=ORJSONResponse,
+)
+
+# Shared process-wide service
+confluence_service = get_confluence_service()
+
+# Cap concurrent Confluence fetches so deep hierarchies don't trigger 429s
+_confluence_sem = asyncio.Semaphore(int(os.getenv("CONFLUENCE_MAX_CONCURRENCY", "10")))
+
+
+async def _get_page_text_bounded(page_id: str) -> Optional[str]:
+    """Fetch page text while holding a slot in the shared Confluence semaphore"""
+    async with _confluence_sem:
+        return await confluence_service.get_page_content_text(page_id)
 
 
 # ============================================================================
@@ -232,27 +251,28 @@ async def get_page_context(page_id: str):
         if not page:
             raise HTTPException(status_code=404, detail=f"Page {page_id} not found")
 
+        # The project page body is already in hand; fetch ancestor text
+        # concurrently instead of one round-trip at a time
+        ancestors = page.get("ancestors", [])
+        ancestor_texts = await asyncio.gather(
+            *(_get_page_text_bounded(ancestor["id"]) for ancestor in ancestors)
+        )
+
         context = {
             "project": {
                 "id": page["id"],
                 "title": page["title"],
-                "text": await confluence_service.get_page_content_text(page_id),
+                "text": confluence_service.storage_to_text(page.get("content", "")),
             },
-            "ancestors": [],
-        }
-
-        # Get text content for each ancestor
-        for ancestor in page.get("ancestors", []):
-            ancestor_text = await confluence_service.get_page_content_text(
-                ancestor["id"]
-            )
-            context["ancestors"].append(
+            "ancestors": [
                 {
                     "id": ancestor["id"],
                     "title": ancestor["title"],
                     "text": ancestor_text,
                 }
-            )
+                for ancestor, ancestor_text in zip(ancestors, ancestor_texts)
+            ],
+        }
 
         return context
 
@@ -284,10 +304,6 @@ async def create_family_page(request: CreateFamilyRequest):
     When a project page sits directly under a Customer page without the
     intermediate Family of Parts grouping page.
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     try:
         family_result = await confluence_service.create_family_page_from_template(
             customer_page_id=request.customer_page_id,
@@ -4,261 +4,198 @@ Draft Router - Strategic Build Plan Generation
 
 import logging
 import json
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
+from typing import Iterator, List, Optional
+
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.services.openai_service import OpenAIService
 from app.models.responses import DraftRequest, DraftResponse, ErrorResponse
 from app.models.plan_schema import StrategicBuildPlan
-from app.prompts.draft_prompt import DRAFT_SYSTEM_PROMPT
+from app.prompts.draft_prompt import DRAFT_SYSTEM_PROMPT, build_draft_prompt
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
-
-
-def plan_to_markdown(plan: dict) -> str:
-    """
-    Convert Strategic Build Plan JSON to Markdown format
-
-    Args:
-        plan: Plan dictionary
-
-    Returns:
-        Markdown formatted string
-    """
-    md_lines = []
-
-    # Header
-    md_lines.append(f"# Strategic Build Plan: {plan.get('project_name', 'Unknown')}")
-    md_lines.append("")
-    md_lines.append(f"**Customer:** {plan.get('customer', 'Unknown')}")
-    md_lines.append(f"**Family of Parts:** {plan.get('family_of_parts', 'Unknown')}")
-    md_lines.append(
-        f"**Generated:** {plan.get('generated_at', datetime.utcnow().isoformat())}"
-    )
-    md_lines.append("")
-    md_lines.append("---")
-    md_lines.append("")
-
-    def render_key_points(key_points: list, section_name: str) -> list:
-        """Render a list of key points as markdown"""
-        lines = []
-        if not key_points:
-            lines.append(f"*No {section_name.lower()} recorded yet.*")
-            return lines
-
-        for kp in key_points:
-            confidence = kp.get("confidence", 0)
-            confidence_level = kp.get("confidence_level", "unknown")
-            text = kp.get("text", "")
-
-            # Confidence indicator
-            if confidence >= 0.8:
-                conf_icon = "🟢"
-            elif confidence >= 0.5:
-                conf_icon = "🟡"
-            else:
-                conf_icon = "🔴"
-
-            lines.append(f"- {conf_icon} {text}")
-
-            # Source hint
-            source = kp.get("source_hint")
-            if source:
-                source_parts = []
-                if source.get("document"):
-                    source_parts.append(source["document"])
-                if source.get("page"):
-                    source_parts.append(f"pg. {source['page']}")
-                if source.get("section"):
-                    source_parts.append(f"§{source['section']}")
-                if source_parts:
-                    lines.append(
-                        f"  - *Source: {', '.join(source_parts)} (confidence: {confidence:.0%})*"
-                    )
-
-        return lines
-
-    # Keys to Project
-    md_lines.append("## 🔑 Keys to Project")
-    md_lines.append("")
-    md_lines.extend(render_key_points(plan.get("keys_to_project", []), "keys"))
-    md_lines.append("")
-
-    # Quality Plan
-    md_lines.append("## ✅ Quality Plan")
-    md_lines.append("")
-    quality = plan.get("quality_plan", {})
-
-    if quality.get("control_plan_items"):
-        md_lines.append("### Control Plan Items")
-        md_lines.extend(
-            render_key_points(quality["control_plan_items"], "control plan items")
-        )
-        md_lines.append("")
-
-    if quality.get("inspection_strategy"):
-        md_lines.append("### Inspection Strategy")
-        md_lines.extend(
-            render_key_points(quality["inspection_strategy"], "inspection items")
-        )
-        md_lines.append("")
-
-    if quality.get("quality_metrics"):
-        md_lines.append("### Quality Metrics")
-        md_lines.extend(render_key_points(quality["quality_metrics"], "metrics"))
-        md_lines.append("")
-
-    if quality.get("ppap_requirements"):
-        md_lines.append("### PPAP Requirements")
-        md_lines.extend(render_key_points(quality["ppap_requirements"], "PPAP items"))
-        md_lines.append("")
-
-    # Purchasing
-    md_lines.append("## 🛒 Purchasing")
-    md_lines.append("")
-    purchasing = plan.get("purchasing", {})
-
-    if purchasing.get("raw_materials"):
-        md_lines.append("### Raw Materials")
-        md_lines.extend(render_key_points(purchasing["raw_materials"], "materials"))
-        md_lines.append("")
-
-    if purchasing.get("suppliers"):
-        md_lines.append("### Suppliers")
-        md_lines.extend(render_key_points(purchasing["suppliers"], "suppliers"))
-        md_lines.append("")
-
-    if purchasing.get("lead_times"):
-        md_lines.append("### Lead Times")
-        md_lines.extend(render_key_points(purchasing["lead_times"], "lead times"))
-        md_lines.append("")
-
-    if purchasing.get("cost_estimates"):
-        md_lines.append("### Cost Estimates")
-        md_lines.extend(render_key_points(purchasing["cost_estimates"], "estimates"))
-        md_lines.append("")
-
-    # History Review
-    md_lines.append("## 📜 History Review")
-    md_lines.append("")
-    history = plan.get("history_review", {})
-
-    if history.get("previous_projects"):
-        md_lines.append("### Previous Projects")
-        md_lines.extend(render_key_points(history["previous_projects"], "projects"))
-        md_lines.append("")
-
-    if history.get("lessons_learned"):
-        md_lines.append("### Lessons Learned")
-        md_lines.extend(render_key_points(history["lessons_learned"], "lessons"))
-        md_lines.append("")
-
-    if history.get("recurring_issues"):
-        md_lines.append("### Recurring Issues")
-        md_lines.extend(render_key_points(history["recurring_issues"], "issues"))
-        md_lines.append("")
-
-    # Build Strategy
-    md_lines.append("## 🏭 Build Strategy")
-    md_lines.append("")
-    build = plan.get("build_strategy", {})
-
-    if build.get("manufacturing_process"):
-        md_lines.append("### Manufacturing Process")
-        md_lines.extend(render_key_points(build["manufacturing_process"], "processes"))
-        md_lines.append("")
-
-    if build.get("tooling_requirements"):
-        md_lines.append("### Tooling Requirements")
-        md_lines.extend(render_key_points(build["tooling_requirements"], "tooling"))
-        md_lines.append("")
-
-    if build.get("capacity_planning"):
-        md_lines.append("### Capacity Planning")
-        md_lines.extend(render_key_points(build["capacity_planning"], "capacity items"))
-        md_lines.append("")
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Initialize service once per process (reuses the OpenAI HTTP connection pool)
+openai_service = OpenAIService()
+
+
+# Flush size for streamed markdown (characters)
+MARKDOWN_CHUNK_SIZE = 4096
+
+# Rendered markdown by plan ETag, most recently used last
+MARKDOWN_CACHE_SIZE = 128
+_markdown_cache: "OrderedDict[str, str]" = OrderedDict()
+
+# Confidence icon by bucket: 0 = <0.5, 1 = 0.5-0.8, 2 = >=0.8
+_CONF_ICONS = ("🔴", "🟡", "🟢")
+
+
+# Plan sections rendered in order: (heading, plan key, subsections), where
+# each subsection is (heading, key within the section, empty-state noun)
+_PLAN_SECTIONS = (
+    (
+        "## ✅ Quality Plan",
+        "quality_plan",
+        (
+            ("### Control Plan Items", "control_plan_items", "control plan items"),
+            ("### Inspection Strategy", "inspection_strategy", "inspection items"),
+            ("### Quality Metrics", "quality_metrics", "metrics"),
+            ("### PPAP Requirements", "ppap_requirements", "PPAP items"),
+        ),
+    ),
+    (
+        "## 🛒 Purchasing",
+        "purchasing",
+        (
+            ("### Raw Materials", "raw_materials", "materials"),
+            ("### Suppliers", "suppliers", "suppliers"),
+            ("### Lead Times", "lead_times", "lead times"),
+            ("### Cost Estimates", "cost_estimates", "estimates"),
+        ),
+    ),
+    (
+        "## 📜 History Review",
+        "history_review",
+        (
+            ("### Previous Projects", "previous_projects", "projects"),
+            ("### Lessons Learned", "lessons_learned", "lessons"),
+            ("### Recurring Issues", "recurring_issues", "issues"),
+        ),
+    ),
+    (
+        "## 🏭 Build Strategy",
+        "build_strategy",
+        (
+            ("### Manufacturing Process", "manufacturing_process", "processes"),
+            ("### Tooling Requirements", "tooling_requirements", "tooling"),
+            ("### Capacity Planning", "capacity_planning", "capacity items"),
+            ("### Make vs. Buy Decisions", "make_vs_buy_decisions", "decisions"),
+        ),
+    ),
+    (
+        "## 📅 Execution Strategy",
+        "execution_strategy",
+        (
+            ("### Timeline", "timeline", "timeline items"),
+            ("### Milestones", "milestones", "milestones"),
+            ("### Resource Allocation", "resource_allocation", "resources"),
+            ("### Risk Mitigation", "risk_mitigation", "risks"),
+        ),
+    ),
+    (
+        "## 🚀 Release Plan",
+        "release_plan",
+        (
+            ("### Release Criteria", "release_criteria", "criteria"),
+            ("### Validation Steps", "validation_steps", "steps"),
+            ("### Production Ramp", "production_ramp", "ramp items"),
+        ),
+    ),
+    (
+        "## 📦 Shipping",
+        "shipping",
+        (
+            ("### Packaging Requirements", "packaging_requirements", "packaging"),
+            ("### Shipping Methods", "shipping_methods", "methods"),
+            ("### Delivery Schedule", "delivery_schedule", "schedule"),
+        ),
+    ),
+)
+
+
+def _render_key_points(md_lines: list, key_points: list, section_name: str) -> None:
+    """Append a list of key points to md_lines as markdown"""
+    if not key_points:
+        md_lines.append(f"*No {section_name.lower()} recorded yet.*")
+        return
+
+    # Hot loop: bind lookups to locals (fastest bytecode path in CPython)
+    append = md_lines.append
+    icons = _CONF_ICONS
+    for kp in key_points:
+        get = kp.get
+        confidence = get("confidence", 0)
+        conf_icon = icons[(confidence >= 0.5) + (confidence >= 0.8)]
+        append(f"- {conf_icon} {get('text', '')}")
+
+        # Source hint
+        source = get("source_hint")
+        if source:
+            page = source.get("page")
+            section = source.get("section")
+            source_text = ", ".join(
+                filter(
+                    None,
+                    (
+                        source.get("document"),
+                        page and f"pg. {page}",
+                        section and f"§{section}",
+                    ),
+                )
+            )
+            if source_text:
+                append(f"  - *Source: {source_text} (confidence: {confidence:.0%})*")
 
-    if build.get("make_vs_buy_decisions"):
-        md_lines.append("### Make vs. Buy Decisions")
-        md_lines.extend(render_key_points(build["make_vs_buy_decisions"], "decisions"))
-        md_lines.append("")
 
-    # Execution Strategy
-    md_lines.append("## 📅 Execution Strategy")
+def _render_subsection(
+    md_lines: list, heading: str, key_points: list, section_name: str
+) -> None:
+    """Append a ### subsection with its key points and a trailing blank line"""
+    md_lines.append(heading)
+    _render_key_points(md_lines, key_points, section_name)
     md_lines.append("")
-    execution = plan.get("execution_strategy", {})
 
-    if execution.get("timeline"):
-        md_lines.append("### Timeline")
-        md_lines.extend(render_key_points(execution["timeline"], "timeline items"))
-        md_lines.append("")
-
-    if execution.get("milestones"):
-        md_lines.append("### Milestones")
-        md_lines.extend(render_key_points(execution["milestones"], "milestones"))
-        md_lines.append("")
 
-    if execution.get("resource_allocation"):
-        md_lines.append("### Resource Allocation")
-        md_lines.extend(
-            render_key_points(execution["resource_allocation"], "resources")
-        )
-        md_lines.append("")
-
-    if execution.get("risk_mitigation"):
-        md_lines.append("### Risk Mitigation")
-        md_lines.extend(render_key_points(execution["risk_mitigation"], "risks"))
-        md_lines.append("")
-
-    # Release Plan
-    md_lines.append("## 🚀 Release Plan")
-    md_lines.append("")
-    release = plan.get("release_plan", {})
-
-    if release.get("release_criteria"):
-        md_lines.append("### Release Criteria")
-        md_lines.extend(render_key_points(release["release_criteria"], "criteria"))
-        md_lines.append("")
+def _iter_plan_sections(
+    plan: dict, now_iso: Optional[str] = None
+) -> Iterator[List[str]]:
+    """Yield the markdown lines of each plan section, in document order"""
+    # Header (only read the clock if the plan has no timestamp of its own)
+    if "generated_at" in plan:
+        generated_at = plan["generated_at"]
+    else:
+        generated_at = now_iso or datetime.utcnow().isoformat()
+    yield [
+        f"# Strategic Build Plan: {plan.get('project_name', 'Unknown')}",
+        "",
+        f"**Customer:** {plan.get('customer', 'Unknown')}",
+        f"**Family of Parts:** {plan.get('family_of_parts', 'Unknown')}",
+        f"**Generated:** {generated_at}",
+        "",
+        "---",
+        "",
+    ]
 
-    if release.get("validation_steps"):
-        md_lines.append("### Validation Steps")
-        md_lines.extend(render_key_points(release["validation_steps"], "steps"))
-        md_lines.append("")
-
-    if release.get("production_ramp"):
-        md_lines.append("### Production Ramp")
-        md_lines.extend(render_key_points(release["production_ramp"], "ramp items"))
-        md_lines.append("")
-
-    # Shipping
-    md_lines.append("## 📦 Shipping")
+    # Keys to Project
+    md_lines = ["## 🔑 Keys to Project", ""]
+    _render_key_points(md_lines, plan.get("keys_to_project", []), "keys")
     md_lines.append("")
-    shipping = plan.get("shipping", {})
-
-    if shipping.get("packaging_requirements"):
-        md_lines.append("### Packaging Requirements")
-        md_lines.extend(
-            render_key_points(shipping["packaging_requirements"], "packaging")
-        )
-        md_lines.append("")
-
-    if shipping.get("shipping_methods"):
-        md_lines.append("### Shipping Methods")
-        md_lines.extend(render_key_points(shipping["shipping_methods"], "methods"))
-        md_lines.append("")
-
-    if shipping.get("delivery_schedule"):
-        md_lines.append("### Delivery Schedule")
-        md_lines.extend(render_key_points(shipping["delivery_schedule"], "schedule"))
-        md_lines.append("")
+    yield md_lines
+
+    # Plan sections (Quality Plan through Shipping); sections with no
+    # content at all are left out rather than rendered as a bare heading
+    for heading, key, subsections in _PLAN_SECTIONS:
+        section = plan.get(key) or {}
+        if not any(section.get(sub_key) for _, sub_key, _ in subsections):
+            continue
+        md_lines = [heading, ""]
+        for sub_heading, sub_key, section_name in subsections:
+            key_points = section.get(sub_key)
+            if key_points:
+                _render_subsection(md_lines, sub_heading, key_points, section_name)
+        yield md_lines
 
     # Asana Tasks
     asana_todos = plan.get("asana_todos", [])
     if asana_todos:
-        md_lines.append("## ✅ Action Items (Asana Tasks)")
-        md_lines.append("")
+        md_lines = ["## ✅ Action Items (Asana Tasks)", ""]
         for task in asana_todos:
             priority = task.get("priority", "medium")
             priority_icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(
@@ -272,39 +209,134 @@ def plan_to_markdown(plan: dict) -> str:
             if task.get("due_date_hint"):
                 md_lines.append(f"  - *Due: {task['due_date_hint']}*")
         md_lines.append("")
+        yield md_lines
 
     # Notes
     apqp_notes = plan.get("apqp_notes", [])
     if apqp_notes:
-        md_lines.append("## 📝 APQP Notes")
-        md_lines.append("")
+        md_lines = ["## 📝 APQP Notes", ""]
         for note in apqp_notes:
             if note.get("timestamp"):
                 md_lines.append(f"**{note['timestamp']}**")
             md_lines.append(f"{note.get('content', '')}")
             md_lines.append("")
+        yield md_lines
 
     meeting_notes = plan.get("customer_meeting_notes", [])
     if meeting_notes:
-        md_lines.append("## 🤝 Customer Meeting Notes")
-        md_lines.append("")
+        md_lines = ["## 🤝 Customer Meeting Notes", ""]
         for note in meeting_notes:
             if note.get("timestamp"):
                 md_lines.append(f"**{note['timestamp']}**")
             md_lines.append(f"{note.get('content', '')}")
             md_lines.append("")
+        yield md_lines
 
     # Footer
-    md_lines.append("---")
-    md_lines.append("")
-    md_lines.append(
-        "*Generated by Strategic Build Planner - Northern Manufacturing Co., Inc.*"
+    yield [
+        "---",
+        "",
+        "*Generated by Strategic Build Planner - Northern Manufacturing Co., Inc.*",
+    ]
+
+
+def plan_to_markdown(plan: dict, now_iso: Optional[str] = None) -> str:
+    """
+    Convert Strategic Build Plan JSON to Markdown format
+
+    Args:
+        plan: Plan dictionary
+        now_iso: Caller's timestamp to use if the plan has no generated_at
+
+    Returns:
+        Markdown formatted string
+    """
+    return "\n".join(
+        line for md_lines in _iter_plan_sections(plan, now_iso) for line in md_lines
     )
 
-    return "\n".join(md_lines)
 
+def iter_plan_markdown(
+    plan: dict, chunk_size: int = MARKDOWN_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Yield the same Markdown as plan_to_markdown in chunks of ~chunk_size chars
 
-@router.post("/draft", response_model=DraftResponse)
+    Whole sections are buffered until the chunk size is reached so a
+    streaming response isn't flushed once per line.
+    """
+    buffer: List[str] = []
+    buffered = 0
+    separator = ""
+    for md_lines in _iter_plan_sections(plan):
+        buffer.extend(md_lines)
+        buffered += sum(len(line) + 1 for line in md_lines)
+        if buffered >= chunk_size:
+            yield separator + "\n".join(buffer)
+            separator = "\n"
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield separator + "\n".join(buffer)
+
+
+def plan_etag(plan: dict) -> str:
+    """Strong ETag for a plan: content hash of its canonical JSON encoding"""
+    plan_bytes = orjson.dumps(plan, option=orjson.OPT_SORT_KEYS)
+    return f'"{hashlib.blake2b(plan_bytes, digest_size=16).hexdigest()}"'
+
+
+def _get_cached_markdown(etag: str) -> Optional[str]:
+    markdown = _markdown_cache.get(etag)
+    if markdown is not None:
+        _markdown_cache.move_to_end(etag)
+    return markdown
+
+
+def _store_cached_markdown(etag: str, markdown: str) -> None:
+    _markdown_cache[etag] = markdown
+    _markdown_cache.move_to_end(etag)
+    if len(_markdown_cache) > MARKDOWN_CACHE_SIZE:
+        _markdown_cache.popitem(last=False)
+
+
+def _markdown_cacheable(plan: dict) -> bool:
+    """
+    Whether a plan's Markdown depends only on its content
+
+    Without generated_at the header shows the render time, so a cached copy
+    would replay the first render's timestamp.
+    """
+    return "generated_at" in plan
+
+
+def plan_to_markdown_cached(plan: dict) -> str:
+    """plan_to_markdown memoized on the plan's content hash"""
+    if not _markdown_cacheable(plan):
+        return plan_to_markdown(plan)
+    etag = plan_etag(plan)
+    markdown = _get_cached_markdown(etag)
+    if markdown is None:
+        markdown = plan_to_markdown(plan)
+        _store_cached_markdown(etag, markdown)
+    return markdown
+
+
+def _stream_and_cache_markdown(plan: dict, etag: str) -> Iterator[str]:
+    """Stream rendered chunks and cache the full document once complete"""
+    if not _markdown_cacheable(plan):
+        yield from iter_plan_markdown(plan)
+        return
+    chunks = []
+    for chunk in iter_plan_markdown(plan):
+        chunks.append(chunk)
+        yield chunk
+    _store_cached_markdown(etag, "".join(chunks))
+
+
+# The plan is validated once against StrategicBuildPlan inside the handler;
+# DraftResponse only documents the shape so FastAPI doesn't re-validate it
+@router.post("/draft", responses={200: {"model": DraftResponse}})
 async def generate_draft(request: DraftRequest):
     """
     Generate a Strategic Build Plan from ingested documents
@@ -319,6 +351,10 @@ async def generate_draft(request: DraftRequest):
     **Prerequisites:**
     - Must have a valid session_id and vector_store_id from /api/ingest
     """
+    # One clock read per request, shared by the plan, markdown and response
+    now = datetime.utcnow()
+    now_iso = now.isoformat()
+
     try:
         logger.info(
             f"Generating draft for project: {request.project_name}, "
@@ -326,31 +362,13 @@ async def generate_draft(request: DraftRequest):
             f"vector_store: {request.vector_store_id}"
         )
 
-        # Initialize OpenAI service
-        openai_service = OpenAIService()
-
         # Build user prompt
-        user_prompt = f"""Generate a comprehensive Strategic Build Plan for:
-
-**Project:** {request.project_name}
-**Customer:** {request.customer}
-**Family of Parts:** {request.family_of_parts}
-
-{f"Additional Context: {request.additional_context}" if request.additional_context else ""}
-
-Analyze all uploaded documents in the Vector Store and extract:
-- Critical project requirements and constraints
-- Quality requirements and PPAP needs
-- Material specifications and suppliers
-- Historical context from similar projects
-- Manufacturing process recommendations
-- Timeline and milestone suggestions
-- Risks and mitigation strategies
-- Action items that need resolution
-
-Return the complete StrategicBuildPlan JSON structure with all sections populated.
-For any missing or unclear information, flag it with low confidence and create an Asana task.
-"""
+        user_prompt = build_draft_prompt(
+            project_name=request.project_name,
+            customer=request.customer,
+            family_of_parts=request.family_of_parts,
+            additional_context=request.additional_context,
+        )
 
         # Generate plan using OpenAI
         plan_data = await openai_service.generate_plan(
@@ -365,19 +383,23 @@ For any missing or unclear information, flag it with low confidence and create a
         plan_data["project_name"] = request.project_name
         plan_data["customer"] = request.customer
         plan_data["family_of_parts"] = request.family_of_parts
-        plan_data["generated_at"] = datetime.utcnow().isoformat()
+        plan_data["generated_at"] = now_iso
 
         # Validate against Pydantic model (will raise if invalid)
         try:
-            validated_plan = StrategicBuildPlan(**plan_data)
-            plan_json = validated_plan.model_dump(mode="json")
+            validated_plan = StrategicBuildPlan.model_validate(plan_data)
+            # Serialize in pydantic-core and decode with orjson; much cheaper
+            # than model_dump(mode="json") walking the tree in Python
+            plan_json = orjson.loads(validated_plan.model_dump_json())
         except Exception as validation_error:
             logger.warning(f"Plan validation warning: {validation_error}")
             # Use the raw data if validation fails
             plan_json = plan_data
 
-        # Convert to Markdown
-        plan_markdown = plan_to_markdown(plan_json)
+        # Convert to Markdown (cached so /draft/markdown re-renders are free)
+        etag = plan_etag(plan_json)
+        plan_markdown = plan_to_markdown(plan_json, now_iso)
+        _store_cached_markdown(etag, plan_markdown)
 
         logger.info(
             f"Draft generated successfully for '{request.project_name}' "
@@ -385,11 +407,14 @@ For any missing or unclear information, flag it with low confidence and create a
             f"{len(plan_json.get('asana_todos', []))} action items)"
         )
 
-        return DraftResponse(
-            plan_json=plan_json,
-            plan_markdown=plan_markdown,
-            session_id=request.session_id,
-            generated_at=datetime.utcnow(),
+        return ORJSONResponse(
+            content={
+                "plan_json": plan_json,
+                "plan_markdown": plan_markdown,
+                "session_id": request.session_id,
+                "generated_at": now,
+            },
+            headers={"ETag": etag},
         )
 
     except HTTPException:
@@ -399,3 +424,29 @@ For any missing or unclear information, flag it with low confidence and create a
         raise HTTPException(
             status_code=500, detail=f"Failed to generate draft: {str(e)}"
         )
+
+
+@router.post("/draft/markdown")
+async def stream_draft_markdown(plan_json: dict):
+    """
+    Render a Strategic Build Plan JSON as Markdown, streamed in chunks
+
+    Drafts are not stored server-side, so the client posts the `plan_json`
+    it received from /api/draft (or an edited copy). The first section is
+    sent as soon as it's rendered instead of after the whole document.
+
+    Responses carry the plan's ETag (the same one /api/draft returns).
+    Recently rendered plans that carry generated_at are served from an
+    in-memory cache.
+    """
+    etag = plan_etag(plan_json)
+    media_type = "text/markdown; charset=utf-8"
+    markdown = _get_cached_markdown(etag) if _markdown_cacheable(plan_json) else None
+    if markdown is not None:
+        return Response(markdown, media_type=media_type, headers={"ETag": etag})
+
+    return StreamingResponse(
+        _stream_and_cache_markdown(plan_json, etag),
+        media_type=media_type,
+        headers={"ETag": etag},
+    )
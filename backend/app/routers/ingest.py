@@ -2,23 +2,28 @@
 Ingest Router - Document Upload and Vector Store Creation
 """
 
+import io
+import asyncio
 import logging
 import uuid
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.services.openai_service import OpenAIService
 from app.services.document_processor import DocumentProcessor
-from app.models.responses import IngestResponse, FileUploadResponse, ErrorResponse
+from app.models.responses import IngestResponse, ErrorResponse
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# Files are uploaded to OpenAI in parallel, at most this many at a time
+INGEST_MAX_CONCURRENT_UPLOADS = 5
 
-@router.post("/ingest", response_model=IngestResponse)
+
+@router.post("/ingest", responses={200: {"model": IngestResponse}})
 async def ingest_documents(
     project_name: str = Form(
         ..., description="Project name for this Strategic Build Plan"
@@ -55,17 +60,24 @@ async def ingest_documents(
         # Generate session ID
         session_id = f"session_{uuid.uuid4().hex[:12]}"
 
-        # Process files
-        file_responses: List[FileUploadResponse] = []
-        uploaded_file_ids: List[str] = []
-        successful = 0
-        failed = 0
+        # Process files concurrently, capping simultaneous OpenAI uploads
+        upload_sem = asyncio.Semaphore(INGEST_MAX_CONCURRENT_UPLOADS)
 
-        for upload_file in files:
+        async def _process_one(
+            upload_file: UploadFile,
+        ) -> Tuple[Dict[str, Any], Optional[str]]:
+            """Validate, extract and upload one file; returns (response, file_id)"""
+            file_size = 0
             try:
-                # Read file content
-                content = await upload_file.read()
-                file_size = len(content)
+                # Work on the spooled temp file Starlette already wrote the
+                # upload to (in memory up to 1 MB, on disk beyond) instead
+                # of copying the whole body into a bytes object
+                file_obj = upload_file.file
+                file_size = upload_file.size
+                if file_size is None:
+                    file_obj.seek(0, io.SEEK_END)
+                    file_size = file_obj.tell()
+                    file_obj.seek(0)
 
                 # Validate file
                 is_valid, error_msg = doc_processor.validate_file(
@@ -76,59 +88,65 @@ async def ingest_documents(
                     logger.warning(
                         f"File validation failed: {upload_file.filename} - {error_msg}"
                     )
-                    file_responses.append(
-                        FileUploadResponse(
-                            filename=upload_file.filename,
-                            file_id="",
-                            size_bytes=file_size,
-                            error=error_msg,
-                        )
+                    return (
+                        {
+                            "filename": upload_file.filename,
+                            "file_id": "",
+                            "size_bytes": file_size,
+                            "char_count": None,
+                            "word_count": None,
+                            "error": error_msg,
+                        },
+                        None,
                     )
-                    failed += 1
-                    continue
 
                 # Process document to extract text (for metadata)
-                import io
-
-                file_obj = io.BytesIO(content)
                 processed = await doc_processor.process_file(
                     file_obj, upload_file.filename
                 )
 
                 # Upload to OpenAI
                 file_obj.seek(0)
-                file_id = await openai_service.upload_file(
-                    file=file_obj, filename=upload_file.filename
-                )
-
-                uploaded_file_ids.append(file_id)
-
-                file_responses.append(
-                    FileUploadResponse(
-                        filename=upload_file.filename,
-                        file_id=file_id,
-                        size_bytes=file_size,
-                        char_count=processed.get("char_count"),
-                        word_count=processed.get("word_count"),
+                async with upload_sem:
+                    file_id = await openai_service.upload_file(
+                        file=file_obj, filename=upload_file.filename
                     )
-                )
 
-                successful += 1
                 logger.info(
                     f"Successfully processed: {upload_file.filename} ({file_size} bytes)"
                 )
+                return (
+                    {
+                        "filename": upload_file.filename,
+                        "file_id": file_id,
+                        "size_bytes": file_size,
+                        "char_count": processed.get("char_count"),
+                        "word_count": processed.get("word_count"),
+                        "error": None,
+                    },
+                    file_id,
+                )
 
             except Exception as e:
                 logger.error(f"Error processing {upload_file.filename}: {str(e)}")
-                file_responses.append(
-                    FileUploadResponse(
-                        filename=upload_file.filename,
-                        file_id="",
-                        size_bytes=len(content) if "content" in locals() else 0,
-                        error=str(e),
-                    )
+                return (
+                    {
+                        "filename": upload_file.filename,
+                        "file_id": "",
+                        "size_bytes": file_size,
+                        "char_count": None,
+                        "word_count": None,
+                        "error": str(e),
+                    },
+                    None,
                 )
-                failed += 1
+
+        results = await asyncio.gather(*(_process_one(f) for f in files))
+
+        file_responses: List[Dict[str, Any]] = [resp for resp, _ in results]
+        uploaded_file_ids: List[str] = [fid for _, fid in results if fid]
+        successful = len(uploaded_file_ids)
+        failed = len(results) - successful
 
         # Check if any files were successfully uploaded
         if not uploaded_file_ids:
@@ -153,15 +171,20 @@ async def ingest_documents(
             f"Vector Store: {vector_store.id}"
         )
 
-        return IngestResponse(
-            session_id=session_id,
-            vector_store_id=vector_store.id,
-            project_name=project_name,
-            files_processed=file_responses,
-            total_files=len(files),
-            successful_uploads=successful,
-            failed_uploads=failed,
-            expires_at=expires_at,
+        # Built from plain dicts and serialized by orjson in one pass; the
+        # IngestResponse schema is still advertised via `responses=`
+        return ORJSONResponse(
+            content={
+                "session_id": session_id,
+                "vector_store_id": vector_store.id,
+                "project_name": project_name,
+                "files_processed": file_responses,
+                "total_files": len(files),
+                "successful_uploads": successful,
+                "failed_uploads": failed,
+                "created_at": datetime.utcnow(),
+                "expires_at": expires_at,
+            }
         )
 
     except HTTPException:
@@ -3,7 +3,7 @@ Lessons Learned Router - Extract insights from historical Confluence pages
 """
 
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, Field
 
 from app.services.lessons_service import LessonsService
@@ -98,8 +98,13 @@ class LessonsExtractResponse(BaseModel):
 # ============================================================================
 
 
-@router.post("/extract", response_model=LessonsExtractResponse)
-async def extract_lessons(request: LessonsExtractRequest) -> LessonsExtractResponse:
+def _page_ref(page: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Trim a service page dict down to the PageReference fields"""
+    return {"id": page["id"], "title": page["title"]} if page else None
+
+
+@router.post("/extract", responses={200: {"model": LessonsExtractResponse}})
+async def extract_lessons(request: LessonsExtractRequest) -> Response:
     """
     Extract lessons learned from historical Confluence pages.
 
@@ -135,36 +140,33 @@ async def extract_lessons(request: LessonsExtractRequest) -> LessonsExtractRespo
             max_siblings=request.max_siblings,
         )
 
-        # Convert to response model
-        return LessonsExtractResponse(
-            insights=[
-                LessonInsight(
-                    id=i.get("id", f"insight_{idx}"),
-                    category=i.get("category", "Best Practice"),
-                    title=i.get("title", "Untitled"),
-                    description=i.get("description", ""),
-                    recommendation=i.get("recommendation", ""),
-                    source_excerpt=i.get("source_excerpt"),
-                    relevance_score=i.get("relevance_score", 0.5),
-                )
-                for idx, i in enumerate(result.get("insights", []))
-            ],
-            sibling_pages_analyzed=[
-                PageReference(id=p["id"], title=p["title"])
-                for p in result.get("sibling_pages_analyzed", [])
-            ],
-            family_page=(
-                PageReference(**result["family_page"])
-                if result.get("family_page")
-                else None
-            ),
-            customer_page=(
-                PageReference(**result["customer_page"])
-                if result.get("customer_page")
-                else None
-            ),
-            skipped=result.get("skipped", False),
-            skip_reason=result.get("skip_reason"),
+        # Fill defaults on the service's plain dicts, validate the whole
+        # response once, and serialize it straight from pydantic-core
+        response = LessonsExtractResponse.model_validate(
+            {
+                "insights": [
+                    {
+                        "id": i.get("id", f"insight_{idx}"),
+                        "category": i.get("category", "Best Practice"),
+                        "title": i.get("title", "Untitled"),
+                        "description": i.get("description", ""),
+                        "recommendation": i.get("recommendation", ""),
+                        "source_excerpt": i.get("source_excerpt"),
+                        "relevance_score": i.get("relevance_score", 0.5),
+                    }
+                    for idx, i in enumerate(result.get("insights", []))
+                ],
+                "sibling_pages_analyzed": [
+                    _page_ref(p) for p in result.get("sibling_pages_analyzed", [])
+                ],
+                "family_page": _page_ref(result.get("family_page")),
+                "customer_page": _page_ref(result.get("customer_page")),
+                "skipped": result.get("skipped", False),
+                "skip_reason": result.get("skip_reason"),
+            }
+        )
+        return Response(
+            content=response.model_dump_json(), media_type="application/json"
         )
 
     except ValueError as e:
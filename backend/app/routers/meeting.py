@@ -2,22 +2,91 @@
 Meeting Router - Process Meeting Transcripts and Apply to Strategic Build Plans
 """
 
+import asyncio
+import codecs
+import hashlib
 import logging
-import json
+import re
 from datetime import datetime
-from typing import List
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from openai import OpenAI
+from typing import Iterator, List, Optional
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, UploadFile, File, Form
+from fastapi.responses import ORJSONResponse
 import os
 
-from app.models.responses import MeetingApplyRequest, MeetingApplyResponse
+from app.models.responses import (
+    MeetingApplyRequest,
+    MeetingApplyResponse,
+    MeetingBatchApplyRequest,
+)
 from app.models.plan_schema import StrategicBuildPlan
-from app.prompts.draft_prompt import MEETING_SYSTEM_PROMPT
-from app.routers.draft import plan_to_markdown
+from app.prompts.draft_prompt import MEETING_SYSTEM_PROMPT, MEETING_CHUNK_SYSTEM_PROMPT
+from app.routers.draft import plan_to_markdown_cached
+from app.services.openai_service import (
+    collect_chat_stream,
+    get_async_openai_client,
+    openai_chat_semaphore,
+)
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Model resolved once at import; the shared client is built on first use
+PLAN_MODEL = os.getenv("OPENAI_MODEL_PLAN", "gpt-4o-2024-08-06")
+# Cheaper model used to condense the parts of very long transcripts
+SUMMARY_MODEL = os.getenv("OPENAI_MODEL_SUMMARY", "gpt-4o-mini")
+
+# Built once; an unchanging first message keeps the prompt prefix cacheable
+MEETING_SYSTEM_MESSAGE = {"role": "system", "content": MEETING_SYSTEM_PROMPT}
+MEETING_CHUNK_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": MEETING_CHUNK_SYSTEM_PROMPT,
+}
+
+# Transcripts shorter than this (after stripping) can't carry a decision
+# or action item worth a model call
+MIN_TRANSCRIPT_CHARS = 40
+
+# Transcript uploads are read and decoded in chunks of this many bytes
+TRANSCRIPT_READ_CHUNK = 64 * 1024
+# Largest accepted transcript upload; beyond this it won't fit the model context
+MAX_TRANSCRIPT_BYTES = 1024 * 1024
+
+# Transcripts estimated above this many tokens are condensed part by part
+# (map) before the merge call (reduce), so plan + transcript + output fit
+TRANSCRIPT_CHUNK_THRESHOLD_TOKENS = 12000
+TRANSCRIPT_CHUNK_CHARS = 10000
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Plan sections reported as "Updated ..." when the merge changes them
+TRACKED_SECTIONS = (
+    "keys_to_project",
+    "quality_plan",
+    "purchasing",
+    "build_strategy",
+    "execution_strategy",
+)
+
+
+def _section_fingerprint(section) -> bytes:
+    """Content hash of a plan section's canonical JSON encoding"""
+    section_bytes = orjson.dumps(section, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(section_bytes, digest_size=16).digest()
+
+
+def _section_changed(old_section, new_section) -> bool:
+    """Whether a plan section differs, hashing only when its shape matches"""
+    # Merges usually add keys or list entries, which these checks catch
+    # without encoding either side
+    if type(old_section) is not type(new_section):
+        return True
+    if isinstance(old_section, dict) and old_section.keys() != new_section.keys():
+        return True
+    if isinstance(old_section, list) and len(old_section) != len(new_section):
+        return True
+    return _section_fingerprint(old_section) != _section_fingerprint(new_section)
 
 
 def count_action_items(plan: dict) -> int:
@@ -32,8 +101,104 @@ def count_notes(plan: dict) -> int:
     return apqp + meeting
 
 
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English)"""
+    return len(text) // 4
+
+
+def _transcript_pieces(transcript: str) -> Iterator[str]:
+    """
+    Break a transcript into pieces of at most TRANSCRIPT_CHUNK_CHARS
+
+    Splits on sentence ends first; a piece that is still too long (exports
+    without punctuation, one "Speaker: text" line each) is split on line
+    breaks, and anything beyond that is sliced hard. Each piece keeps its
+    separator so joining them restores the layout.
+    """
+    for sentence in _SENTENCE_END.split(transcript):
+        if len(sentence) <= TRANSCRIPT_CHUNK_CHARS:
+            yield sentence + " "
+            continue
+        for line in sentence.splitlines():
+            if len(line) <= TRANSCRIPT_CHUNK_CHARS:
+                yield line + "\n"
+                continue
+            for start in range(0, len(line), TRANSCRIPT_CHUNK_CHARS):
+                yield line[start : start + TRANSCRIPT_CHUNK_CHARS]
+
+
+def _split_transcript(transcript: str) -> List[str]:
+    """Split a transcript into parts of at most ~TRANSCRIPT_CHUNK_CHARS"""
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for piece in _transcript_pieces(transcript):
+        if current and current_len + len(piece) > TRANSCRIPT_CHUNK_CHARS:
+            chunks.append("".join(current).strip())
+            current = []
+            current_len = 0
+        current.append(piece)
+        current_len += len(piece)
+    if current:
+        chunks.append("".join(current).strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+async def _summarize_chunk(chunk: str, part: int, total: int) -> str:
+    """Extract decisions, actions and questions from one transcript part"""
+    async with openai_chat_semaphore:
+        stream = await get_async_openai_client().chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=[
+                MEETING_CHUNK_SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": f"**Transcript part {part} of {total}:**\n{chunk}",
+                },
+            ],
+            response_format={"type": "json_object"},
+            max_tokens=2000,
+            stream=True,
+        )
+        return await collect_chat_stream(stream)
+
+
+async def _condense_transcript(transcript: str) -> str:
+    """Map step: condense each part concurrently, then label the results in order"""
+    chunks = _split_transcript(transcript)
+    logger.info(
+        f"Transcript too long for one pass (~{_estimate_tokens(transcript)} tokens); "
+        f"condensing {len(chunks)} parts with {SUMMARY_MODEL}"
+    )
+    summaries = await asyncio.gather(
+        *(
+            _summarize_chunk(chunk, part, len(chunks))
+            for part, chunk in enumerate(chunks, start=1)
+        )
+    )
+    return "\n\n".join(
+        f"Part {part} of {len(chunks)}:\n{summary}"
+        for part, summary in enumerate(summaries, start=1)
+    )
+
+
+def _plan_markdown(
+    plan: dict, include_markdown: bool, background_tasks: Optional[BackgroundTasks]
+) -> str:
+    """Render the response Markdown, or defer it past the response if not wanted"""
+    if include_markdown or background_tasks is None:
+        return plan_to_markdown_cached(plan)
+    # Still render once the response is sent, so /draft/markdown hits the cache
+    background_tasks.add_task(plan_to_markdown_cached, plan)
+    return ""
+
+
 @router.post("/apply", response_model=MeetingApplyResponse)
-async def apply_meeting_transcript(request: MeetingApplyRequest):
+async def apply_meeting_transcript(
+    request: MeetingApplyRequest,
+    background_tasks: BackgroundTasks = None,
+    include_markdown: bool = True,
+):
     """
     Apply a meeting transcript to an existing Strategic Build Plan
 
@@ -57,6 +222,11 @@ async def apply_meeting_transcript(request: MeetingApplyRequest):
     - `internal` - Internal team meetings (goes to apqp_notes)
     - `kickoff` - Project kickoff (both notes + keys_to_project)
     - `review` - Design/quality review (quality_plan updates)
+
+    **Query Parameters:**
+    - `include_markdown` - Set `false` to skip rendering `plan_markdown` in the
+      response (it comes back empty). The Markdown is then rendered after the
+      response is sent, so a later `/api/draft/markdown` call is a cache hit.
     """
     try:
         logger.info(
@@ -65,10 +235,41 @@ async def apply_meeting_transcript(request: MeetingApplyRequest):
             f"transcript_length={len(request.transcript)} chars"
         )
 
+        # Nothing to extract from an empty or near-empty transcript
+        transcript = request.transcript.strip()
+        if len(transcript) < MIN_TRANSCRIPT_CHARS or not any(
+            c.isalpha() for c in transcript
+        ):
+            logger.info("Transcript too short to process; returning plan unchanged")
+            return MeetingApplyResponse(
+                plan_json=request.plan_json,
+                plan_markdown=_plan_markdown(
+                    request.plan_json, include_markdown, background_tasks
+                ),
+                changes_summary=["Transcript too short to extract changes"],
+                new_action_items=0,
+                new_notes=0,
+                applied_at=datetime.utcnow(),
+            )
+
         # Get initial counts for comparison
         initial_action_items = count_action_items(request.plan_json)
         initial_notes = count_notes(request.plan_json)
 
+        # Compact JSON: indentation would add ~20% input tokens for nothing
+        plan_text = orjson.dumps(request.plan_json, default=str).decode()
+
+        # Long transcripts are condensed part by part before the merge call
+        if _estimate_tokens(request.transcript) > TRANSCRIPT_CHUNK_THRESHOLD_TOKENS:
+            transcript_heading = (
+                "Meeting Transcript (condensed from a long transcript, "
+                "in order of discussion)"
+            )
+            transcript_text = await _condense_transcript(request.transcript)
+        else:
+            transcript_heading = "Meeting Transcript"
+            transcript_text = request.transcript
+
         # Build the user prompt
         attendee_info = ""
         if request.attendees:
@@ -82,12 +283,12 @@ async def apply_meeting_transcript(request: MeetingApplyRequest):
 
 **Current Plan:**
 ```json
-{json.dumps(request.plan_json, indent=2, default=str)}
+{plan_text}
 ```
 {date_info}{attendee_info}
 
-**Meeting Transcript:**
-{request.transcript}
+**{transcript_heading}:**
+{transcript_text}
 
 **Instructions:**
 1. Extract all decisions, action items, requirements, and clarifications
@@ -104,26 +305,28 @@ Return the complete updated StrategicBuildPlan JSON.
 """
 
         # Call OpenAI
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        model = os.getenv("OPENAI_MODEL_PLAN", "gpt-4o-2024-08-06")
-
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": MEETING_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-            max_tokens=16000,
-        )
+        async with openai_chat_semaphore:
+            stream = await get_async_openai_client().chat.completions.create(
+                model=PLAN_MODEL,
+                messages=[
+                    MEETING_SYSTEM_MESSAGE,
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=16000,
+                stream=True,
+            )
+            content = await collect_chat_stream(stream)
 
         # Parse the response
-        updated_plan_data = json.loads(response.choices[0].message.content)
+        updated_plan_data = orjson.loads(content)
 
         # Validate and enhance plan data
         try:
-            validated_plan = StrategicBuildPlan(**updated_plan_data)
-            plan_json = validated_plan.model_dump(mode="json")
+            validated_plan = StrategicBuildPlan.model_validate(updated_plan_data)
+            # Round-trip through pydantic-core's JSON encoder rather than
+            # model_dump(mode="json") walking the nested plan in Python
+            plan_json = orjson.loads(validated_plan.model_dump_json())
         except Exception as validation_error:
             logger.warning(f"Plan validation warning: {validation_error}")
             plan_json = updated_plan_data
@@ -143,23 +346,17 @@ Return the complete updated StrategicBuildPlan JSON.
             changes_summary.append(f"Added {new_notes} new meeting note(s)")
 
         # Check for section updates
-        for section in [
-            "keys_to_project",
-            "quality_plan",
-            "purchasing",
-            "build_strategy",
-            "execution_strategy",
-        ]:
-            old_section = request.plan_json.get(section, {})
-            new_section = plan_json.get(section, {})
-            if old_section != new_section:
+        for section in TRACKED_SECTIONS:
+            if _section_changed(
+                request.plan_json.get(section, {}), plan_json.get(section, {})
+            ):
                 changes_summary.append(f"Updated {section.replace('_', ' ')}")
 
         if not changes_summary:
             changes_summary.append("No significant changes detected")
 
         # Convert to Markdown
-        plan_markdown = plan_to_markdown(plan_json)
+        plan_markdown = _plan_markdown(plan_json, include_markdown, background_tasks)
 
         logger.info(
             f"Meeting transcript processed: "
@@ -184,6 +381,23 @@ Return the complete updated StrategicBuildPlan JSON.
         )
 
 
+async def _read_transcript(upload_file: UploadFile) -> str:
+    """Decode an uploaded transcript chunk by chunk, enforcing the size cap"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts: List[str] = []
+    total = 0
+    while chunk := await upload_file.read(TRANSCRIPT_READ_CHUNK):
+        total += len(chunk)
+        if total > MAX_TRANSCRIPT_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Transcript exceeds {MAX_TRANSCRIPT_BYTES // 1024} KB limit",
+            )
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
 @router.post("/upload", response_model=MeetingApplyResponse)
 async def upload_and_apply_transcript(
     plan_json: str = Form(..., description="Current plan as JSON string"),
@@ -206,16 +420,14 @@ async def upload_and_apply_transcript(
                 status_code=400, detail="Only .txt and .md files are supported"
             )
 
-        # Read transcript
-        content = await transcript_file.read()
-        transcript = content.decode("utf-8")
-
         # Parse plan JSON
         try:
-            plan_data = json.loads(plan_json)
-        except json.JSONDecodeError as e:
+            plan_data = orjson.loads(plan_json)
+        except orjson.JSONDecodeError as e:
             raise HTTPException(status_code=400, detail=f"Invalid plan_json: {str(e)}")
 
+        transcript = await _read_transcript(transcript_file)
+
         # Parse attendees
         attendees_list = None
         if attendees:
@@ -239,3 +451,34 @@ async def upload_and_apply_transcript(
         raise HTTPException(
             status_code=500, detail=f"Failed to process transcript file: {str(e)}"
         )
+
+
+@router.post("/apply/batch")
+async def apply_meeting_transcripts_batch(request: MeetingBatchApplyRequest):
+    """
+    Apply several meeting transcripts in one call
+
+    Each item is an independent transcript/plan pair. Items are processed
+    concurrently and share the process-wide OpenAI concurrency limit.
+
+    Returns one entry per requested item, in order. Failed items carry an
+    `error` field instead of failing the whole batch.
+    """
+    results = await asyncio.gather(
+        *(apply_meeting_transcript(item) for item in request.items),
+        return_exceptions=True,
+    )
+
+    return {
+        "results": [
+            (
+                {
+                    "project_name": item.plan_json.get("project_name"),
+                    "error": getattr(result, "detail", str(result)),
+                }
+                if isinstance(result, Exception)
+                else result
+            )
+            for item, result in zip(request.items, results)
+        ]
+    }
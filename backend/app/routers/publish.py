@@ -2,20 +2,51 @@
 Publish Router - Confluence Publishing for Strategic Build Plans
 """
 
+import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
-from app.services.confluence import ConfluenceService
+from app.services.confluence import ConfluenceService, get_confluence_service
 from app.models.responses import PublishRequest, PublishResponse, ErrorResponse
+from app.routers.draft import plan_etag
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Rendered Confluence storage by plan ETag, most recently used last; a plan
+# is often published and then re-published unchanged
+STORAGE_CACHE_SIZE = 64
+_storage_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+async def _plan_to_storage_cached(confluence: ConfluenceService, plan: dict) -> str:
+    """
+    plan_to_confluence_storage memoized on the plan's content hash
+
+    The cache is only touched on the event loop; a miss renders the plan in
+    a worker thread.
+    """
+    etag = plan_etag(plan)
+    storage = _storage_cache.get(etag)
+    if storage is not None:
+        _storage_cache.move_to_end(etag)
+        return storage
+    storage = await asyncio.to_thread(confluence.plan_to_confluence_storage, plan)
+    _storage_cache[etag] = storage
+    _storage_cache.move_to_end(etag)
+    if len(_storage_cache) > STORAGE_CACHE_SIZE:
+        _storage_cache.popitem(last=False)
+    return storage
+
 
 @router.post("/publish", response_model=PublishResponse)
-async def publish_to_confluence(request: PublishRequest):
+async def publish_to_confluence(
+    request: PublishRequest,
+    confluence: ConfluenceService = Depends(get_confluence_service),
+):
     """
     Publish a Strategic Build Plan to Confluence
 
@@ -44,12 +75,11 @@ async def publish_to_confluence(request: PublishRequest):
             f"family: {request.family_of_parts}"
         )
 
-        # Initialize Confluence service
-        confluence = ConfluenceService()
-
-        # Find parent page (Family of Parts)
-        parent_page = await confluence.find_family_of_parts_page(
-            request.family_of_parts
+        # Find parent page (Family of Parts) while the plan is converted to
+        # Confluence storage format in a worker thread
+        parent_page, plan_content = await asyncio.gather(
+            confluence.find_family_of_parts_page(request.family_of_parts),
+            _plan_to_storage_cached(confluence, request.plan_json),
         )
 
         parent_id = None
@@ -67,16 +97,33 @@ async def publish_to_confluence(request: PublishRequest):
             parent_id = request.parent_page_id
             logger.info(f"Using explicitly provided parent_page_id: {parent_id}")
 
-        # Convert plan to Confluence storage format
-        plan_content = confluence.plan_to_confluence_storage(request.plan_json)
-
         # Generate page title
         page_title = f"Strategic Build Plan - {request.project_name}"
 
         # Create the page
-        result = await confluence.create_page(
-            title=page_title, content=plan_content, parent_id=parent_id
-        )
+        try:
+            result = await confluence.create_page(
+                title=page_title, content=plan_content, parent_id=parent_id
+            )
+        except Exception:
+            # An auto-detected parent may come from the service's lookup cache
+            # and have been moved or deleted since; look it up fresh, retry once
+            if not parent_page or request.parent_page_id:
+                raise
+            confluence.invalidate_family_page(request.family_of_parts)
+            fresh_parent = await confluence.find_family_of_parts_page(
+                request.family_of_parts
+            )
+            fresh_parent_id = fresh_parent["id"] if fresh_parent else None
+            if fresh_parent_id == parent_id:
+                raise
+            logger.warning(
+                f"Cached parent page {parent_id} is stale; "
+                f"retrying under {fresh_parent_id}"
+            )
+            result = await confluence.create_page(
+                title=page_title, content=plan_content, parent_id=fresh_parent_id
+            )
 
         logger.info(
             f"Successfully published to Confluence: {result['title']} "
@@ -104,7 +151,11 @@ async def publish_to_confluence(request: PublishRequest):
 
 
 @router.put("/publish/{page_id}", response_model=PublishResponse)
-async def update_confluence_page(page_id: str, request: PublishRequest):
+async def update_confluence_page(
+    page_id: str,
+    request: PublishRequest,
+    confluence: ConfluenceService = Depends(get_confluence_service),
+):
     """
     Update an existing Strategic Build Plan page in Confluence
 
@@ -120,11 +171,8 @@ async def update_confluence_page(page_id: str, request: PublishRequest):
     try:
         logger.info(f"Updating Confluence page: {page_id}")
 
-        # Initialize Confluence service
-        confluence = ConfluenceService()
-
         # Convert plan to Confluence storage format
-        plan_content = confluence.plan_to_confluence_storage(request.plan_json)
+        plan_content = await _plan_to_storage_cached(confluence, request.plan_json)
 
         # Generate page title
         page_title = f"Strategic Build Plan - {request.project_name}"
@@ -159,7 +207,11 @@ async def update_confluence_page(page_id: str, request: PublishRequest):
 
 
 @router.get("/publish/search")
-async def search_confluence_pages(query: str, limit: int = 10):
+async def search_confluence_pages(
+    query: str,
+    limit: int = 10,
+    confluence: ConfluenceService = Depends(get_confluence_service),
+):
     """
     Search Confluence pages using CQL
 
@@ -172,7 +224,6 @@ async def search_confluence_pages(query: str, limit: int = 10):
     List of matching pages with id, title, url
     """
     try:
-        confluence = ConfluenceService()
         pages = await confluence.search_pages(query, limit=limit)
 
         return {"query": query, "count": len(pages), "pages": pages}
@@ -185,7 +236,10 @@ async def search_confluence_pages(query: str, limit: int = 10):
 
 
 @router.post("/publish/checklist", response_model=PublishResponse)
-async def publish_checklist_to_confluence(request: dict):
+async def publish_checklist_to_confluence(
+    request: dict,
+    confluence: ConfluenceService = Depends(get_confluence_service),
+):
     """
     Publish a Pre-Meeting Checklist to Confluence
 
@@ -205,9 +259,6 @@ async def publish_checklist_to_confluence(request: dict):
         project_name = checklist.get("project_name", "Unknown Project")
         logger.info(f"Publishing checklist to Confluence: {project_name}")
 
-        # Initialize Confluence service
-        confluence = ConfluenceService()
-
         # Convert checklist to Confluence storage format
         checklist_content = confluence.checklist_to_confluence_storage(checklist)
 
@@ -2,33 +2,201 @@
 QA Router - Quality Assurance Grading for Strategic Build Plans
 """
 
+import asyncio
+import bisect
 import logging
-import json
 import os
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
-from openai import OpenAI
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from openai import NotFoundError
+from openai.types import Batch
 
-from app.models.responses import QAGradeRequest, QAGradeResponse, DimensionScores
-from app.prompts.qa_prompt import QA_SYSTEM_PROMPT
+from app.models.responses import (
+    QAGradeRequest,
+    QAGradeResponse,
+    QABatchGradeRequest,
+    QABatchJobRequest,
+    QABatchJobResponse,
+    DimensionScores,
+)
+from app.prompts.qa_prompt import QA_SYSTEM_PROMPT, QA_BATCH_SYSTEM_PROMPT
+from app.services.openai_service import (
+    collect_chat_stream,
+    get_async_openai_client,
+    openai_chat_semaphore,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Model resolved once at import; the shared client is built on first use
+PLAN_MODEL = os.getenv("OPENAI_MODEL_PLAN", "gpt-4o-2024-08-06")
+
+# Constant system messages, built once and shared by every request; keeping
+# them as the identical leading message also lets OpenAI's automatic prompt
+# caching reuse the rubric prefix across calls
+QA_SYSTEM_MESSAGE = {"role": "system", "content": QA_SYSTEM_PROMPT}
+QA_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": QA_BATCH_SYSTEM_PROMPT}
+
+# Tags Batch API jobs created by this router, so polling only reads our own
+QA_BATCH_JOB_KIND = "qa_grade"
+
+# Grade returned for a plan with no content, without asking the model
+EMPTY_PLAN_GRADE = {
+    "overall_score": 0,
+    "dimension_scores": {
+        "completeness": 0,
+        "specificity": 0,
+        "actionability": 0,
+        "manufacturability": 0,
+        "risk_coverage": 0,
+    },
+    "critical_gaps": ["Plan is empty - no sections have been filled in"],
+}
+
+# Plans graded per completion in /grade/batch; keeps each reply within max_tokens
+QA_BATCH_MAX_PLANS = 4
+
+
+# Lower bounds of each grade band above "Incomplete", ascending
+GRADE_THRESHOLDS = (60, 70, 80, 90)
+GRADE_LABELS = ("Incomplete", "Needs Work", "Acceptable", "Good", "Excellent")
+
 
 def get_grade_label(score: int) -> str:
     """Convert numeric score to grade label"""
-    if score >= 90:
-        return "Excellent"
-    elif score >= 80:
-        return "Good"
-    elif score >= 70:
-        return "Acceptable"
-    elif score >= 60:
-        return "Needs Work"
-    else:
-        return "Incomplete"
+    return GRADE_LABELS[bisect.bisect_right(GRADE_THRESHOLDS, score)]
+
+
+def _grade_user_prompt(plan_json: Dict[str, Any]) -> str:
+    """Build the user message asking the model to grade one plan"""
+    # Compact JSON keeps the plan's input-token cost down
+    plan_text = orjson.dumps(plan_json, default=str).decode()
+
+    return f"""Grade the following Strategic Build Plan according to the rubric.
+
+**Plan to Grade:**
+```json
+{plan_text}
+```
+
+Evaluate each dimension carefully and provide:
+1. Scores for each of the 5 dimensions (0-20 each)
+2. 2-3 specific strengths
+3. 3-5 actionable improvement suggestions
+4. Any critical gaps that block execution
+
+Return your analysis as JSON matching the specified format.
+"""
+
+
+async def _request_grade(plan_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Ask the model to grade one plan; returns the raw grade object"""
+    user_prompt = _grade_user_prompt(plan_json)
+
+    # Call OpenAI
+    async with openai_chat_semaphore:
+        stream = await get_async_openai_client().chat.completions.create(
+            model=PLAN_MODEL,
+            messages=[
+                QA_SYSTEM_MESSAGE,
+                {"role": "user", "content": user_prompt},
+            ],
+            response_format={"type": "json_object"},
+            max_tokens=4000,
+            stream=True,
+        )
+        content = await collect_chat_stream(stream)
+
+    # Parse the response
+    return orjson.loads(content)
+
+
+async def _request_grade_batch(
+    indexed_plans: List[Tuple[int, Dict[str, Any]]],
+) -> Dict[int, Dict[str, Any]]:
+    """Grade several plans in one completion; returns grade objects by index"""
+    plans_text = orjson.dumps(
+        [{"index": idx, "plan": plan} for idx, plan in indexed_plans],
+        default=str,
+    ).decode()
+
+    user_prompt = f"""Grade each of the following {len(indexed_plans)} Strategic Build Plans according to the rubric.
+
+**Plans to Grade:**
+```json
+{plans_text}
+```
+
+Return one result per plan, each with its index, as JSON matching the batch format.
+"""
+
+    async with openai_chat_semaphore:
+        stream = await get_async_openai_client().chat.completions.create(
+            model=PLAN_MODEL,
+            messages=[
+                QA_BATCH_SYSTEM_MESSAGE,
+                {"role": "user", "content": user_prompt},
+            ],
+            response_format={"type": "json_object"},
+            max_tokens=4000,
+            stream=True,
+        )
+        content = await collect_chat_stream(stream)
+
+    batch_data = orjson.loads(content)
+    return {
+        result["index"]: result
+        for result in batch_data.get("results", [])
+        if isinstance(result, dict) and isinstance(result.get("index"), int)
+    }
+
+
+def _build_grade_response(grade_data: Dict[str, Any]) -> QAGradeResponse:
+    """Fill defaults on a model grade object and derive the score and label"""
+    # Extract dimension scores
+    dim_scores = grade_data.get("dimension_scores", {})
+    dimension_scores = DimensionScores(
+        completeness=dim_scores.get("completeness", 10),
+        specificity=dim_scores.get("specificity", 10),
+        actionability=dim_scores.get("actionability", 10),
+        manufacturability=dim_scores.get("manufacturability", 10),
+        risk_coverage=dim_scores.get("risk_coverage", 10),
+    )
+
+    # Calculate overall score
+    overall_score = grade_data.get("overall_score")
+    if overall_score is None:
+        overall_score = (
+            dimension_scores.completeness
+            + dimension_scores.specificity
+            + dimension_scores.actionability
+            + dimension_scores.manufacturability
+            + dimension_scores.risk_coverage
+        )
+
+    # Get grade label
+    grade_label = grade_data.get("grade") or get_grade_label(overall_score)
+
+    logger.info(
+        f"Plan graded: {overall_score}/100 ({grade_label}) - "
+        f"C:{dimension_scores.completeness} S:{dimension_scores.specificity} "
+        f"A:{dimension_scores.actionability} M:{dimension_scores.manufacturability} "
+        f"R:{dimension_scores.risk_coverage}"
+    )
+
+    return QAGradeResponse(
+        overall_score=overall_score,
+        dimension_scores=dimension_scores,
+        grade=grade_label,
+        strengths=grade_data.get("strengths", []),
+        improvements=grade_data.get("improvements", []),
+        critical_gaps=grade_data.get("critical_gaps", []),
+        graded_at=datetime.utcnow(),
+    )
 
 
 @router.post("/grade", response_model=QAGradeResponse)
@@ -59,183 +227,304 @@ async def grade_plan(request: QAGradeRequest):
     try:
         logger.info(f"Grading plan: {request.plan_json.get('project_name', 'Unknown')}")
 
-        # Build user prompt
-        user_prompt = f"""Grade the following Strategic Build Plan according to the rubric.
-
-**Plan to Grade:**
-```json
-{json.dumps(request.plan_json, indent=2, default=str)}
-```
+        # A plan with no content can only score zero; skip the model call
+        if not any(request.plan_json.values()):
+            return _build_grade_response(EMPTY_PLAN_GRADE)
 
-Evaluate each dimension carefully and provide:
-1. Scores for each of the 5 dimensions (0-20 each)
-2. 2-3 specific strengths
-3. 3-5 actionable improvement suggestions
-4. Any critical gaps that block execution
+        grade_data = await _request_grade(request.plan_json)
+        return _build_grade_response(grade_data)
 
-Return your analysis as JSON matching the specified format.
-"""
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"QA grading failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to grade plan: {str(e)}")
 
-        # Call OpenAI
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        model = os.getenv("OPENAI_MODEL_PLAN", "gpt-4o-2024-08-06")
 
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": QA_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-            max_tokens=4000,
-        )
+@router.post("/grade/batch", response_model=List[QAGradeResponse])
+async def grade_plans_batch(request: QABatchGradeRequest):
+    """
+    Grade several Strategic Build Plans with as few LLM calls as possible
 
-        # Parse the response
-        grade_data = json.loads(response.choices[0].message.content)
-
-        # Extract dimension scores
-        dim_scores = grade_data.get("dimension_scores", {})
-        dimension_scores = DimensionScores(
-            completeness=dim_scores.get("completeness", 10),
-            specificity=dim_scores.get("specificity", 10),
-            actionability=dim_scores.get("actionability", 10),
-            manufacturability=dim_scores.get("manufacturability", 10),
-            risk_coverage=dim_scores.get("risk_coverage", 10),
-        )
+    Plans are packed up to `QA_BATCH_MAX_PLANS` per completion, and the
+    chunks are graded concurrently. Any plan the model leaves out of a
+    batch reply is re-graded on its own.
 
-        # Calculate overall score
-        overall_score = grade_data.get("overall_score")
-        if overall_score is None:
-            overall_score = (
-                dimension_scores.completeness
-                + dimension_scores.specificity
-                + dimension_scores.actionability
-                + dimension_scores.manufacturability
-                + dimension_scores.risk_coverage
-            )
+    Returns one grade per requested plan, in order.
+    """
+    try:
+        plans = [item.plan_json for item in request.items]
+        logger.info(f"Grading {len(plans)} plans in batch")
 
-        # Get grade label
-        grade_label = grade_data.get("grade") or get_grade_label(overall_score)
+        # Empty plans get the zero grade directly; the rest go to the model
+        grades: Dict[int, Dict[str, Any]] = {}
+        to_grade: List[Tuple[int, Dict[str, Any]]] = []
+        for idx, plan in enumerate(plans):
+            if any(plan.values()):
+                to_grade.append((idx, plan))
+            else:
+                grades[idx] = EMPTY_PLAN_GRADE
 
-        logger.info(
-            f"Plan graded: {overall_score}/100 ({grade_label}) - "
-            f"C:{dimension_scores.completeness} S:{dimension_scores.specificity} "
-            f"A:{dimension_scores.actionability} M:{dimension_scores.manufacturability} "
-            f"R:{dimension_scores.risk_coverage}"
+        chunk_grades = await asyncio.gather(
+            *(
+                _request_grade_batch(to_grade[start : start + QA_BATCH_MAX_PLANS])
+                for start in range(0, len(to_grade), QA_BATCH_MAX_PLANS)
+            )
         )
+        for chunk in chunk_grades:
+            grades.update(chunk)
 
-        return QAGradeResponse(
-            overall_score=overall_score,
-            dimension_scores=dimension_scores,
-            grade=grade_label,
-            strengths=grade_data.get("strengths", []),
-            improvements=grade_data.get("improvements", []),
-            critical_gaps=grade_data.get("critical_gaps", []),
-            graded_at=datetime.utcnow(),
-        )
+        missing = [idx for idx in range(len(plans)) if idx not in grades]
+        if missing:
+            logger.warning(f"Batch grading omitted plans {missing}; grading singly")
+            regraded = await asyncio.gather(
+                *(_request_grade(plans[idx]) for idx in missing)
+            )
+            grades.update(zip(missing, regraded))
+
+        return [_build_grade_response(grades[idx]) for idx in range(len(plans))]
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"QA grading failed: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to grade plan: {str(e)}")
+        logger.error(f"Batch QA grading failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to grade plans: {str(e)}")
 
 
-@router.get("/rubric")
-async def get_grading_rubric():
+def _batch_job_response(
+    batch: Batch,
+    results: Optional[Dict[str, QAGradeResponse]] = None,
+    errors: Optional[Dict[str, str]] = None,
+) -> QABatchJobResponse:
+    """Summarize a Batch API job for the client"""
+    counts = batch.request_counts
+    return QABatchJobResponse(
+        batch_id=batch.id,
+        status=batch.status,
+        total_plans=int((batch.metadata or {}).get("total_plans", 0)),
+        completed_plans=counts.completed if counts else 0,
+        failed_plans=counts.failed if counts else 0,
+        created_at=datetime.utcfromtimestamp(batch.created_at),
+        results=results or {},
+        errors=errors or {},
+    )
+
+
+async def _read_batch_file(file_id: str) -> List[Dict[str, Any]]:
+    """Download a Batch API output or error file as a list of records"""
+    content = await get_async_openai_client().files.content(file_id)
+    return [orjson.loads(line) for line in content.content.splitlines() if line]
+
+
+@router.post("/grade/batch-async", response_model=QABatchJobResponse)
+async def submit_grade_batch_job(request: QABatchJobRequest):
     """
-    Get the QA grading rubric
+    Queue plans for grading through the OpenAI Batch API
 
-    Returns the scoring criteria for each dimension to help
-    users understand how plans are evaluated.
+    Meant for non-interactive QA sweeps: grading is billed at the Batch
+    API's discounted rate and completes within 24 hours. Poll
+    `GET /grade/batch-async/{batch_id}` for progress; results are keyed by
+    each plan's index in `items`.
     """
-    return {
-        "total_points": 100,
-        "dimensions": {
-            "completeness": {
-                "max_points": 20,
-                "description": "Are all required sections filled with real data?",
-                "scoring": {
-                    "18-20": "All sections populated with multiple data points, no critical gaps",
-                    "14-17": "Most sections complete, minor gaps in non-critical areas",
-                    "10-13": "Several sections sparse or missing",
-                    "6-9": "Major sections empty or placeholder text",
-                    "0-5": "Majority of plan is empty or generic",
+    try:
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": str(idx),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": PLAN_MODEL,
+                        "messages": [
+                            QA_SYSTEM_MESSAGE,
+                            {
+                                "role": "user",
+                                "content": _grade_user_prompt(item.plan_json),
+                            },
+                        ],
+                        "response_format": {"type": "json_object"},
+                        "max_tokens": 4000,
+                    },
                 },
+                default=str,
+            )
+            for idx, item in enumerate(request.items)
+        ]
+
+        client = get_async_openai_client()
+        batch_file = await client.files.create(
+            file=("qa_grade_batch.jsonl", b"\n".join(lines)), purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata={"job": QA_BATCH_JOB_KIND, "total_plans": str(len(lines))},
+        )
+
+        logger.info(f"Queued {len(lines)} plans for batch grading: {batch.id}")
+        return _batch_job_response(batch)
+
+    except Exception as e:
+        logger.error(f"Batch job submission failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Failed to queue grading job: {str(e)}"
+        )
+
+
+@router.get("/grade/batch-async/{batch_id}", response_model=QABatchJobResponse)
+async def get_grade_batch_job(batch_id: str):
+    """
+    Check on a Batch API grading job
+
+    While the job runs only its status and counts are returned; once the
+    output is available, `results` holds one grade per finished plan and
+    `errors` the reason any plan failed.
+    """
+    try:
+        try:
+            batch = await get_async_openai_client().batches.retrieve(batch_id)
+        except NotFoundError:
+            batch = None
+        if batch is None or (batch.metadata or {}).get("job") != QA_BATCH_JOB_KIND:
+            raise HTTPException(
+                status_code=404, detail=f"Grading job not found: {batch_id}"
+            )
+
+        results: Dict[str, QAGradeResponse] = {}
+        errors: Dict[str, str] = {}
+
+        if batch.output_file_id:
+            for record in await _read_batch_file(batch.output_file_id):
+                custom_id = record["custom_id"]
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    errors[custom_id] = str(record.get("error") or response.get("body"))
+                    continue
+                try:
+                    content = response["body"]["choices"][0]["message"]["content"]
+                    results[custom_id] = _build_grade_response(orjson.loads(content))
+                except Exception as e:
+                    errors[custom_id] = f"Unreadable grade: {str(e)}"
+
+        if batch.error_file_id:
+            for record in await _read_batch_file(batch.error_file_id):
+                response = record.get("response") or {}
+                errors[record["custom_id"]] = str(
+                    record.get("error") or response.get("body")
+                )
+
+        return _batch_job_response(batch, results, errors)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch job lookup failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Failed to read grading job: {str(e)}"
+        )
+
+
+# The rubric never changes at runtime, so it is encoded once at import
+GRADING_RUBRIC = {
+    "total_points": 100,
+    "dimensions": {
+        "completeness": {
+            "max_points": 20,
+            "description": "Are all required sections filled with real data?",
+            "scoring": {
+                "18-20": "All sections populated with multiple data points, no critical gaps",
+                "14-17": "Most sections complete, minor gaps in non-critical areas",
+                "10-13": "Several sections sparse or missing",
+                "6-9": "Major sections empty or placeholder text",
+                "0-5": "Majority of plan is empty or generic",
             },
-            "specificity": {
-                "max_points": 20,
-                "description": "Are statements concrete and actionable?",
-                "scoring": {
-                    "18-20": "Precise details (quantities, dates, specs, part numbers)",
-                    "14-17": "Mix of specific and general statements",
-                    "10-13": "Mostly high-level, lacks operational detail",
-                    "6-9": "Vague and generic throughout",
-                    "0-5": "No actionable details",
-                },
-                "examples": {
-                    "bad": "Customer requires quality parts",
-                    "good": "Customer requires Cpk >= 1.67 per Q1 2025 agreement",
-                },
+        },
+        "specificity": {
+            "max_points": 20,
+            "description": "Are statements concrete and actionable?",
+            "scoring": {
+                "18-20": "Precise details (quantities, dates, specs, part numbers)",
+                "14-17": "Mix of specific and general statements",
+                "10-13": "Mostly high-level, lacks operational detail",
+                "6-9": "Vague and generic throughout",
+                "0-5": "No actionable details",
             },
-            "actionability": {
-                "max_points": 20,
-                "description": "Can the team execute based on this plan?",
-                "scoring": {
-                    "18-20": "Clear next steps, assigned owners, timelines for all critical items",
-                    "14-17": "Most items have action plans, some ownership gaps",
-                    "10-13": "High-level strategy but lacks execution details",
-                    "6-9": "Few actionable next steps",
-                    "0-5": "No clear path forward",
-                },
-                "checklist": [
-                    "Asana tasks created for unknowns",
-                    "Timeline with specific dates",
-                    "Assigned owners or departments",
-                    "Dependencies identified",
-                ],
+            "examples": {
+                "bad": "Customer requires quality parts",
+                "good": "Customer requires Cpk >= 1.67 per Q1 2025 agreement",
             },
-            "manufacturability": {
-                "max_points": 20,
-                "description": "Does it reflect realistic manufacturing constraints?",
-                "scoring": {
-                    "18-20": "Thoughtful make/buy analysis, tooling plans, capacity check",
-                    "14-17": "Basic manufacturing considerations addressed",
-                    "10-13": "Some manufacturing gaps",
-                    "6-9": "Unrealistic or incomplete manufacturing strategy",
-                    "0-5": "No evidence of manufacturing planning",
-                },
-                "red_flags": [
-                    "No tooling plan for custom parts",
-                    "Ignoring lead times",
-                    "Unrealistic timelines",
-                    "Missing capacity analysis",
-                ],
+        },
+        "actionability": {
+            "max_points": 20,
+            "description": "Can the team execute based on this plan?",
+            "scoring": {
+                "18-20": "Clear next steps, assigned owners, timelines for all critical items",
+                "14-17": "Most items have action plans, some ownership gaps",
+                "10-13": "High-level strategy but lacks execution details",
+                "6-9": "Few actionable next steps",
+                "0-5": "No clear path forward",
             },
-            "risk_coverage": {
-                "max_points": 20,
-                "description": "Are risks identified and mitigated?",
-                "scoring": {
-                    "18-20": "Comprehensive risk analysis with mitigations",
-                    "14-17": "Key risks identified with some mitigation plans",
-                    "10-13": "Basic risk awareness, limited mitigation",
-                    "6-9": "Few risks mentioned",
-                    "0-5": "No risk analysis",
-                },
-                "common_risks": [
-                    "Long-lead items",
-                    "Single-source suppliers",
-                    "New processes/untested methods",
-                    "Tight timelines",
-                    "Customer-specific requirements",
-                ],
+            "checklist": [
+                "Asana tasks created for unknowns",
+                "Timeline with specific dates",
+                "Assigned owners or departments",
+                "Dependencies identified",
+            ],
+        },
+        "manufacturability": {
+            "max_points": 20,
+            "description": "Does it reflect realistic manufacturing constraints?",
+            "scoring": {
+                "18-20": "Thoughtful make/buy analysis, tooling plans, capacity check",
+                "14-17": "Basic manufacturing considerations addressed",
+                "10-13": "Some manufacturing gaps",
+                "6-9": "Unrealistic or incomplete manufacturing strategy",
+                "0-5": "No evidence of manufacturing planning",
             },
+            "red_flags": [
+                "No tooling plan for custom parts",
+                "Ignoring lead times",
+                "Unrealistic timelines",
+                "Missing capacity analysis",
+            ],
         },
-        "grade_scale": {
-            "90-100": "Excellent - Ready for execution",
-            "80-89": "Good - Minor improvements needed",
-            "70-79": "Acceptable - Several gaps to address",
-            "60-69": "Needs Work - Significant improvements required",
-            "<60": "Incomplete - Major revision needed",
+        "risk_coverage": {
+            "max_points": 20,
+            "description": "Are risks identified and mitigated?",
+            "scoring": {
+                "18-20": "Comprehensive risk analysis with mitigations",
+                "14-17": "Key risks identified with some mitigation plans",
+                "10-13": "Basic risk awareness, limited mitigation",
+                "6-9": "Few risks mentioned",
+                "0-5": "No risk analysis",
+            },
+            "common_risks": [
+                "Long-lead items",
+                "Single-source suppliers",
+                "New processes/untested methods",
+                "Tight timelines",
+                "Customer-specific requirements",
+            ],
         },
-    }
+    },
+    "grade_scale": {
+        "90-100": "Excellent - Ready for execution",
+        "80-89": "Good - Minor improvements needed",
+        "70-79": "Acceptable - Several gaps to address",
+        "60-69": "Needs Work - Significant improvements required",
+        "<60": "Incomplete - Major revision needed",
+    },
+}
+GRADING_RUBRIC_JSON = orjson.dumps(GRADING_RUBRIC)
+
+
+@router.get("/rubric")
+async def get_grading_rubric() -> Response:
+    """
+    Get the QA grading rubric
+
+    Returns the scoring criteria for each dimension to help
+    users understand how plans are evaluated.
+    """
+    return Response(content=GRADING_RUBRIC_JSON, media_type="application/json")
@@ -7,21 +7,41 @@ Workflow:
 3. POST /api/quote/merge-preview - Generate merge preview with conflict highlights
 """
 
+import io
+import time
+import asyncio
+import hashlib
 import logging
-from typing import Optional
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from pydantic import BaseModel
-
-from app.services.quote_comparison_service import QuoteComparisonService
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import orjson
+from fastapi import APIRouter, HTTPException, Request, UploadFile, File, Form
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.services.quote_comparison_service import (
+    QUOTE_CACHE_TTL,
+    QuoteComparisonService,
+)
 from app.services.document_processor import DocumentProcessor
 
-router = APIRouter(prefix="/api/quote", tags=["quote"])
+router = APIRouter(
+    prefix="/api/quote",
+    tags=["quote"],
+    default_response_class=ORJSONResponse,
+)
 
 # Initialize services
 quote_service = QuoteComparisonService()
 
 logger = logging.getLogger(__name__)
 
+# /compare results by content hash of both inputs, most recently used last;
+# the frontend re-requests the same comparison when it refreshes
+COMPARISON_CACHE_SIZE = 64
+_comparison_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
 
 # ============================================================================
 # Request/Response Models
@@ -83,6 +103,102 @@ class MergePreviewRequest(BaseModel):
 # ============================================================================
 
 
+# Text extractor for each supported quote file extension
+EXTRACTORS = {
+    ".pdf": DocumentProcessor.extract_text_from_pdf,
+    ".docx": DocumentProcessor.extract_text_from_docx,
+    ".txt": DocumentProcessor.extract_text_from_txt,
+}
+
+# Extracted text by upload content hash, most recently used last; the same
+# quote file is often uploaded again to /extract and then /full-workflow
+UPLOAD_TEXT_CACHE_SIZE = 16
+UPLOAD_HASH_CHUNK = 1024 * 1024
+_upload_text_cache: "OrderedDict[str, str]" = OrderedDict()
+
+# Leading bytes each supported format must start with (PDFs may carry a
+# little junk before the header, so the first KB is searched)
+UPLOAD_SNIFF_BYTES = 1024
+DOCX_SIGNATURE = b"PK\x03\x04"
+PDF_SIGNATURE = b"%PDF-"
+
+
+def _check_upload(upload: UploadFile, filename: str) -> str:
+    """
+    Reject an unsupported, oversized or mislabeled upload before parsing
+
+    Returns the lowercased extension. Only the first KB of the spool is
+    read to check the content matches the extension.
+    """
+    ext = Path(filename).suffix.lower()
+    if ext not in EXTRACTORS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type: {ext}. Use PDF, DOCX, or TXT.",
+        )
+
+    is_valid, error_msg = DocumentProcessor.validate_file(
+        filename, _upload_size(upload)
+    )
+    if not is_valid:
+        raise HTTPException(status_code=413, detail=error_msg)
+
+    upload.file.seek(0)
+    head = upload.file.read(UPLOAD_SNIFF_BYTES)
+    upload.file.seek(0)
+
+    if ext == ".pdf":
+        matches = PDF_SIGNATURE in head
+    elif ext == ".docx":
+        matches = head.startswith(DOCX_SIGNATURE)
+    else:
+        matches = b"\x00" not in head
+    if not matches:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File content does not look like a {ext[1:].upper()} file",
+        )
+    return ext
+
+
+async def _extract_upload_text(upload: UploadFile, filename: str) -> str:
+    """
+    Extract text from an uploaded quote document
+
+    Parses the spooled temp file Starlette already wrote the upload to (in
+    memory up to 1 MB, on disk beyond) rather than copying the whole body
+    into a bytes object and a BytesIO on top of it.
+    """
+    ext = _check_upload(upload, filename)
+
+    # Hashing the spool is far cheaper than parsing it again
+    digest = hashlib.blake2b(ext.encode(), digest_size=16)
+    while chunk := upload.file.read(UPLOAD_HASH_CHUNK):
+        digest.update(chunk)
+    upload.file.seek(0)
+    key = digest.hexdigest()
+
+    text = _upload_text_cache.get(key)
+    if text is not None:
+        _upload_text_cache.move_to_end(key)
+        logger.info(f"Reusing extracted text for identical upload: {filename}")
+        return text
+
+    text = await EXTRACTORS[ext](upload.file, filename)
+    _upload_text_cache[key] = text
+    if len(_upload_text_cache) > UPLOAD_TEXT_CACHE_SIZE:
+        _upload_text_cache.popitem(last=False)
+    return text
+
+
+def _upload_size(upload: UploadFile) -> int:
+    """Size of an upload in bytes, from Starlette or by seeking its spool"""
+    if upload.size is not None:
+        return upload.size
+    upload.file.seek(0, io.SEEK_END)
+    return upload.file.tell()
+
+
 @router.post("/extract", response_model=QuoteAssumptions)
 async def extract_quote_assumptions(
     file: UploadFile = File(..., description="Quote PDF file"),
@@ -105,31 +221,13 @@ async def extract_quote_assumptions(
     - Packaging & Shipping
     - Documentation
     """
-    import io
-    from pathlib import Path
-
     try:
-        # Read uploaded file
-        content = await file.read()
         filename = file.filename or "quote.pdf"
 
-        logger.info(f"Processing quote file: {filename} ({len(content)} bytes)")
+        logger.info(f"Processing quote file: {filename} ({_upload_size(file)} bytes)")
 
         # Extract text based on file extension
-        ext = Path(filename).suffix.lower()
-        file_obj = io.BytesIO(content)
-
-        if ext == ".pdf":
-            text = await DocumentProcessor.extract_text_from_pdf(file_obj, filename)
-        elif ext == ".docx":
-            text = await DocumentProcessor.extract_text_from_docx(file_obj, filename)
-        elif ext == ".txt":
-            text = await DocumentProcessor.extract_text_from_txt(file_obj, filename)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file type: {ext}. Use PDF, DOCX, or TXT.",
-            )
+        text = await _extract_upload_text(file, filename)
 
         if not text:
             raise HTTPException(
@@ -175,10 +273,27 @@ async def compare_quote_with_checklist(request: ComparisonRequest):
     - Catching welding code, material, or testing conflicts early
     """
     try:
+        key = hashlib.blake2b(
+            orjson.dumps(
+                {"q": request.quote_assumptions, "c": request.checklist},
+                option=orjson.OPT_SORT_KEYS,
+            ),
+            digest_size=16,
+        ).hexdigest()
+        cached = _comparison_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            _comparison_cache.move_to_end(key)
+            return cached[1]
+
         result = await quote_service.compare_with_checklist(
             quote_assumptions=request.quote_assumptions,
             checklist=request.checklist,
         )
+
+        _comparison_cache[key] = (time.monotonic() + QUOTE_CACHE_TTL, result)
+        _comparison_cache.move_to_end(key)
+        if len(_comparison_cache) > COMPARISON_CACHE_SIZE:
+            _comparison_cache.popitem(last=False)
         return result
 
     except Exception as e:
@@ -215,8 +330,70 @@ async def generate_merge_preview(request: MergePreviewRequest):
         raise HTTPException(status_code=500, detail=f"Merge preview failed: {str(e)}")
 
 
+# While a workflow step is still waiting on the model, an SSE comment is sent
+# this often so proxies don't close the idle connection
+SSE_KEEPALIVE_SECONDS = 15
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Event with a JSON payload"""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+async def _sse_keepalive(task: asyncio.Future) -> AsyncIterator[str]:
+    """Yield SSE keep-alive comments until `task` finishes"""
+    while not task.done():
+        await asyncio.wait({task}, timeout=SSE_KEEPALIVE_SECONDS)
+        if not task.done():
+            yield ": keep-alive\n\n"
+
+
+async def _stream_full_workflow(
+    text: str, checklist_data: dict, project_name: Optional[str]
+) -> AsyncIterator[str]:
+    """Run the workflow after extraction, emitting one event per step"""
+    task = None
+    try:
+        task = asyncio.ensure_future(
+            quote_service.extract_quote_assumptions(
+                quote_text=text, project_name=project_name
+            )
+        )
+        async for keepalive in _sse_keepalive(task):
+            yield keepalive
+        quote_assumptions = task.result()
+        yield _sse_event("quote_assumptions", quote_assumptions)
+
+        task = asyncio.ensure_future(
+            quote_service.compare_with_checklist(
+                quote_assumptions=quote_assumptions, checklist=checklist_data
+            )
+        )
+        async for keepalive in _sse_keepalive(task):
+            yield keepalive
+        comparison = task.result()
+        yield _sse_event("comparison", comparison)
+
+        merge_preview = await quote_service.generate_merge_preview(
+            checklist=checklist_data,
+            quote_assumptions=quote_assumptions,
+            comparison=comparison,
+        )
+        yield _sse_event("merge_preview", merge_preview)
+        yield _sse_event("done", {"workflow_complete": True})
+
+    except Exception as e:
+        logger.error(f"Full workflow failed: {str(e)}")
+        yield _sse_event("error", {"detail": f"Workflow failed: {str(e)}"})
+    finally:
+        # The client went away mid-step; don't leave the model call running
+        if task is not None and not task.done():
+            task.cancel()
+
+
 @router.post("/full-workflow")
 async def full_quote_comparison_workflow(
+    request: Request,
     quote_file: UploadFile = File(..., description="Quote PDF file"),
     checklist: str = Form(..., description="Checklist JSON as string"),
     project_name: str = Form(None, description="Project name"),
@@ -236,43 +413,35 @@ async def full_quote_comparison_workflow(
 
     This is a convenience endpoint that combines /extract, /compare,
     and /merge-preview into a single call.
-    """
-    import json
 
+    **Streaming:** send `Accept: text/event-stream` to receive each result
+    as a Server-Sent Event as soon as its step finishes (`quote_assumptions`,
+    `comparison`, `merge_preview`, then `done`, or `error`), with keep-alive
+    comments in between so proxies don't time out on long quotes.
+    """
     try:
         # Parse checklist JSON
         try:
-            checklist_data = json.loads(checklist)
-        except json.JSONDecodeError:
+            checklist_data = orjson.loads(checklist)
+        except orjson.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid checklist JSON")
 
         # Step 1: Extract quote
-        import io
-        from pathlib import Path
-
-        content = await quote_file.read()
         filename = quote_file.filename or "quote.pdf"
-
-        ext = Path(filename).suffix.lower()
-        file_obj = io.BytesIO(content)
-
-        if ext == ".pdf":
-            text = await DocumentProcessor.extract_text_from_pdf(file_obj, filename)
-        elif ext == ".docx":
-            text = await DocumentProcessor.extract_text_from_docx(file_obj, filename)
-        elif ext == ".txt":
-            text = await DocumentProcessor.extract_text_from_txt(file_obj, filename)
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file type: {ext}. Use PDF, DOCX, or TXT.",
-            )
+        text = await _extract_upload_text(quote_file, filename)
 
         if not text:
             raise HTTPException(
                 status_code=400, detail="Could not extract text from quote PDF"
             )
 
+        if "text/event-stream" in request.headers.get("accept", ""):
+            return StreamingResponse(
+                _stream_full_workflow(text, checklist_data, project_name),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
         quote_assumptions = await quote_service.extract_quote_assumptions(
             quote_text=text, project_name=project_name
         )
@@ -323,7 +492,12 @@ class ResolveConflictsRequest(BaseModel):
 
     checklist: dict
     comparison: dict
-    resolutions: list  # List of ResolutionItem
+    resolutions: List[ResolutionItem]
+
+
+# Dumps validated resolutions back to the plain dicts the service works on;
+# unset optional fields are left out so the service's .get() defaults apply
+_resolutions_adapter = TypeAdapter(List[ResolutionItem])
 
 
 @router.post("/resolve-conflicts")
@@ -350,12 +524,9 @@ async def resolve_conflicts(request: ResolveConflictsRequest):
     """
     try:
         # Convert resolutions to list of dicts
-        resolutions_data = []
-        for res in request.resolutions:
-            if isinstance(res, dict):
-                resolutions_data.append(res)
-            else:
-                resolutions_data.append(res.dict() if hasattr(res, "dict") else res)
+        resolutions_data = _resolutions_adapter.dump_python(
+            request.resolutions, exclude_none=True
+        )
 
         result = await quote_service.apply_resolutions(
             checklist=request.checklist,
@@ -3,23 +3,26 @@ Review Router - Post-Meeting Review Endpoints
 Handles transcript comparison and process grading
 """
 
+import asyncio
+import bisect
 import logging
+import hashlib
 import json
 import os
+import re
+import time
+import orjson
+from collections import OrderedDict
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
-
-from openai import OpenAI
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from app.models.responses import (
     CompareRequest,
     ComparisonResponse,
-    MissingItem,
-    Discrepancy,
-    CapturedItem,
     ProcessGradeRequest,
     ProcessGradeResponse,
     ProcessDimensionScores,
@@ -59,29 +62,197 @@ from app.prompts.process_grade_prompt import (
     PROCESS_GRADE_SYSTEM_PROMPT,
     build_process_grade_prompt,
 )
-from app.services.confluence import ConfluenceService
+from app.services.confluence import ConfluenceService, get_confluence_service
+from app.services.openai_service import (
+    get_async_openai_client,
+    iter_chat_stream,
+    openai_chat_semaphore,
+)
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# gpt-4o for review (gpt-5.2 has compatibility issues); models resolved once
+# at import, the shared client is built on first use
+REVIEW_MODEL = "gpt-4o"
+PLAN_MODEL = os.getenv("OPENAI_MODEL_PLAN", "gpt-4o-2024-08-06")
+
+# Built once and sent as the unchanging first message of every call, which
+# keeps the long instruction prefix eligible for OpenAI's prompt caching
+COMPARISON_SYSTEM_MESSAGE = {"role": "system", "content": COMPARISON_SYSTEM_PROMPT}
+PROCESS_GRADE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": PROCESS_GRADE_SYSTEM_PROMPT,
+}
+
+# Raw compare/grade replies by hash of the full prompt, most recently used
+# last; users re-run the same review on retries and page reloads. The
+# comparison prompt embeds the page text, so a plan edit misses the cache.
+REVIEW_CACHE_ENABLED = os.getenv("REVIEW_CACHE_ENABLED", "true").lower() == "true"
+REVIEW_CACHE_SIZE = 128
+REVIEW_CACHE_TTL = float(os.getenv("REVIEW_CACHE_TTL", "3600"))
+_review_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+# Completions still running, so a second identical request (double submit,
+# retry after a client timeout) waits on the first instead of paying again
+_review_inflight: Dict[str, "asyncio.Future[dict]"] = {}
+
+# Transcripts over this many estimated tokens (~4 characters each) are cut
+# down to their opening and closing parts before either prompt is built
+REVIEW_MAX_TRANSCRIPT_TOKENS = int(os.getenv("REVIEW_MAX_TRANSCRIPT_TOKENS", "30000"))
+# Share of the budget kept from the start; wrap-up decisions and action items
+# come at the end, so it gets the rest
+REVIEW_TRANSCRIPT_HEAD_SHARE = 0.4
+
+# A dimension score in a partial grade reply, once the number is complete
+_DIMENSION_SCORE_RE = re.compile(
+    r'"(discussion_coverage|stakeholder_participation|decision_quality'
+    r'|action_assignment|risk_discussion)"\s*:\s*(\d+)\s*[,}]'
+)
+
+
+# Scores where Needs Work, Acceptable, Good and Excellent begin
+GRADE_THRESHOLDS = (60, 70, 80, 90)
+GRADE_LABELS = ("Incomplete", "Needs Work", "Acceptable", "Good", "Excellent")
 
 
 def get_grade_label(score: int) -> str:
     """Convert numeric score to grade label"""
-    if score >= 90:
-        return "Excellent"
-    elif score >= 80:
-        return "Good"
-    elif score >= 70:
-        return "Acceptable"
-    elif score >= 60:
-        return "Needs Work"
+    return GRADE_LABELS[bisect.bisect_right(GRADE_THRESHOLDS, score)]
+
+
+def _load_json_reply(content: str) -> dict:
+    """Parse a JSON reply from the model, unwrapping a markdown code block"""
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
+    return orjson.loads(content)
+
+
+def _fit_transcript(transcript: str) -> Tuple[str, bool]:
+    """
+    Trim a transcript to the review token budget
+
+    Returns the transcript to send and whether anything was cut. The middle
+    is dropped and marked, so the model still sees how the meeting opened
+    and how it ended.
+    """
+    max_chars = REVIEW_MAX_TRANSCRIPT_TOKENS * 4
+    if len(transcript) <= max_chars:
+        return transcript, False
+
+    head_chars = int(max_chars * REVIEW_TRANSCRIPT_HEAD_SHARE)
+    tail_chars = max_chars - head_chars
+    omitted = len(transcript) - max_chars
+    logger.warning(
+        "Transcript of %d characters exceeds the review budget; "
+        "omitting %d characters from the middle",
+        len(transcript),
+        omitted,
+    )
+    return (
+        f"{transcript[:head_chars]}\n\n"
+        f"[... {omitted} characters of transcript omitted ...]\n\n"
+        f"{transcript[-tail_chars:]}",
+        True,
+    )
+
+
+def _review_cache_key(system_message: dict, user_prompt: str) -> str:
+    return hashlib.blake2b(
+        f"{REVIEW_MODEL}\n{system_message['content']}\n{user_prompt}".encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _cached_review_reply(key: str) -> Optional[str]:
+    """Reply text cached for a review prompt, if caching is on and it is fresh"""
+    if not REVIEW_CACHE_ENABLED:
+        return None
+    cached = _review_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        _review_cache.move_to_end(key)
+        logger.info("Reusing cached review for identical input")
+        return cached[1]
+    return None
+
+
+def _store_review_reply(key: str, content: str) -> None:
+    if not REVIEW_CACHE_ENABLED:
+        return
+    _review_cache[key] = (time.monotonic() + REVIEW_CACHE_TTL, content)
+    _review_cache.move_to_end(key)
+    if len(_review_cache) > REVIEW_CACHE_SIZE:
+        _review_cache.popitem(last=False)
+
+
+async def _stream_review_reply(
+    system_message: dict, user_prompt: str
+) -> AsyncIterator[str]:
+    """Yield the text of one review completion as the model generates it"""
+    async with openai_chat_semaphore:
+        stream = await get_async_openai_client().chat.completions.create(
+            model=REVIEW_MODEL,
+            messages=[
+                system_message,
+                {"role": "user", "content": user_prompt},
+            ],
+            stream=True,
+        )
+        async for delta in iter_chat_stream(stream):
+            yield delta
+
+
+async def _fetch_review_reply(key: str, system_message: dict, user_prompt: str) -> dict:
+    content = "".join(
+        [delta async for delta in _stream_review_reply(system_message, user_prompt)]
+    )
+    result = _load_json_reply(content)
+    _store_review_reply(key, content)
+    return result
+
+
+async def _review_reply(system_message: dict, user_prompt: str) -> dict:
+    """
+    Run one review completion and parse its JSON reply
+
+    When REVIEW_CACHE_ENABLED is set, identical prompts reuse the cached reply
+    text (parsed again on every call; only replies that parse are cached), and
+    concurrent identical prompts share one completion. Callers only read the
+    returned dict.
+    """
+    key = _review_cache_key(system_message, user_prompt)
+    if not REVIEW_CACHE_ENABLED:
+        return await _fetch_review_reply(key, system_message, user_prompt)
+
+    content = _cached_review_reply(key)
+    if content is not None:
+        return _load_json_reply(content)
+
+    task = _review_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _fetch_review_reply(key, system_message, user_prompt)
+        )
+        _review_inflight[key] = task
+        task.add_done_callback(lambda _: _review_inflight.pop(key, None))
     else:
-        return "Incomplete"
+        logger.info("Joining in-flight review for identical input")
+    # One caller disconnecting must not cancel the completion for the others
+    return await asyncio.shield(task)
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Event with a JSON payload"""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
 
 
 @router.post("/compare", response_model=ComparisonResponse)
-async def compare_transcript_to_plan(request: CompareRequest) -> ComparisonResponse:
+async def compare_transcript_to_plan(
+    request: CompareRequest,
+    confluence: ConfluenceService = Depends(get_confluence_service),
+) -> ComparisonResponse:
     """
     Compare meeting transcript against a Confluence page/plan.
 
@@ -102,6 +273,8 @@ async def compare_transcript_to_plan(request: CompareRequest) -> ComparisonRespo
     - discrepancies: List of conflicts between transcript and plan
     - captured_items: List of items correctly documented
     - summary: Brief overall assessment
+    - transcript_truncated: True if the middle of a very long transcript was
+      left out to fit the model budget
     """
     try:
         logger.info(
@@ -109,7 +282,6 @@ async def compare_transcript_to_plan(request: CompareRequest) -> ComparisonRespo
         )
 
         # Get Confluence page content
-        confluence = ConfluenceService()
         page_content = await confluence.get_page_content_text(
             request.confluence_page_id
         )
@@ -121,80 +293,36 @@ async def compare_transcript_to_plan(request: CompareRequest) -> ComparisonRespo
             )
 
         # Build prompts
+        transcript, transcript_truncated = _fit_transcript(request.transcript)
         user_prompt = build_comparison_prompt(
-            transcript=request.transcript,
+            transcript=transcript,
             plan_content=page_content,
             meeting_type=request.meeting_type,
         )
 
-        # Call OpenAI - use gpt-4o for review (gpt-5.2 has compatibility issues)
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        model = "gpt-4o"
-
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": COMPARISON_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
+        # Call OpenAI and parse the JSON reply
+        comparison_data = await _review_reply(COMPARISON_SYSTEM_MESSAGE, user_prompt)
+
+        # Field defaults on the response models fill anything the model left
+        # out; pydantic-core builds the nested items in one pass
+        response = ComparisonResponse.model_validate(
+            {
+                **comparison_data,
+                "transcript_truncated": transcript_truncated,
+                "compared_at": datetime.utcnow(),
+            }
         )
 
-        # Parse response - extract JSON from the response
-        content = response.choices[0].message.content
-        # Handle potential markdown code blocks
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-        comparison_data = json.loads(content)
-
-        # Build response objects
-        missing_items = [
-            MissingItem(
-                category=item.get("category", "requirement"),
-                content=item.get("content", ""),
-                transcript_excerpt=item.get("transcript_excerpt", ""),
-                importance=item.get("importance", "important"),
-            )
-            for item in comparison_data.get("missing_items", [])
-        ]
-
-        discrepancies = [
-            Discrepancy(
-                topic=item.get("topic", ""),
-                transcript_says=item.get("transcript_says", ""),
-                plan_says=item.get("plan_says", ""),
-                severity=item.get("severity", "minor"),
-            )
-            for item in comparison_data.get("discrepancies", [])
-        ]
-
-        captured_items = [
-            CapturedItem(
-                topic=item.get("topic", ""),
-                plan_location=item.get("plan_location", ""),
-                confidence=item.get("confidence", 0.8),
-            )
-            for item in comparison_data.get("captured_items", [])
-        ]
-
-        coverage_score = comparison_data.get("coverage_score", 50.0)
-        summary = comparison_data.get("summary", "Comparison complete.")
-
         logger.info(
-            f"Comparison complete: coverage={coverage_score:.1f}%, "
-            f"missing={len(missing_items)}, discrepancies={len(discrepancies)}, "
-            f"captured={len(captured_items)}"
+            "Comparison complete: coverage=%.1f%%, missing=%d, discrepancies=%d, "
+            "captured=%d",
+            response.coverage_score,
+            len(response.missing_items),
+            len(response.discrepancies),
+            len(response.captured_items),
         )
 
-        return ComparisonResponse(
-            coverage_score=coverage_score,
-            missing_items=missing_items,
-            discrepancies=discrepancies,
-            captured_items=captured_items,
-            summary=summary,
-            compared_at=datetime.utcnow(),
-        )
+        return response
 
     except HTTPException:
         raise
@@ -205,8 +333,94 @@ async def compare_transcript_to_plan(request: CompareRequest) -> ComparisonRespo
         )
 
 
+def _build_process_grade_response(
+    grade_data: dict, transcript_truncated: bool
+) -> ProcessGradeResponse:
+    """Fill defaults on a model grade object and derive the score and label"""
+    dimension_scores = ProcessDimensionScores.model_validate(
+        grade_data.get("dimension_scores", {})
+    )
+
+    # Calculate overall score
+    overall_score = grade_data.get("overall_score")
+    if overall_score is None:
+        overall_score = dimension_scores.total
+
+    # Get grade label
+    grade_label = grade_data.get("grade") or get_grade_label(overall_score)
+
+    logger.info(
+        "Process graded: %s/100 (%s) - DC:%s SP:%s DQ:%s AA:%s RD:%s",
+        overall_score,
+        grade_label,
+        dimension_scores.discussion_coverage,
+        dimension_scores.stakeholder_participation,
+        dimension_scores.decision_quality,
+        dimension_scores.action_assignment,
+        dimension_scores.risk_discussion,
+    )
+
+    return ProcessGradeResponse.model_validate(
+        {
+            **grade_data,
+            "overall_score": overall_score,
+            "dimension_scores": dimension_scores,
+            "grade": grade_label,
+            "transcript_truncated": transcript_truncated,
+            "graded_at": datetime.utcnow(),
+        }
+    )
+
+
+async def _stream_process_grade(
+    user_prompt: str, transcript_truncated: bool
+) -> AsyncIterator[str]:
+    """
+    Grade a meeting, emitting each dimension score as soon as the model has
+    written it and then the full grade
+    """
+    try:
+        key = _review_cache_key(PROCESS_GRADE_SYSTEM_MESSAGE, user_prompt)
+        content = _cached_review_reply(key)
+        if content is not None:
+            response = _build_process_grade_response(
+                _load_json_reply(content), transcript_truncated
+            )
+            for dimension, score in response.dimension_scores:
+                yield _sse_event("dimension", {"dimension": dimension, "score": score})
+        else:
+            content = ""
+            async for delta in _stream_review_reply(
+                PROCESS_GRADE_SYSTEM_MESSAGE, user_prompt
+            ):
+                # Rescan a little before the new text so a score split
+                # across deltas is still found, but report it only once
+                scanned = len(content)
+                content += delta
+                for match in _DIMENSION_SCORE_RE.finditer(
+                    content, max(0, scanned - 64)
+                ):
+                    if match.end() > scanned:
+                        yield _sse_event(
+                            "dimension",
+                            {"dimension": match[1], "score": int(match[2])},
+                        )
+            response = _build_process_grade_response(
+                _load_json_reply(content), transcript_truncated
+            )
+            _store_review_reply(key, content)
+
+        yield _sse_event("grade", response.model_dump(mode="json"))
+
+    except Exception as e:
+        logger.error(f"Process grading failed: {str(e)}")
+        yield _sse_event("error", {"detail": f"Failed to grade process: {str(e)}"})
+
+
 @router.post("/grade-process", response_model=ProcessGradeResponse)
-async def grade_apqp_process(request: ProcessGradeRequest) -> ProcessGradeResponse:
+async def grade_apqp_process(
+    request: ProcessGradeRequest, http_request: Request
+) -> ProcessGradeResponse:
     """
     Grade the quality of an APQP meeting process based on transcript.
 
@@ -237,79 +451,34 @@ async def grade_apqp_process(request: ProcessGradeRequest) -> ProcessGradeRespon
     - improvements: Suggested improvements
     - topics_discussed: APQP topics covered
     - topics_missing: APQP topics not covered
+    - transcript_truncated: True if the middle of a very long transcript was
+      left out to fit the model budget
+
+    **Streaming:** send `Accept: text/event-stream` to receive a `dimension`
+    event for each dimension score as soon as the model writes it, then the
+    full result as a `grade` event (or an `error` event).
     """
     try:
         logger.info(f"Grading APQP process for {request.meeting_type} meeting")
 
         # Build prompts
+        transcript, transcript_truncated = _fit_transcript(request.transcript)
         user_prompt = build_process_grade_prompt(
-            transcript=request.transcript,
+            transcript=transcript,
             meeting_type=request.meeting_type,
             expected_attendees=request.expected_attendees,
         )
 
-        # Call OpenAI - use gpt-4o for review (gpt-5.2 has compatibility issues)
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        model = "gpt-4o"
-
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": PROCESS_GRADE_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
-
-        # Parse response - extract JSON from the response
-        content = response.choices[0].message.content
-        # Handle potential markdown code blocks
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0].strip()
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0].strip()
-        grade_data = json.loads(content)
-
-        # Extract dimension scores
-        dim_scores = grade_data.get("dimension_scores", {})
-        dimension_scores = ProcessDimensionScores(
-            discussion_coverage=dim_scores.get("discussion_coverage", 10),
-            stakeholder_participation=dim_scores.get("stakeholder_participation", 10),
-            decision_quality=dim_scores.get("decision_quality", 10),
-            action_assignment=dim_scores.get("action_assignment", 10),
-            risk_discussion=dim_scores.get("risk_discussion", 10),
-        )
-
-        # Calculate overall score
-        overall_score = grade_data.get("overall_score")
-        if overall_score is None:
-            overall_score = (
-                dimension_scores.discussion_coverage
-                + dimension_scores.stakeholder_participation
-                + dimension_scores.decision_quality
-                + dimension_scores.action_assignment
-                + dimension_scores.risk_discussion
+        if "text/event-stream" in http_request.headers.get("accept", ""):
+            return StreamingResponse(
+                _stream_process_grade(user_prompt, transcript_truncated),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
             )
 
-        # Get grade label
-        grade_label = grade_data.get("grade") or get_grade_label(overall_score)
-
-        logger.info(
-            f"Process graded: {overall_score}/100 ({grade_label}) - "
-            f"DC:{dimension_scores.discussion_coverage} SP:{dimension_scores.stakeholder_participation} "
-            f"DQ:{dimension_scores.decision_quality} AA:{dimension_scores.action_assignment} "
-            f"RD:{dimension_scores.risk_discussion}"
-        )
-
-        return ProcessGradeResponse(
-            overall_score=overall_score,
-            dimension_scores=dimension_scores,
-            grade=grade_label,
-            strengths=grade_data.get("strengths", []),
-            improvements=grade_data.get("improvements", []),
-            topics_discussed=grade_data.get("topics_discussed", []),
-            topics_missing=grade_data.get("topics_missing", []),
-            graded_at=datetime.utcnow(),
-        )
+        # Call OpenAI and parse the JSON reply
+        grade_data = await _review_reply(PROCESS_GRADE_SYSTEM_MESSAGE, user_prompt)
+        return _build_process_grade_response(grade_data, transcript_truncated)
 
     except HTTPException:
         raise
@@ -321,7 +490,10 @@ async def grade_apqp_process(request: ProcessGradeRequest) -> ProcessGradeRespon
 
 
 @router.post("/apply-updates", response_model=ApplyUpdatesResponse)
-async def apply_updates_to_plan(request: ApplyUpdatesRequest) -> ApplyUpdatesResponse:
+async def apply_updates_to_plan(
+    request: ApplyUpdatesRequest,
+    confluence: ConfluenceService = Depends(get_confluence_service),
+) -> ApplyUpdatesResponse:
     """
     Apply selected updates to a Confluence page.
 
@@ -344,8 +516,6 @@ async def apply_updates_to_plan(request: ApplyUpdatesRequest) -> ApplyUpdatesRes
     try:
         logger.info(f"Applying updates to Confluence page {request.confluence_page_id}")
 
-        confluence = ConfluenceService()
-
         # Get current page content
         page = await confluence.get_page(request.confluence_page_id)
         if not page:
@@ -358,9 +528,6 @@ async def apply_updates_to_plan(request: ApplyUpdatesRequest) -> ApplyUpdatesRes
 
         # Build update content using AI
         if request.missing_items or request.discrepancies:
-            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            model = os.getenv("OPENAI_MODEL_PLAN", "gpt-4o-2024-08-06")
-
             update_prompt = f"""You are updating a Confluence page to add missing items from a meeting.
 
 **Current Page Content:**
@@ -387,12 +554,13 @@ async def apply_updates_to_plan(request: ApplyUpdatesRequest) -> ApplyUpdatesRes
 
 Return ONLY the complete HTML content, no explanation."""
 
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "user", "content": update_prompt},
-                ],
-            )
+            async with openai_chat_semaphore:
+                response = await get_async_openai_client().chat.completions.create(
+                    model=PLAN_MODEL,
+                    messages=[
+                        {"role": "user", "content": update_prompt},
+                    ],
+                )
 
             updated_content = response.choices[0].message.content.strip()
 
@@ -449,93 +617,111 @@ Return ONLY the complete HTML content, no explanation."""
         )
 
 
+# The rubric never changes at runtime: encoded and tagged once at import, and
+# safe for browsers to keep for an hour without asking again
+PROCESS_RUBRIC = {
+    "total_points": 100,
+    "dimensions": {
+        "discussion_coverage": {
+            "max_points": 20,
+            "description": "Were all critical APQP topics discussed?",
+            "scoring": {
+                "18-20": "All key topics covered with appropriate depth",
+                "14-17": "Most topics covered, minor gaps",
+                "10-13": "Several important topics missed",
+                "6-9": "Major APQP areas not discussed",
+                "0-5": "Meeting lacked APQP focus",
+            },
+            "key_topics": [
+                "Customer requirements",
+                "Quality requirements",
+                "Material specifications",
+                "Timeline and milestones",
+                "Tooling needs",
+                "Risk identification",
+            ],
+        },
+        "stakeholder_participation": {
+            "max_points": 20,
+            "description": "Did all relevant parties contribute meaningfully?",
+            "scoring": {
+                "18-20": "Active, balanced participation from all",
+                "14-17": "Most participants engaged",
+                "10-13": "Dominated by few voices",
+                "6-9": "Key stakeholders silent",
+                "0-5": "One-sided presentation",
+            },
+        },
+        "decision_quality": {
+            "max_points": 20,
+            "description": "Were decisions clear, reasoned, and documented?",
+            "scoring": {
+                "18-20": "Clear decisions with rationale",
+                "14-17": "Most decisions clear",
+                "10-13": "Decisions made but rationale unclear",
+                "6-9": "Decisions vague or deferred",
+                "0-5": "No real decisions made",
+            },
+        },
+        "action_assignment": {
+            "max_points": 20,
+            "description": "Were action items assigned with owners and deadlines?",
+            "scoring": {
+                "18-20": "All actions have owners, dates, deliverables",
+                "14-17": "Most actions assigned, some missing dates",
+                "10-13": "Actions identified but poorly assigned",
+                "6-9": "Vague 'someone should' statements",
+                "0-5": "No action tracking",
+            },
+        },
+        "risk_discussion": {
+            "max_points": 20,
+            "description": "Were risks identified and mitigation discussed?",
+            "scoring": {
+                "18-20": "Proactive risk identification with mitigation",
+                "14-17": "Key risks identified, some mitigation",
+                "10-13": "Some risk awareness, no mitigation",
+                "6-9": "Risks mentioned only when problems arise",
+                "0-5": "No risk discussion",
+            },
+            "common_risks": [
+                "Long-lead items",
+                "Single-source suppliers",
+                "New processes",
+                "Tight timelines",
+                "Customer-specific requirements",
+            ],
+        },
+    },
+    "grade_scale": {
+        "90-100": "Excellent - Highly effective meeting",
+        "80-89": "Good - Solid meeting, minor improvements possible",
+        "70-79": "Acceptable - Several areas to improve",
+        "60-69": "Needs Work - Significant issues",
+        "<60": "Incomplete - Did not achieve APQP objectives",
+    },
+}
+PROCESS_RUBRIC_JSON = orjson.dumps(PROCESS_RUBRIC)
+PROCESS_RUBRIC_ETAG = (
+    f'"{hashlib.blake2b(PROCESS_RUBRIC_JSON, digest_size=16).hexdigest()}"'
+)
+PROCESS_RUBRIC_CACHE_CONTROL = "public, max-age=3600, immutable"
+
+
 @router.get("/process-rubric")
-async def get_process_grading_rubric():
+async def get_process_grading_rubric(request: Request) -> Response:
     """
     Get the APQP process grading rubric.
 
     Returns the scoring criteria for each dimension to help
     users understand how meetings are evaluated.
     """
-    return {
-        "total_points": 100,
-        "dimensions": {
-            "discussion_coverage": {
-                "max_points": 20,
-                "description": "Were all critical APQP topics discussed?",
-                "scoring": {
-                    "18-20": "All key topics covered with appropriate depth",
-                    "14-17": "Most topics covered, minor gaps",
-                    "10-13": "Several important topics missed",
-                    "6-9": "Major APQP areas not discussed",
-                    "0-5": "Meeting lacked APQP focus",
-                },
-                "key_topics": [
-                    "Customer requirements",
-                    "Quality requirements",
-                    "Material specifications",
-                    "Timeline and milestones",
-                    "Tooling needs",
-                    "Risk identification",
-                ],
-            },
-            "stakeholder_participation": {
-                "max_points": 20,
-                "description": "Did all relevant parties contribute meaningfully?",
-                "scoring": {
-                    "18-20": "Active, balanced participation from all",
-                    "14-17": "Most participants engaged",
-                    "10-13": "Dominated by few voices",
-                    "6-9": "Key stakeholders silent",
-                    "0-5": "One-sided presentation",
-                },
-            },
-            "decision_quality": {
-                "max_points": 20,
-                "description": "Were decisions clear, reasoned, and documented?",
-                "scoring": {
-                    "18-20": "Clear decisions with rationale",
-                    "14-17": "Most decisions clear",
-                    "10-13": "Decisions made but rationale unclear",
-                    "6-9": "Decisions vague or deferred",
-                    "0-5": "No real decisions made",
-                },
-            },
-            "action_assignment": {
-                "max_points": 20,
-                "description": "Were action items assigned with owners and deadlines?",
-                "scoring": {
-                    "18-20": "All actions have owners, dates, deliverables",
-                    "14-17": "Most actions assigned, some missing dates",
-                    "10-13": "Actions identified but poorly assigned",
-                    "6-9": "Vague 'someone should' statements",
-                    "0-5": "No action tracking",
-                },
-            },
-            "risk_discussion": {
-                "max_points": 20,
-                "description": "Were risks identified and mitigation discussed?",
-                "scoring": {
-                    "18-20": "Proactive risk identification with mitigation",
-                    "14-17": "Key risks identified, some mitigation",
-                    "10-13": "Some risk awareness, no mitigation",
-                    "6-9": "Risks mentioned only when problems arise",
-                    "0-5": "No risk discussion",
-                },
-                "common_risks": [
-                    "Long-lead items",
-                    "Single-source suppliers",
-                    "New processes",
-                    "Tight timelines",
-                    "Customer-specific requirements",
-                ],
-            },
-        },
-        "grade_scale": {
-            "90-100": "Excellent - Highly effective meeting",
-            "80-89": "Good - Solid meeting, minor improvements possible",
-            "70-79": "Acceptable - Several areas to improve",
-            "60-69": "Needs Work - Significant issues",
-            "<60": "Incomplete - Did not achieve APQP objectives",
-        },
+    headers = {
+        "ETag": PROCESS_RUBRIC_ETAG,
+        "Cache-Control": PROCESS_RUBRIC_CACHE_CONTROL,
     }
+    if request.headers.get("if-none-match") == PROCESS_RUBRIC_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=PROCESS_RUBRIC_JSON, media_type="application/json", headers=headers
+    )
@@ -3,13 +3,16 @@ Checklist Service - Pre-Meeting Checklist Generation with Parallel AI Calls
 """
 
 import os
+import re
 import json
 import asyncio
+import hashlib
 import logging
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from openai import OpenAI
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,18 @@ logger = logging.getLogger(__name__)
 # Path to prompts JSON file
 PROMPTS_FILE = Path(__file__).parent.parent / "data" / "checklist_prompts.json"
 
+# Common citation patterns in checklist answers, tried in order
+SOURCE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Section\s+[\d.]+",
+        r"Page\s+\d+",
+        r"Document:\s*[^,\n]+",
+        r"Spec-\d+",
+        r"per\s+[^,\n]+specification",
+    )
+]
+
 
 class ChecklistService:
     """Service for generating pre-meeting checklists using parallel AI calls"""
@@ -26,6 +41,9 @@ class ChecklistService:
         # Assistants API only supports certain models (gpt-4o, gpt-4-turbo, etc.)
         # Use separate env var for Assistants, fall back to gpt-4o
         self.model = os.getenv("OPENAI_MODEL_ASSISTANTS", "gpt-4o")
+        self._prompts_mtime = 0.0
+        self._active_prompts: Optional[List[Dict]] = None
+        self._prompts_etag: Optional[str] = None
         self.prompts_data = self._load_prompts()
         # Control parallelism - OpenAI has rate limits
         self.max_concurrent = int(os.getenv("CHECKLIST_MAX_CONCURRENT", "10"))
@@ -33,18 +51,45 @@ class ChecklistService:
     def _load_prompts(self) -> Dict:
         """Load prompts from JSON file"""
         try:
+            self._prompts_mtime = PROMPTS_FILE.stat().st_mtime
             with open(PROMPTS_FILE, "r") as f:
                 return json.load(f)
         except Exception as e:
             logger.error(f"Failed to load prompts: {e}")
             return {"categories": []}
 
+    def _refresh_prompts(self) -> None:
+        """Reload prompts if the JSON file changed on disk since the last load"""
+        try:
+            mtime = PROMPTS_FILE.stat().st_mtime
+        except OSError:
+            return
+        if mtime != self._prompts_mtime:
+            self.prompts_data = self._load_prompts()
+            self._active_prompts = None
+            self._prompts_etag = None
+
     def get_prompts(self) -> Dict:
         """Get all prompts for admin interface"""
+        self._refresh_prompts()
         return self.prompts_data
 
+    def get_prompts_etag(self) -> str:
+        """Content hash of the current prompts, for HTTP conditional requests"""
+        self._refresh_prompts()
+        if self._prompts_etag is None:
+            digest = hashlib.md5(
+                orjson.dumps(self.prompts_data, option=orjson.OPT_SORT_KEYS)
+            ).hexdigest()
+            self._prompts_etag = f'"{digest}"'
+        return self._prompts_etag
+
     def get_active_prompts(self) -> List[Dict]:
         """Get flat list of all active prompts with category info"""
+        self._refresh_prompts()
+        if self._active_prompts is not None:
+            return self._active_prompts
+
         prompts = []
         for category in self.prompts_data.get("categories", []):
             for prompt in category.get("prompts", []):
@@ -56,6 +101,7 @@ class ChecklistService:
                             **prompt,
                         }
                     )
+        self._active_prompts = prompts
         return prompts
 
     async def _run_single_prompt(
@@ -138,18 +184,8 @@ Search the uploaded documents and provide the answer. If you find relevant requi
     def _extract_source(self, answer: str) -> Optional[str]:
         """Try to extract source citation from answer"""
         # Look for common citation patterns
-        import re
-
-        patterns = [
-            r"Section\s+[\d.]+",
-            r"Page\s+\d+",
-            r"Document:\s*[^,\n]+",
-            r"Spec-\d+",
-            r"per\s+[^,\n]+specification",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, answer, re.IGNORECASE)
+        for pattern in SOURCE_PATTERNS:
+            match = pattern.search(answer)
             if match:
                 return match.group(0)
 
@@ -290,6 +326,9 @@ IMPORTANT RULES:
             with open(PROMPTS_FILE, "w") as f:
                 json.dump(prompts_data, f, indent=2)
             self.prompts_data = prompts_data
+            self._prompts_mtime = PROMPTS_FILE.stat().st_mtime
+            self._active_prompts = None
+            self._prompts_etag = None
             logger.info("Prompts saved successfully")
             return True
         except Exception as e:
@@ -10,30 +10,40 @@ Optimization Strategy (Option D - Hybrid):
 6. Concise responses to reduce tokens/latency
 """
 
-import os
 import json
 import asyncio
 import logging
 from typing import List, Dict, Optional, Any
 from datetime import datetime
-from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 
-from openai import OpenAI
+from app.services.checklist_service import ChecklistService
 
 logger = logging.getLogger(__name__)
 
-# Path to prompts JSON file
-PROMPTS_FILE = Path(__file__).parent.parent / "data" / "checklist_prompts.json"
-
 # Maximum prompts per batch (to avoid context overflow and accuracy degradation)
 MAX_PROMPTS_PER_BATCH = 8
 
+# Smaller batches for mode="accurate" so each question gets more of the
+# model's attention (replaces the old one-call-per-prompt fallback)
+ACCURATE_PROMPTS_PER_BATCH = 3
+
+# Extra extraction rules appended to batch prompts in mode="accurate"
+STRICT_EXTRACTION_RULES = """
+STRICT EXTRACTION:
+- Search every uploaded document before answering each question
+- Quote requirement text verbatim; do not paraphrase or summarize
+- Cite the exact section, page, or drawing note for every requirement found
+- Only use "no_requirement" after confirming nothing relevant exists"""
 
-class OptimizedChecklistService:
+
+class OptimizedChecklistService(ChecklistService):
     """
     Optimized service for generating pre-meeting checklists.
 
+    Prompt loading, result organization and statistics are inherited from
+    ChecklistService; only batching and generation differ.
+
     Key optimizations:
     - Assistants API with file_search for vector store access
     - Category-based batching reduces 37 calls to ~9
@@ -42,54 +52,32 @@ class OptimizedChecklistService:
     """
 
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.model = os.getenv("OPENAI_MODEL_ASSISTANTS", "gpt-4o")
-        self.prompts_data = self._load_prompts()
-        # Max concurrent batches (each batch is one category or sub-category)
-        self.max_concurrent = int(os.getenv("CHECKLIST_MAX_CONCURRENT", "10"))
-
-    def _load_prompts(self) -> Dict:
-        """Load prompts from JSON file"""
-        try:
-            with open(PROMPTS_FILE, "r") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load prompts: {e}")
-            return {"categories": []}
-
-    def get_prompts(self) -> Dict:
-        """Get all prompts for admin interface"""
-        return self.prompts_data
-
-    def get_active_prompts(self) -> List[Dict]:
-        """Get flat list of all active prompts with category info"""
-        prompts = []
-        for category in self.prompts_data.get("categories", []):
-            for prompt in category.get("prompts", []):
-                if prompt.get("active", True):
-                    prompts.append(
-                        {
-                            "category_id": category["id"],
-                            "category_name": category["name"],
-                            **prompt,
-                        }
-                    )
-        return prompts
+        super().__init__()
+        # One pool per process, so concurrent checklist runs (e.g. the batch
+        # endpoint) share the OpenAI rate-limit budget instead of each
+        # opening max_concurrent threads of their own
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent, thread_name_prefix="checklist-batch"
+        )
 
     def _prepare_batches(
-        self, category_ids: Optional[List[str]] = None
+        self,
+        category_ids: Optional[List[str]] = None,
+        batch_size: int = MAX_PROMPTS_PER_BATCH,
+        strict: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Prepare batches of prompts grouped by category.
 
-        Large categories (>MAX_PROMPTS_PER_BATCH) are split into sub-batches.
+        Large categories (>batch_size) are split into sub-batches.
 
         Returns list of batch objects:
         {
             "category_id": str,
             "category_name": str,
             "batch_index": int,  # 0, 1, 2... for split categories
-            "prompts": [...]
+            "prompts": [...],
+            "strict": bool,  # append STRICT_EXTRACTION_RULES to the prompt
         }
         """
         batches = []
@@ -108,9 +96,9 @@ class OptimizedChecklistService:
                 continue
 
             # Split into sub-batches if too large
-            for i in range(0, len(active_prompts), MAX_PROMPTS_PER_BATCH):
-                batch_prompts = active_prompts[i : i + MAX_PROMPTS_PER_BATCH]
-                batch_index = i // MAX_PROMPTS_PER_BATCH
+            for i in range(0, len(active_prompts), batch_size):
+                batch_prompts = active_prompts[i : i + batch_size]
+                batch_index = i // batch_size
 
                 batches.append(
                     {
@@ -118,6 +106,7 @@ class OptimizedChecklistService:
                         "category_name": category["name"],
                         "batch_index": batch_index,
                         "prompts": batch_prompts,
+                        "strict": strict,
                     }
                 )
 
@@ -144,6 +133,8 @@ class OptimizedChecklistService:
             ]
         )
 
+        strict_rules = STRICT_EXTRACTION_RULES if batch.get("strict") else ""
+
         return f"""You are analyzing manufacturing specification documents for a pre-meeting checklist.
 
 CATEGORY: {category_name}
@@ -170,7 +161,7 @@ REQUIRED JSON FORMAT - You MUST include ALL {num_questions} prompt IDs listed ab
 }}
 
 IMPORTANT: Your results array MUST contain exactly {num_questions} objects, one for each prompt ID: {ids_list}
-Do NOT skip any prompts. If nothing found, use status "no_requirement"."""
+Do NOT skip any prompts. If nothing found, use status "no_requirement".{strict_rules}"""
 
     def _run_batch_sync(
         self,
@@ -325,6 +316,7 @@ Do NOT skip any prompts. If nothing found, use status "no_requirement"."""
         project_name: str,
         customer: Optional[str] = None,
         category_ids: Optional[List[str]] = None,
+        mode: str = "fast",
     ) -> Dict:
         """
         Generate a complete pre-meeting checklist using optimized batch processing.
@@ -334,15 +326,27 @@ Do NOT skip any prompts. If nothing found, use status "no_requirement"."""
             project_name: Name of the project
             customer: Optional customer name
             category_ids: Optional list of category IDs to filter (None = all)
+            mode: "fast" (default) or "accurate" - smaller batches with
+                stricter extraction rules, for harder documents
 
         Returns:
             Complete checklist with all prompt results organized by category
         """
-        logger.info(f"[OPTIMIZED] Generating checklist for project: {project_name}")
+        logger.info(
+            f"[OPTIMIZED] Generating checklist for project: {project_name} (mode={mode})"
+        )
         logger.info(f"Using vector store: {vector_store_id}")
 
+        # Pick up prompt edits saved through the other service or by hand
+        self._refresh_prompts()
+
         # Prepare batches (categories, split if needed)
-        batches = self._prepare_batches(category_ids)
+        if mode == "accurate":
+            batches = self._prepare_batches(
+                category_ids, batch_size=ACCURATE_PROMPTS_PER_BATCH, strict=True
+            )
+        else:
+            batches = self._prepare_batches(category_ids)
         total_prompts = sum(len(b["prompts"]) for b in batches)
 
         logger.info(
@@ -367,17 +371,16 @@ Search documents thoroughly and quote specific text when requirements are found.
         start_time = datetime.now()
 
         try:
-            # Run all batches in parallel using thread pool
+            # Run all batches in parallel on the shared thread pool
             # (Assistants API is synchronous, so we use threads)
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
-                futures = [
-                    loop.run_in_executor(
-                        executor, self._run_batch_sync, batch, assistant.id
-                    )
-                    for batch in batches
-                ]
-                batch_results = await asyncio.gather(*futures)
+            loop = asyncio.get_running_loop()
+            futures = [
+                loop.run_in_executor(
+                    self._executor, self._run_batch_sync, batch, assistant.id
+                )
+                for batch in batches
+            ]
+            batch_results = await asyncio.gather(*futures)
 
         finally:
             # Clean up assistant
@@ -408,62 +411,10 @@ Search documents thoroughly and quote specific text when requirements are found.
             "generation_time_seconds": elapsed,
             "optimization": {
                 "method": "category_batching",
+                "mode": mode,
                 "total_batches": len(batches),
                 "total_prompts": total_prompts,
             },
             "categories": categories_result,
             "statistics": stats,
         }
-
-    def _organize_by_category(self, results: List[Dict]) -> List[Dict]:
-        """Organize flat results into category structure"""
-        # Build category lookup from prompts data
-        categories = {}
-        for cat in self.prompts_data.get("categories", []):
-            categories[cat["id"]] = {
-                "id": cat["id"],
-                "name": cat["name"],
-                "order": cat.get("order", 99),
-                "items": [],
-            }
-
-        # Assign results to categories
-        for result in results:
-            # Find which category this prompt belongs to
-            for cat in self.prompts_data.get("categories", []):
-                for prompt in cat.get("prompts", []):
-                    if prompt["id"] == result["prompt_id"]:
-                        if cat["id"] in categories:
-                            categories[cat["id"]]["items"].append(result)
-                        break
-
-        # Sort categories by order and return as list
-        sorted_cats = sorted(categories.values(), key=lambda x: x["order"])
-        return sorted_cats
-
-    def _calculate_stats(self, results: List[Dict]) -> Dict:
-        """Calculate summary statistics for the checklist"""
-        total = len(results)
-        found = sum(1 for r in results if r["status"] == "requirement_found")
-        not_found = sum(1 for r in results if r["status"] == "no_requirement")
-        errors = sum(1 for r in results if r["status"] == "error")
-
-        return {
-            "total_prompts": total,
-            "requirements_found": found,
-            "no_requirements": not_found,
-            "errors": errors,
-            "coverage_percentage": round((found / total) * 100, 1) if total > 0 else 0,
-        }
-
-    def save_prompts(self, prompts_data: Dict) -> bool:
-        """Save updated prompts to JSON file (for admin interface)"""
-        try:
-            with open(PROMPTS_FILE, "w") as f:
-                json.dump(prompts_data, f, indent=2)
-            self.prompts_data = prompts_data
-            logger.info("Prompts saved successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save prompts: {e}")
-            return False
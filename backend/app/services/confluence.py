@@ -4,12 +4,38 @@ Confluence Service - API Integration for Publishing Strategic Build Plans
 
 import os
 import re
+import time
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any
-from atlassian import Confluence
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Plain-text page cache (Customer/Family ancestors are re-read on every
+# /context call but rarely change)
+PAGE_TEXT_CACHE_SIZE = 256
+PAGE_TEXT_CACHE_TTL = float(os.getenv("CONFLUENCE_PAGE_CACHE_TTL", "300"))
+
+# Family of Parts parent pages found by label (looked up on every publish,
+# but a family page is created once and rarely moves)
+FAMILY_PAGE_CACHE_SIZE = 256
+FAMILY_PAGE_CACHE_TTL = float(os.getenv("CONFLUENCE_FAMILY_CACHE_TTL", "540"))
+
+# Keep-alive connections held per host; blocking calls run in worker threads,
+# so the pool must cover them or requests drops and re-opens connections
+CONFLUENCE_POOL_SIZE = 50
+
+# Slug and storage-to-text patterns, compiled once
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATOR_RE = re.compile(r"[\s_]+")
+_SLUG_DASHES_RE = re.compile(r"-+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class ConfluenceService:
     """Service for interacting with Confluence Cloud API"""
@@ -20,6 +46,12 @@ class ConfluenceService:
         self.email = os.getenv("CONFLUENCE_EMAIL")
         self.token = os.getenv("CONFLUENCE_API_TOKEN")
         self.space_key = os.getenv("CONFLUENCE_SPACE_KEY", "KB")
+        # page_id -> (expires_at, text), oldest first
+        self._page_text_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        # family label -> (expires_at, page dict), oldest first
+        self._family_page_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
 
         if not all([self.url, self.email, self.token]):
             logger.warning(
@@ -28,11 +60,28 @@ class ConfluenceService:
             )
             self.client = None
         else:
+            # atlassian-python-api is slow to import; only pay for it once
+            # credentials are present and a client is actually built
+            from atlassian import Confluence
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=CONFLUENCE_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
             self.client = Confluence(
-                url=self.url, username=self.email, password=self.token, cloud=True
+                url=self.url,
+                username=self.email,
+                password=self.token,
+                cloud=True,
+                session=session,
             )
             logger.info(f"Confluence client initialized for {self.url}")
 
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        if self.client:
+            self.client.close()
+
     def _ensure_client(self):
         """Ensure Confluence client is initialized"""
         if not self.client:
@@ -86,7 +135,7 @@ class ConfluenceService:
         self._ensure_client()
 
         try:
-            results = self.client.cql(cql_query, limit=limit)
+            results = await asyncio.to_thread(self.client.cql, cql_query, limit=limit)
             pages = []
 
             for result in results.get("results", []):
@@ -126,11 +175,19 @@ class ConfluenceService:
 
         Returns:
             Page dict with id, title, url or None if not found
+
+        Found pages are cached for FAMILY_PAGE_CACHE_TTL seconds; misses are
+        not cached so a newly labelled page is picked up straight away.
         """
         # Convert to slug format for label
         slug = self._to_slug(family_of_parts)
         label = f"family-of-parts-{slug}"
 
+        cached = self._family_page_cache.get(label)
+        if cached and cached[0] > time.monotonic():
+            self._family_page_cache.move_to_end(label)
+            return cached[1]
+
         cql = f'space = "{self.space_key}" AND label = "{label}" AND type = page'
         logger.info(f"Searching for Family of Parts page with label: {label}")
 
@@ -140,6 +197,13 @@ class ConfluenceService:
             logger.info(
                 f"Found Family of Parts page: {pages[0]['title']} ({pages[0]['id']})"
             )
+            self._family_page_cache[label] = (
+                time.monotonic() + FAMILY_PAGE_CACHE_TTL,
+                pages[0],
+            )
+            self._family_page_cache.move_to_end(label)
+            if len(self._family_page_cache) > FAMILY_PAGE_CACHE_SIZE:
+                self._family_page_cache.popitem(last=False)
             return pages[0]
 
         logger.warning(f"No Family of Parts page found with label: {label}")
@@ -168,7 +232,8 @@ class ConfluenceService:
         space = space_key or self.space_key
 
         try:
-            result = self.client.create_page(
+            result = await asyncio.to_thread(
+                self.client.create_page,
                 space=space,
                 title=title,
                 body=content,
@@ -210,11 +275,16 @@ class ConfluenceService:
         self._ensure_client()
 
         try:
-            result = self.client.update_page(
-                page_id=page_id, title=title, body=content, representation="storage"
+            result = await asyncio.to_thread(
+                self.client.update_page,
+                page_id=page_id,
+                title=title,
+                body=content,
+                representation="storage",
             )
 
             page_url = self._build_page_url(result)
+            self.invalidate_page_text(page_id)
 
             logger.info(f"Updated Confluence page: {title} ({page_id})")
 
@@ -242,8 +312,12 @@ class ConfluenceService:
         self._ensure_client()
 
         try:
-            result = self.client.get_page_by_id(
-                page_id=page_id, expand="body.storage,version"
+            # Run the blocking REST call in a worker thread so concurrent
+            # fetches (e.g. ancestor context) can overlap
+            result = await asyncio.to_thread(
+                self.client.get_page_by_id,
+                page_id=page_id,
+                expand="body.storage,version",
             )
 
             if result:
@@ -271,10 +345,12 @@ class ConfluenceService:
         Returns:
             Confluence storage format HTML string
         """
-        html_parts = []
+        return "\n".join(self._iter_plan_storage(plan))
 
+    def _iter_plan_storage(self, plan: Dict[str, Any]) -> Iterator[str]:
+        """Yield the plan page body one block at a time; the caller joins once"""
         # Header with metadata
-        html_parts.append(f"""
+        yield f"""
 <ac:structured-macro ac:name="info">
   <ac:rich-text-body>
     <p><strong>Customer:</strong> {self._escape_html(plan.get('customer', 'Unknown'))}</p>
@@ -282,206 +358,164 @@ class ConfluenceService:
     <p><strong>Generated:</strong> {plan.get('generated_at', 'Unknown')}</p>
   </ac:rich-text-body>
 </ac:structured-macro>
-""")
+"""
 
         # Keys to Project
-        html_parts.append(
-            self._render_section("Keys to Project", plan.get("keys_to_project", []))
-        )
+        yield self._render_section("Keys to Project", plan.get("keys_to_project", []))
 
         # Quality Plan
         quality = plan.get("quality_plan", {})
-        html_parts.append("<h2>Quality Plan</h2>")
+        yield "<h2>Quality Plan</h2>"
         if quality.get("control_plan_items"):
-            html_parts.append(
-                self._render_subsection(
-                    "Control Plan Items", quality["control_plan_items"]
-                )
+            yield self._render_subsection(
+                "Control Plan Items", quality["control_plan_items"]
             )
         if quality.get("inspection_strategy"):
-            html_parts.append(
-                self._render_subsection(
-                    "Inspection Strategy", quality["inspection_strategy"]
-                )
+            yield self._render_subsection(
+                "Inspection Strategy", quality["inspection_strategy"]
             )
         if quality.get("quality_metrics"):
-            html_parts.append(
-                self._render_subsection("Quality Metrics", quality["quality_metrics"])
-            )
+            yield self._render_subsection("Quality Metrics", quality["quality_metrics"])
         if quality.get("ppap_requirements"):
-            html_parts.append(
-                self._render_subsection(
-                    "PPAP Requirements", quality["ppap_requirements"]
-                )
+            yield self._render_subsection(
+                "PPAP Requirements", quality["ppap_requirements"]
             )
 
         # Purchasing
         purchasing = plan.get("purchasing", {})
-        html_parts.append("<h2>Purchasing</h2>")
+        yield "<h2>Purchasing</h2>"
         if purchasing.get("raw_materials"):
-            html_parts.append(
-                self._render_subsection("Raw Materials", purchasing["raw_materials"])
-            )
+            yield self._render_subsection("Raw Materials", purchasing["raw_materials"])
         if purchasing.get("suppliers"):
-            html_parts.append(
-                self._render_subsection("Suppliers", purchasing["suppliers"])
-            )
+            yield self._render_subsection("Suppliers", purchasing["suppliers"])
         if purchasing.get("lead_times"):
-            html_parts.append(
-                self._render_subsection("Lead Times", purchasing["lead_times"])
-            )
+            yield self._render_subsection("Lead Times", purchasing["lead_times"])
         if purchasing.get("cost_estimates"):
-            html_parts.append(
-                self._render_subsection("Cost Estimates", purchasing["cost_estimates"])
+            yield self._render_subsection(
+                "Cost Estimates", purchasing["cost_estimates"]
             )
 
         # History Review
         history = plan.get("history_review", {})
-        html_parts.append("<h2>History Review</h2>")
+        yield "<h2>History Review</h2>"
         if history.get("previous_projects"):
-            html_parts.append(
-                self._render_subsection(
-                    "Previous Projects", history["previous_projects"]
-                )
+            yield self._render_subsection(
+                "Previous Projects", history["previous_projects"]
             )
         if history.get("lessons_learned"):
-            html_parts.append(
-                self._render_subsection("Lessons Learned", history["lessons_learned"])
-            )
+            yield self._render_subsection("Lessons Learned", history["lessons_learned"])
         if history.get("recurring_issues"):
-            html_parts.append(
-                self._render_subsection("Recurring Issues", history["recurring_issues"])
+            yield self._render_subsection(
+                "Recurring Issues", history["recurring_issues"]
             )
 
         # Build Strategy
         build = plan.get("build_strategy", {})
-        html_parts.append("<h2>Build Strategy</h2>")
+        yield "<h2>Build Strategy</h2>"
         if build.get("manufacturing_process"):
-            html_parts.append(
-                self._render_subsection(
-                    "Manufacturing Process", build["manufacturing_process"]
-                )
+            yield self._render_subsection(
+                "Manufacturing Process", build["manufacturing_process"]
             )
         if build.get("tooling_requirements"):
-            html_parts.append(
-                self._render_subsection(
-                    "Tooling Requirements", build["tooling_requirements"]
-                )
+            yield self._render_subsection(
+                "Tooling Requirements", build["tooling_requirements"]
             )
         if build.get("capacity_planning"):
-            html_parts.append(
-                self._render_subsection("Capacity Planning", build["capacity_planning"])
+            yield self._render_subsection(
+                "Capacity Planning", build["capacity_planning"]
             )
         if build.get("make_vs_buy_decisions"):
-            html_parts.append(
-                self._render_subsection(
-                    "Make vs. Buy Decisions", build["make_vs_buy_decisions"]
-                )
+            yield self._render_subsection(
+                "Make vs. Buy Decisions", build["make_vs_buy_decisions"]
             )
 
         # Execution Strategy
         execution = plan.get("execution_strategy", {})
-        html_parts.append("<h2>Execution Strategy</h2>")
+        yield "<h2>Execution Strategy</h2>"
         if execution.get("timeline"):
-            html_parts.append(
-                self._render_subsection("Timeline", execution["timeline"])
-            )
+            yield self._render_subsection("Timeline", execution["timeline"])
         if execution.get("milestones"):
-            html_parts.append(
-                self._render_subsection("Milestones", execution["milestones"])
-            )
+            yield self._render_subsection("Milestones", execution["milestones"])
         if execution.get("resource_allocation"):
-            html_parts.append(
-                self._render_subsection(
-                    "Resource Allocation", execution["resource_allocation"]
-                )
+            yield self._render_subsection(
+                "Resource Allocation", execution["resource_allocation"]
             )
         if execution.get("risk_mitigation"):
-            html_parts.append(
-                self._render_subsection("Risk Mitigation", execution["risk_mitigation"])
+            yield self._render_subsection(
+                "Risk Mitigation", execution["risk_mitigation"]
             )
 
         # Release Plan
         release = plan.get("release_plan", {})
-        html_parts.append("<h2>Release Plan</h2>")
+        yield "<h2>Release Plan</h2>"
         if release.get("release_criteria"):
-            html_parts.append(
-                self._render_subsection("Release Criteria", release["release_criteria"])
+            yield self._render_subsection(
+                "Release Criteria", release["release_criteria"]
             )
         if release.get("validation_steps"):
-            html_parts.append(
-                self._render_subsection("Validation Steps", release["validation_steps"])
+            yield self._render_subsection(
+                "Validation Steps", release["validation_steps"]
             )
         if release.get("production_ramp"):
-            html_parts.append(
-                self._render_subsection("Production Ramp", release["production_ramp"])
-            )
+            yield self._render_subsection("Production Ramp", release["production_ramp"])
 
         # Shipping
         shipping = plan.get("shipping", {})
-        html_parts.append("<h2>Shipping</h2>")
+        yield "<h2>Shipping</h2>"
         if shipping.get("packaging_requirements"):
-            html_parts.append(
-                self._render_subsection(
-                    "Packaging Requirements", shipping["packaging_requirements"]
-                )
+            yield self._render_subsection(
+                "Packaging Requirements", shipping["packaging_requirements"]
             )
         if shipping.get("shipping_methods"):
-            html_parts.append(
-                self._render_subsection(
-                    "Shipping Methods", shipping["shipping_methods"]
-                )
+            yield self._render_subsection(
+                "Shipping Methods", shipping["shipping_methods"]
             )
         if shipping.get("delivery_schedule"):
-            html_parts.append(
-                self._render_subsection(
-                    "Delivery Schedule", shipping["delivery_schedule"]
-                )
+            yield self._render_subsection(
+                "Delivery Schedule", shipping["delivery_schedule"]
             )
 
         # Action Items
         asana_todos = plan.get("asana_todos", [])
         if asana_todos:
-            html_parts.append("<h2>Action Items</h2>")
-            html_parts.append(self._render_action_items(asana_todos))
+            yield "<h2>Action Items</h2>"
+            yield self._render_action_items(asana_todos)
 
         # Notes
         apqp_notes = plan.get("apqp_notes", [])
         if apqp_notes:
-            html_parts.append("<h2>APQP Notes</h2>")
-            html_parts.append(self._render_notes(apqp_notes))
+            yield "<h2>APQP Notes</h2>"
+            yield self._render_notes(apqp_notes)
 
         meeting_notes = plan.get("customer_meeting_notes", [])
         if meeting_notes:
-            html_parts.append("<h2>Customer Meeting Notes</h2>")
-            html_parts.append(self._render_notes(meeting_notes))
+            yield "<h2>Customer Meeting Notes</h2>"
+            yield self._render_notes(meeting_notes)
 
         # Footer
-        html_parts.append("""
+        yield """
 <hr/>
 <p><em>Generated by Strategic Build Planner - Northern Manufacturing Co., Inc.</em></p>
-""")
-
-        return "\n".join(html_parts)
+"""
 
     def _render_section(self, title: str, key_points: List[Dict]) -> str:
         """Render a main section with key points"""
-        html = f"<h2>{self._escape_html(title)}</h2>\n"
-        html += self._render_key_points(key_points)
-        return html
+        return f"<h2>{self._escape_html(title)}</h2>\n" + self._render_key_points(
+            key_points
+        )
 
     def _render_subsection(self, title: str, key_points: List[Dict]) -> str:
         """Render a subsection with key points"""
-        html = f"<h3>{self._escape_html(title)}</h3>\n"
-        html += self._render_key_points(key_points)
-        return html
+        return f"<h3>{self._escape_html(title)}</h3>\n" + self._render_key_points(
+            key_points
+        )
 
     def _render_key_points(self, key_points: List[Dict]) -> str:
         """Render a list of key points as HTML"""
         if not key_points:
             return "<p><em>No items recorded.</em></p>\n"
 
-        html = "<ul>\n"
+        parts = ["<ul>\n"]
         for kp in key_points:
             text = self._escape_html(kp.get("text", ""))
             confidence = kp.get("confidence", 0)
@@ -495,11 +529,13 @@ class ConfluenceService:
             else:
                 status = "Red"
 
-            html += f"""<li>
+            parts.append(
+                f"""<li>
   <ac:structured-macro ac:name="status">
     <ac:parameter ac:name="colour">{status}</ac:parameter>
   </ac:structured-macro>
   {text}"""
+            )
 
             # Add source hint if available
             source = kp.get("source_hint")
@@ -512,16 +548,18 @@ class ConfluenceService:
                 if source.get("section"):
                     source_parts.append(f"§{source['section']}")
                 if source_parts:
-                    html += f" <em>({', '.join(source_parts)} - {confidence:.0%})</em>"
+                    parts.append(
+                        f" <em>({', '.join(source_parts)} - {confidence:.0%})</em>"
+                    )
 
-            html += "</li>\n"
+            parts.append("</li>\n")
 
-        html += "</ul>\n"
-        return html
+        parts.append("</ul>\n")
+        return "".join(parts)
 
     def _render_action_items(self, tasks: List[Dict]) -> str:
         """Render action items as a task list"""
-        html = "<ac:task-list>\n"
+        parts = ["<ac:task-list>\n"]
 
         for task in tasks:
             title = self._escape_html(task.get("title", "Task"))
@@ -532,43 +570,48 @@ class ConfluenceService:
                 priority, "MEDIUM"
             )
 
-            html += f"""<ac:task>
+            parts.append(
+                f"""<ac:task>
   <ac:task-status>incomplete</ac:task-status>
   <ac:task-body><strong>[{priority_label}]</strong> {title}"""
+            )
 
             if description:
-                html += f" - {description}"
+                parts.append(f" - {description}")
 
             if task.get("assignee_hint"):
-                html += f" <em>(@{self._escape_html(task['assignee_hint'])})</em>"
+                parts.append(f" <em>(@{self._escape_html(task['assignee_hint'])})</em>")
 
             if task.get("due_date_hint"):
-                html += f" <em>(Due: {self._escape_html(task['due_date_hint'])})</em>"
+                parts.append(
+                    f" <em>(Due: {self._escape_html(task['due_date_hint'])})</em>"
+                )
 
-            html += "</ac:task-body>\n</ac:task>\n"
+            parts.append("</ac:task-body>\n</ac:task>\n")
 
-        html += "</ac:task-list>\n"
-        return html
+        parts.append("</ac:task-list>\n")
+        return "".join(parts)
 
     def _render_notes(self, notes: List[Dict]) -> str:
         """Render notes section"""
-        html = ""
+        parts = []
         for note in notes:
             timestamp = note.get("timestamp", "")
             content = self._escape_html(note.get("content", ""))
 
             if timestamp:
-                html += f"<p><strong>{timestamp}</strong></p>\n"
-            html += f"<p>{content}</p>\n"
+                parts.append(f"<p><strong>{timestamp}</strong></p>\n")
+            parts.append(f"<p>{content}</p>\n")
 
             action_items = note.get("action_items", [])
             if action_items:
-                html += "<ul>\n"
-                for item in action_items:
-                    html += f"<li>{self._escape_html(item)}</li>\n"
-                html += "</ul>\n"
+                parts.append("<ul>\n")
+                parts.extend(
+                    f"<li>{self._escape_html(item)}</li>\n" for item in action_items
+                )
+                parts.append("</ul>\n")
 
-        return html
+        return "".join(parts)
 
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters"""
@@ -586,9 +629,9 @@ class ConfluenceService:
     def _to_slug(self, text: str) -> str:
         """Convert text to URL-friendly slug"""
         slug = text.lower().strip()
-        slug = re.sub(r"[^\w\s-]", "", slug)
-        slug = re.sub(r"[\s_]+", "-", slug)
-        slug = re.sub(r"-+", "-", slug)
+        slug = _SLUG_STRIP_RE.sub("", slug)
+        slug = _SLUG_SEPARATOR_RE.sub("-", slug)
+        slug = _SLUG_DASHES_RE.sub("-", slug)
         return slug.strip("-")
 
     def checklist_to_confluence_storage(self, checklist: Dict[str, Any]) -> str:
@@ -601,10 +644,17 @@ class ConfluenceService:
         Returns:
             Confluence storage format HTML string
         """
-        html_parts = []
+        return "\n".join(self._iter_checklist_storage(checklist))
+
+    def _iter_checklist_storage(self, checklist: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the checklist page body one block at a time.
 
+        Each block is built independently so large checklists never go
+        through repeated string concatenation; the caller joins once.
+        """
         # Header with project info
-        html_parts.append(f"""
+        yield f"""
 <ac:structured-macro ac:name="info">
   <ac:rich-text-body>
     <p><strong>Project:</strong> {self._escape_html(checklist.get('project_name', 'Unknown'))}</p>
@@ -612,11 +662,11 @@ class ConfluenceService:
     <p><strong>Generated:</strong> {checklist.get('created_at', 'Unknown')}</p>
   </ac:rich-text-body>
 </ac:structured-macro>
-""")
+"""
 
         # Statistics summary
         stats = checklist.get("statistics", {})
-        html_parts.append(f"""
+        yield f"""
 <ac:structured-macro ac:name="panel">
   <ac:parameter ac:name="title">Checklist Summary</ac:parameter>
   <ac:rich-text-body>
@@ -636,7 +686,7 @@ class ConfluenceService:
     </table>
   </ac:rich-text-body>
 </ac:structured-macro>
-""")
+"""
 
         # Resolution Summary (if resolutions were applied)
         resolution_summary = checklist.get("resolution_summary", {})
@@ -644,7 +694,7 @@ class ConfluenceService:
             checklist.get("resolutions_applied")
             or resolution_summary.get("total_resolved", 0) > 0
         ):
-            html_parts.append(f"""
+            yield f"""
 <ac:structured-macro ac:name="panel">
   <ac:parameter ac:name="title">Quote Comparison Resolutions</ac:parameter>
   <ac:parameter ac:name="bgColor">#e3fcef</ac:parameter>
@@ -671,20 +721,18 @@ class ConfluenceService:
     </table>
   </ac:rich-text-body>
 </ac:structured-macro>
-""")
+"""
 
         # Render each category
         for category in checklist.get("categories", []):
-            html_parts.append(self._render_checklist_category(category))
+            yield self._render_checklist_category(category)
 
         # Footer
-        html_parts.append("""
+        yield """
 <hr/>
 <p><em>Pre-Meeting Checklist generated by Strategic Build Planner - Northern Manufacturing Co., Inc.</em></p>
 <p><em>Review all items during the APQP kickoff meeting and update as decisions are made.</em></p>
-""")
-
-        return "\n".join(html_parts)
+"""
 
     # =========================================================================
     # Template Filling Methods (for updating existing pages with checklist data)
@@ -1354,39 +1402,70 @@ class ConfluenceService:
 
         Returns:
             Plain text content extracted from Confluence storage format
+
+        Results are cached for PAGE_TEXT_CACHE_TTL seconds; pages updated
+        through this service are evicted immediately.
         """
+        cached = self._page_text_cache.get(page_id)
+        if cached and cached[0] > time.monotonic():
+            self._page_text_cache.move_to_end(page_id)
+            return cached[1]
+
         page = await self.get_page(page_id)
         if not page:
             return None
 
-        # Strip HTML tags from storage format
-        html_content = page.get("content", "")
+        text = self.storage_to_text(page.get("content", ""))
+        self._page_text_cache[page_id] = (time.monotonic() + PAGE_TEXT_CACHE_TTL, text)
+        self._page_text_cache.move_to_end(page_id)
+        if len(self._page_text_cache) > PAGE_TEXT_CACHE_SIZE:
+            self._page_text_cache.popitem(last=False)
+        return text
+
+    def invalidate_page_text(self, page_id: str) -> None:
+        """Drop a page from the plain-text cache after it has been written"""
+        self._page_text_cache.pop(page_id, None)
+
+    def invalidate_family_page(self, family_of_parts: str) -> None:
+        """Drop a cached Family of Parts lookup (e.g. the page was moved or deleted)"""
+        self._family_page_cache.pop(
+            f"family-of-parts-{self._to_slug(family_of_parts)}", None
+        )
+
+    def storage_to_text(self, html_content: str) -> str:
+        """Strip Confluence storage format (HTML) down to plain text"""
         # Basic HTML stripping - could be enhanced with BeautifulSoup
-        text = re.sub(r"<[^>]+>", " ", html_content)
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _HTML_TAG_RE.sub(" ", html_content)
+        text = _WHITESPACE_RE.sub(" ", text).strip()
         return text
 
     def _render_checklist_category(self, category: Dict[str, Any]) -> str:
         """Render a checklist category as HTML"""
-        html = f"<h2>{self._escape_html(category.get('name', 'Category'))}</h2>\n"
+        heading = f"<h2>{self._escape_html(category.get('name', 'Category'))}</h2>\n"
 
         items = category.get("items", [])
         if not items:
-            html += "<p><em>No items in this category.</em></p>\n"
-            return html
+            return heading + "<p><em>No items in this category.</em></p>\n"
 
         # Count requirements found
         found = sum(1 for i in items if i.get("status") == "requirement_found")
-        html += f"<p><em>{found} of {len(items)} requirements found</em></p>\n"
+        parts = [
+            heading,
+            f"<p><em>{found} of {len(items)} requirements found</em></p>\n",
+        ]
 
         # Check if any items have resolutions
         has_resolutions = any(item.get("resolution") for item in items)
 
-        html += "<table>\n"
+        parts.append("<table>\n")
         if has_resolutions:
-            html += "<tr><th>Status</th><th>Question</th><th>Answer</th><th>Source</th><th>Resolution</th></tr>\n"
+            parts.append(
+                "<tr><th>Status</th><th>Question</th><th>Answer</th><th>Source</th><th>Resolution</th></tr>\n"
+            )
         else:
-            html += "<tr><th>Status</th><th>Question</th><th>Answer</th><th>Source</th></tr>\n"
+            parts.append(
+                "<tr><th>Status</th><th>Question</th><th>Answer</th><th>Source</th></tr>\n"
+            )
 
         for item in items:
             status = item.get("status", "unknown")
@@ -1411,9 +1490,19 @@ class ConfluenceService:
                     res_html = f'<ac:structured-macro ac:name="status"><ac:parameter ac:name="colour">Blue</ac:parameter><ac:parameter ac:name="title">{self._escape_html(res_type)}</ac:parameter></ac:structured-macro><br/><small>{self._escape_html(res_note)}</small>'
                 else:
                     res_html = ""
-                html += f"<tr><td>{status_html}</td><td><strong>{question}</strong></td><td>{answer}</td><td><em>{source}</em></td><td>{res_html}</td></tr>\n"
+                parts.append(
+                    f"<tr><td>{status_html}</td><td><strong>{question}</strong></td><td>{answer}</td><td><em>{source}</em></td><td>{res_html}</td></tr>\n"
+                )
             else:
-                html += f"<tr><td>{status_html}</td><td><strong>{question}</strong></td><td>{answer}</td><td><em>{source}</em></td></tr>\n"
+                parts.append(
+                    f"<tr><td>{status_html}</td><td><strong>{question}</strong></td><td>{answer}</td><td><em>{source}</em></td></tr>\n"
+                )
+
+        parts.append("</table>\n")
+        return "".join(parts)
+
 
-        html += "</table>\n"
-        return html
+@lru_cache(maxsize=1)
+def get_confluence_service() -> ConfluenceService:
+    """Process-wide ConfluenceService, so the HTTP session is reused across requests"""
+    return ConfluenceService()
@@ -4,14 +4,62 @@ Handles PDF, DOCX, and TXT file processing
 """
 
 import io
+import os
+import asyncio
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import BinaryIO, Dict, List, Tuple
 from pathlib import Path
 import PyPDF2
 from docx import Document
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
 logger = logging.getLogger(__name__)
 
+# PDF text backend: "pymupdf" (C engine, much faster on long quotes) or
+# "pypdf2"; PyPDF2 is also used whenever PyMuPDF isn't installed
+PDF_PARSER = os.getenv("PDF_PARSER", "pymupdf").lower()
+
+# Worker processes for DOCX parsing (see extract_text_from_docx)
+DOCX_PARSE_WORKERS = int(
+    os.getenv("DOCX_PARSE_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+
+@lru_cache(maxsize=1)
+def get_docx_executor() -> ProcessPoolExecutor:
+    """Process pool for DOCX parsing, started on first use"""
+    # spawn, not fork: the parent already runs the event loop and thread pools
+    return ProcessPoolExecutor(
+        max_workers=DOCX_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _docx_text(content: bytes) -> str:
+    """Paragraph and table text of a DOCX document (runs in a worker process)"""
+    doc = Document(io.BytesIO(content))
+    text_parts = []
+
+    # Extract paragraphs
+    for para in doc.paragraphs:
+        if para.text.strip():
+            text_parts.append(para.text)
+
+    # Extract tables
+    for table in doc.tables:
+        for row in table.rows:
+            row_text = " | ".join(cell.text.strip() for cell in row.cells)
+            if row_text.strip():
+                text_parts.append(row_text)
+
+    return "\n\n".join(text_parts)
+
 
 class DocumentProcessor:
     """Service for processing various document types"""
@@ -49,11 +97,25 @@ class DocumentProcessor:
 
         return True, ""
 
+    @staticmethod
+    def _pdf_page_texts_pymupdf(file: BinaryIO) -> List[str]:
+        """Text of each PDF page, extracted with PyMuPDF"""
+        with fitz.open(stream=file.read(), filetype="pdf") as doc:
+            return [page.get_text("text") for page in doc]
+
+    @staticmethod
+    def _pdf_page_texts_pypdf2(file: BinaryIO) -> List[str]:
+        """Text of each PDF page, extracted with PyPDF2"""
+        return [page.extract_text() for page in PyPDF2.PdfReader(file).pages]
+
     @staticmethod
     async def extract_text_from_pdf(file: BinaryIO, filename: str) -> str:
         """
         Extract text from PDF file
 
+        Parsing is CPU-bound, so it runs in a worker thread to keep the
+        event loop serving other requests meanwhile.
+
         Args:
             file: File object (binary mode)
             filename: Original filename (for logging)
@@ -61,18 +123,28 @@ class DocumentProcessor:
         Returns:
             Extracted text
         """
+        return await asyncio.to_thread(
+            DocumentProcessor._extract_text_from_pdf_sync, file, filename
+        )
+
+    @staticmethod
+    def _extract_text_from_pdf_sync(file: BinaryIO, filename: str) -> str:
+        """Blocking PDF extraction behind extract_text_from_pdf"""
         try:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text_parts = []
+            if fitz is not None and PDF_PARSER == "pymupdf":
+                page_texts = DocumentProcessor._pdf_page_texts_pymupdf(file)
+            else:
+                page_texts = DocumentProcessor._pdf_page_texts_pypdf2(file)
 
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                text = page.extract_text()
-                if text.strip():
-                    text_parts.append(f"--- Page {page_num} ---\n{text}")
+            text_parts = [
+                f"--- Page {page_num} ---\n{text}"
+                for page_num, text in enumerate(page_texts, 1)
+                if text.strip()
+            ]
 
             extracted_text = "\n\n".join(text_parts)
             logger.info(
-                f"Extracted {len(extracted_text)} characters from PDF: {filename} ({len(pdf_reader.pages)} pages)"
+                f"Extracted {len(extracted_text)} characters from PDF: {filename} ({len(page_texts)} pages)"
             )
 
             return extracted_text
@@ -86,6 +158,9 @@ class DocumentProcessor:
         """
         Extract text from DOCX file
 
+        python-docx is pure Python and holds the GIL for the whole parse, so
+        it runs in a separate process rather than a worker thread.
+
         Args:
             file: File object (binary mode)
             filename: Original filename (for logging)
@@ -94,22 +169,10 @@ class DocumentProcessor:
             Extracted text
         """
         try:
-            doc = Document(file)
-            text_parts = []
-
-            # Extract paragraphs
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    text_parts.append(para.text)
-
-            # Extract tables
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = " | ".join(cell.text.strip() for cell in row.cells)
-                    if row_text.strip():
-                        text_parts.append(row_text)
-
-            extracted_text = "\n\n".join(text_parts)
+            content = file.read()
+            extracted_text = await asyncio.get_running_loop().run_in_executor(
+                get_docx_executor(), _docx_text, content
+            )
             logger.info(
                 f"Extracted {len(extracted_text)} characters from DOCX: {filename}"
             )
@@ -8,7 +8,7 @@ import logging
 from typing import List, Dict, Any, Optional
 from openai import AsyncOpenAI
 
-from app.services.confluence import ConfluenceService
+from app.services.confluence import get_confluence_service
 from app.prompts.lessons_prompt import LESSONS_SYSTEM_PROMPT, build_lessons_prompt
 
 logger = logging.getLogger(__name__)
@@ -27,7 +27,7 @@ class LessonsService:
                 "Set OPENAI_API_KEY environment variable to enable lessons extraction."
             )
             self.openai_client = None
-        self.confluence_service = ConfluenceService()
+        self.confluence_service = get_confluence_service()
         self.model = os.getenv("OPENAI_LESSONS_MODEL", "gpt-4o")
         self.max_content_tokens = 8000  # Truncate content to avoid token limits
 
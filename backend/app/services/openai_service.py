@@ -3,14 +3,31 @@ OpenAI Service - Vector Store and Responses API Integration
 """
 
 import os
+import json
+import time
+import asyncio
 import logging
-from typing import List, Optional, BinaryIO
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, BinaryIO
 from datetime import datetime, timedelta
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, AsyncStream, DefaultAsyncHttpxClient, OpenAI
 from openai.types.beta import VectorStore
+from openai.types.chat import ChatCompletionChunk
+
+try:
+    import h2  # HTTP/2 support for httpx
+except ImportError:
+    h2 = None
 
 logger = logging.getLogger(__name__)
 
+# Caps in-flight chat completions across routers so bursts stay under the
+# account's RPM limit instead of failing with 429s
+openai_chat_semaphore = asyncio.Semaphore(
+    int(os.getenv("OPENAI_MAX_CONCURRENCY", "10"))
+)
+
 
 class OpenAIService:
     """Service for managing OpenAI Vector Stores and Responses API calls"""
@@ -33,8 +50,6 @@ class OpenAIService:
         Returns:
             VectorStore object with ID
         """
-        import time
-
         try:
             # Calculate expiration (auto-delete after TTL days)
             expires_after_days = self.vector_store_ttl_days
@@ -113,8 +128,10 @@ class OpenAIService:
             File ID string
         """
         try:
-            uploaded_file = self.client.files.create(
-                file=(filename, file), purpose=purpose
+            # Blocking SDK call - run in a worker thread so several uploads
+            # can be in flight at once
+            uploaded_file = await asyncio.to_thread(
+                self.client.files.create, file=(filename, file), purpose=purpose
             )
 
             logger.info(f"Uploaded file: {filename} -> {uploaded_file.id}")
@@ -180,8 +197,6 @@ class OpenAIService:
         Returns:
             Generated plan as dictionary (parsed JSON)
         """
-        import json
-
         try:
             # Use Chat Completions API with file_search tool
             logger.info(f"Generating plan with model: {self.model}")
@@ -244,3 +259,54 @@ class OpenAIService:
         except Exception as e:
             logger.error(f"Failed to list Vector Stores: {str(e)}")
             raise
+
+
+@lru_cache(maxsize=1)
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Process-wide AsyncOpenAI client, so the connection pool is reused across requests
+
+    With h2 installed, concurrent calls are multiplexed over HTTP/2 on a few
+    connections instead of each holding its own socket and TLS session.
+    """
+    return AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=DefaultAsyncHttpxClient(
+            http2=h2 is not None,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        ),
+    )
+
+
+async def iter_chat_stream(
+    stream: AsyncStream[ChatCompletionChunk],
+) -> AsyncIterator[str]:
+    """
+    Yield the text deltas of a streamed chat completion as they arrive
+
+    The stream is closed if the caller stops early, e.g. when an SSE client
+    disconnects, so the model stops generating for nobody.
+    """
+    finish_reason = None
+    async with stream:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            if choice.delta.content:
+                yield choice.delta.content
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+
+    if finish_reason == "length":
+        logger.warning("Streamed completion hit max_tokens; output is truncated")
+
+
+async def collect_chat_stream(stream: AsyncStream[ChatCompletionChunk]) -> str:
+    """
+    Drain a streamed chat completion into its full message text
+
+    Deltas are consumed as they arrive, so the response body is read while
+    the model is still generating rather than in one piece at the end.
+    """
+    return "".join([delta async for delta in iter_chat_stream(stream)])
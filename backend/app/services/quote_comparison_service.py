@@ -13,22 +13,132 @@ Workflow:
 """
 
 import os
+import re
 import json
+import time
+import hashlib
 import logging
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
 
-from openai import OpenAI
+import orjson
+
+from app.services.openai_service import get_async_openai_client, openai_chat_semaphore
 
 logger = logging.getLogger(__name__)
 
+# Model replies by prompt hash. Vendors often re-send the same quote while a
+# job is being iterated on, and extract/compare prompts are built only from
+# the quote text and checklist, so an identical prompt can reuse the reply
+QUOTE_CACHE_SIZE = 128
+QUOTE_CACHE_TTL = float(os.getenv("QUOTE_CACHE_TTL", "3600"))
+
+# Checklist requirements rendered for the compare prompt, by checklist hash;
+# one checklist is usually compared against several vendors' quotes in a row
+CHECKLIST_CONTEXT_CACHE_SIZE = 32
+
+# Long quotes can be cut down to their header (vendor, quote number) plus the
+# spans around assumption/exclusion language before extraction; most of the
+# rest is pricing tables, terms and boilerplate the prompt doesn't need. Off
+# by default: a vendor that words its notes differently loses them entirely
+QUOTE_COMPACT_ENABLED = os.getenv("QUOTE_COMPACT_ENABLED", "false").lower() == "true"
+QUOTE_COMPACT_MIN_CHARS = 12000
+QUOTE_HEADER_CHARS = 2000
+QUOTE_CONTEXT_CHARS = 200
+# A section runs to the next all-caps heading, but never less than the min
+# (notes often carry their own MATERIAL/WELDING sub-headings) or over the max
+QUOTE_SECTION_MIN_CHARS = 2000
+QUOTE_SECTION_MAX_CHARS = 6000
+# Below this much matched text the keywords probably missed the real notes
+# section, so the full quote is sent instead
+QUOTE_MIN_SELECTED_CHARS = 500
+_ASSUMPTION_KEYWORD_RE = re.compile(
+    r"\b(?:assumptions?|important notes?|clarifications?|exclusions?|qualifications?)\b",
+    re.IGNORECASE,
+)
+_SECTION_HEADING_RE = re.compile(r"\n[A-Z][A-Z0-9 &/,.()-]{5,}\n")
+
+
+def _compact_quote_text(quote_text: str) -> str:
+    """Quote text reduced to its header and assumption sections, if enabled and long"""
+    if not QUOTE_COMPACT_ENABLED or len(quote_text) < QUOTE_COMPACT_MIN_CHARS:
+        return quote_text
+
+    spans = [[0, QUOTE_HEADER_CHARS]]
+    for match in _ASSUMPTION_KEYWORD_RE.finditer(quote_text, QUOTE_HEADER_CHARS):
+        start = match.start() - QUOTE_CONTEXT_CHARS
+        heading = _SECTION_HEADING_RE.search(
+            quote_text, match.end() + QUOTE_SECTION_MIN_CHARS
+        )
+        end = min(
+            heading.start() if heading else len(quote_text),
+            match.end() + QUOTE_SECTION_MAX_CHARS,
+        )
+        if start <= spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+
+    selected = sum(end - start for start, end in spans) - QUOTE_HEADER_CHARS
+    if selected < QUOTE_MIN_SELECTED_CHARS:
+        return quote_text
+
+    compacted = "\n[...]\n".join(quote_text[start:end] for start, end in spans)
+    logger.info(
+        f"Compacted quote text from {len(quote_text)} to {len(compacted)} characters"
+    )
+    return compacted
+
 
 class QuoteComparisonService:
     """Service for comparing vendor quotes against customer requirements"""
 
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.model = os.getenv("OPENAI_MODEL_PLAN", "gpt-4o")
+        # prompt hash -> (expires_at, raw JSON reply), oldest first
+        self._completion_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        # checklist hash -> (requirement count, rendered JSON), oldest first
+        self._checklist_context_cache: "OrderedDict[str, Tuple[int, str]]" = (
+            OrderedDict()
+        )
+
+    async def _complete_json(self, prompt: str) -> Dict[str, Any]:
+        """
+        Run one JSON-mode completion on the shared async client
+
+        Awaiting the async client keeps the event loop free while the model
+        works, so concurrent quote workflows overlap instead of queueing
+        behind each other; the shared semaphore keeps them under the rate
+        limit alongside the meeting and QA routers.
+
+        Replies are cached on an exact hash of model and prompt, and parsed
+        fresh on every call so callers can annotate the result freely.
+        """
+        key = hashlib.blake2b(
+            f"{self.model}\n{prompt}".encode(), digest_size=16
+        ).hexdigest()
+        cached = self._completion_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._completion_cache.move_to_end(key)
+            logger.info("Reusing cached quote analysis for identical input")
+            return json.loads(cached[1])
+
+        async with openai_chat_semaphore:
+            response = await get_async_openai_client().chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.1,
+                response_format={"type": "json_object"},
+            )
+        content = response.choices[0].message.content
+        result = json.loads(content)
+
+        self._completion_cache[key] = (time.monotonic() + QUOTE_CACHE_TTL, content)
+        self._completion_cache.move_to_end(key)
+        if len(self._completion_cache) > QUOTE_CACHE_SIZE:
+            self._completion_cache.popitem(last=False)
+        return result
 
     async def extract_quote_assumptions(
         self, quote_text: str, project_name: Optional[str] = None
@@ -51,7 +161,7 @@ and requirements stated by the vendor.
 Project: {project_name or 'Unknown'}
 
 QUOTE DOCUMENT:
-{quote_text}
+{_compact_quote_text(quote_text)}
 
 Extract and categorize all vendor assumptions into these categories:
 1. Material Standards - specifications, country of origin, certifications
@@ -83,14 +193,7 @@ Be thorough - capture ALL assumptions, even implied ones. If the quote states
 specific standards (AWS, ASME, ASTM, etc.), include those."""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                response_format={"type": "json_object"},
-            )
-
-            result = json.loads(response.choices[0].message.content)
+            result = await self._complete_json(prompt)
             result["extracted_at"] = datetime.utcnow().isoformat()
             result["project_name"] = project_name
 
@@ -103,6 +206,45 @@ specific standards (AWS, ASME, ASTM, etc.), include those."""
             logger.error(f"Failed to extract quote assumptions: {str(e)}")
             raise
 
+    def _checklist_context(self, checklist: Dict[str, Any]) -> Tuple[int, str]:
+        """
+        Found requirements of a checklist, rendered for the compare prompt
+
+        Returns (requirement count, JSON text). Cached on the checklist's
+        categories, so comparing several quotes against one checklist keeps
+        an identical prompt prefix and skips re-rendering it.
+        """
+        categories = checklist.get("categories", [])
+        key = hashlib.blake2b(
+            orjson.dumps(categories, option=orjson.OPT_SORT_KEYS, default=str),
+            digest_size=16,
+        ).hexdigest()
+        cached = self._checklist_context_cache.get(key)
+        if cached is not None:
+            self._checklist_context_cache.move_to_end(key)
+            return cached
+
+        checklist_items = []
+        for category in categories:
+            for item in category.get("items", []):
+                if item.get("status") == "requirement_found":
+                    checklist_items.append(
+                        {
+                            "category_id": category["id"],
+                            "category_name": category["name"],
+                            "prompt_id": item["prompt_id"],
+                            "question": item["question"],
+                            "answer": item["answer"],
+                            "source": item.get("source"),
+                        }
+                    )
+
+        context = (len(checklist_items), json.dumps(checklist_items, indent=2))
+        self._checklist_context_cache[key] = context
+        if len(self._checklist_context_cache) > CHECKLIST_CONTEXT_CACHE_SIZE:
+            self._checklist_context_cache.popitem(last=False)
+        return context
+
     async def compare_with_checklist(
         self,
         quote_assumptions: Dict[str, Any],
@@ -121,25 +263,12 @@ specific standards (AWS, ASME, ASTM, etc.), include those."""
         logger.info("Comparing quote assumptions against checklist requirements")
 
         # Build context from checklist
-        checklist_items = []
-        for category in checklist.get("categories", []):
-            for item in category.get("items", []):
-                if item.get("status") == "requirement_found":
-                    checklist_items.append(
-                        {
-                            "category_id": category["id"],
-                            "category_name": category["name"],
-                            "prompt_id": item["prompt_id"],
-                            "question": item["question"],
-                            "answer": item["answer"],
-                            "source": item.get("source"),
-                        }
-                    )
+        requirement_count, checklist_context = self._checklist_context(checklist)
 
         # Build context from quote
         quote_items = quote_assumptions.get("assumptions", [])
 
-        if not checklist_items and not quote_items:
+        if not requirement_count and not quote_items:
             return {
                 "project_name": checklist.get("project_name"),
                 "comparison_status": "no_data",
@@ -162,7 +291,7 @@ CRITICAL: Only compare items WITHIN THE SAME CATEGORY. Do NOT match items across
 Each item includes a "category" or "category_name" field - use this to ensure same-category matching.
 
 CUSTOMER REQUIREMENTS (from specification documents):
-{json.dumps(checklist_items, indent=2)}
+{checklist_context}
 
 VENDOR QUOTE ASSUMPTIONS:
 {json.dumps(quote_items, indent=2)}
@@ -220,14 +349,7 @@ Focus especially on:
 - Documentation requirements"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                response_format={"type": "json_object"},
-            )
-
-            comparison = json.loads(response.choices[0].message.content)
+            comparison = await self._complete_json(prompt)
 
             # Add metadata
             comparison["project_name"] = checklist.get("project_name")
@@ -304,6 +426,15 @@ Focus especially on:
                 quote_only_by_category[cat] = []
             quote_only_by_category[cat].append(item)
 
+        # Index conflicts and matches by the checklist answer they refer to,
+        # so each item is annotated with one lookup instead of a scan
+        conflicts_by_requirement = self._index_by_requirement(
+            comparison.get("conflicts", [])
+        )
+        matches_by_requirement = self._index_by_requirement(
+            comparison.get("matches", [])
+        )
+
         # Process each category
         for category in checklist.get("categories", []):
             cat_id = category["id"]
@@ -319,20 +450,19 @@ Focus especially on:
             # Copy items with merge annotations
             for item in category.get("items", []):
                 merged_item = {**item}
+                answer = item.get("answer")
 
                 # Check if this item has a conflict
-                for conflict in comparison.get("conflicts", []):
-                    if conflict.get("checklist_requirement") == item.get("answer"):
-                        merged_item["has_conflict"] = True
-                        merged_item["conflict"] = conflict
-                        break
+                conflict = self._lookup_requirement(conflicts_by_requirement, answer)
+                if conflict is not None:
+                    merged_item["has_conflict"] = True
+                    merged_item["conflict"] = conflict
 
                 # Check if this item has a match
-                for match in comparison.get("matches", []):
-                    if match.get("checklist_requirement") == item.get("answer"):
-                        merged_item["has_match"] = True
-                        merged_item["quote_alignment"] = match.get("alignment_notes")
-                        break
+                match = self._lookup_requirement(matches_by_requirement, answer)
+                if match is not None:
+                    merged_item["has_match"] = True
+                    merged_item["quote_alignment"] = match.get("alignment_notes")
 
                 merged_category["items"].append(merged_item)
 
@@ -361,6 +491,27 @@ Focus especially on:
 
         return merged
 
+    @staticmethod
+    def _index_by_requirement(
+        entries: List[Dict[str, Any]],
+    ) -> Dict[Optional[str], Dict[str, Any]]:
+        """Map checklist requirement text to the first entry that cites it"""
+        index: Dict[Optional[str], Dict[str, Any]] = {}
+        for entry in entries:
+            requirement = entry.get("checklist_requirement")
+            if requirement is None or isinstance(requirement, str):
+                index.setdefault(requirement, entry)
+        return index
+
+    @staticmethod
+    def _lookup_requirement(
+        index: Dict[Optional[str], Dict[str, Any]], answer: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Entry citing a checklist answer exactly, if any"""
+        if answer is None or isinstance(answer, str):
+            return index.get(answer)
+        return None
+
     async def apply_resolutions(
         self,
         checklist: Dict[str, Any],
@@ -403,6 +554,12 @@ Focus especially on:
         # Track action items to create
         action_items = []
 
+        # Normalize each conflict's requirement once, not once per item
+        conflict_requirements = [
+            (conflict.get("checklist_requirement") or "").strip().lower()
+            for conflict in conflicts
+        ]
+
         # Track summary statistics
         summary = {
             "total_resolved": 0,
@@ -426,18 +583,13 @@ Focus especially on:
             for item in category.get("items", []):
                 updated_item = {**item}
 
+                # Match by answer text (checklist requirement)
+                # Normalize both strings for comparison (case-insensitive, trim whitespace)
+                item_answer = (item.get("answer") or "").strip().lower()
+
                 # Check if this item has a conflict that was resolved
                 for idx, conflict in enumerate(conflicts):
-                    # Match by answer text (checklist requirement)
-                    # Normalize both strings for comparison (case-insensitive, trim whitespace)
-                    item_answer = (item.get("answer") or "").strip().lower()
-                    conflict_req = (
-                        (conflict.get("checklist_requirement") or "").strip().lower()
-                    )
-
-                    # Also try matching by question if answer doesn't match
-                    item_question = (item.get("question") or "").strip().lower()
-                    conflict_cat = (conflict.get("category") or "").strip().lower()
+                    conflict_req = conflict_requirements[idx]
 
                     # Match if answers match OR if category matches and it's the same requirement
                     is_match = (
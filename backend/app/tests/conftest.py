@@ -0,0 +1,10 @@
+"""
+Pytest configuration for backend unit tests
+
+OpenAI and Confluence are mocked in every test; the key only has to be set
+so the app imports.
+"""
+
+import os
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
@@ -0,0 +1,73 @@
+"""
+In-process stand-in for the OpenAI async client used by the router tests
+"""
+
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+# Chunk size the fake stream splits replies into, small enough that JSON
+# fields are split across deltas the way real streams split them
+STREAM_CHUNK_CHARS = 7
+
+
+def _chunk(content=None, finish_reason=None):
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                delta=SimpleNamespace(content=content), finish_reason=finish_reason
+            )
+        ]
+    )
+
+
+class FakeChatStream:
+    """Async iterable of chat completion chunks, like openai.AsyncStream"""
+
+    def __init__(self, text: str):
+        self._chunks = [_chunk(None)]
+        self._chunks += [
+            _chunk(text[i : i + STREAM_CHUNK_CHARS])
+            for i in range(0, len(text), STREAM_CHUNK_CHARS)
+        ]
+        self._chunks += [_chunk(None, "stop"), SimpleNamespace(choices=[])]
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        self.closed = True
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class FakeChatCompletions:
+    """Answers every create() call with reply(kwargs), streamed if asked"""
+
+    def __init__(self, reply: Callable[[Dict[str, Any]], str]):
+        self.reply = reply
+        self.calls: List[Dict[str, Any]] = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = self.reply(kwargs)
+        if kwargs.get("stream"):
+            return FakeChatStream(content)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+def fake_openai_client(reply: Callable[[Dict[str, Any]], str]) -> SimpleNamespace:
+    """Client whose chat completions come from reply(create_kwargs)"""
+    return SimpleNamespace(chat=SimpleNamespace(completions=FakeChatCompletions(reply)))
+
+
+def user_prompt(kwargs: Dict[str, Any]) -> str:
+    """Last message content of a create() call"""
+    return kwargs["messages"][-1]["content"]
@@ -0,0 +1,153 @@
+"""
+Tests for the batch endpoints: results come back in request order and a
+failing item is reported in place instead of failing the whole batch
+"""
+
+import json
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import checklist as checklist_router
+from app.routers import meeting as meeting_router
+from app.routers import qa as qa_router
+from app.tests.fakes import fake_openai_client, user_prompt
+
+TRANSCRIPT = "John will send the updated drawings to the customer by Friday."
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def _qa_reply(omit_index=None):
+    """Batch replies score each plan by its index; single grades score 5"""
+
+    def reply(kwargs):
+        indexes = [int(i) for i in re.findall(r'"index":(\d+)', user_prompt(kwargs))]
+        if not indexes:
+            return json.dumps({"dimension_scores": {"completeness": 5}})
+        return json.dumps(
+            {
+                "results": [
+                    {"index": i, "dimension_scores": {"completeness": 10 + i}}
+                    for i in indexes
+                    if i != omit_index
+                ]
+            }
+        )
+
+    return reply
+
+
+def test_qa_batch_returns_grades_in_request_order(client, monkeypatch):
+    fake = fake_openai_client(_qa_reply(omit_index=4))
+    monkeypatch.setattr(qa_router, "get_async_openai_client", lambda: fake)
+    plans = [{"project_name": f"P{i}"} for i in range(6)]
+    plans[2] = {"project_name": ""}
+
+    response = client.post(
+        "/api/qa/grade/batch", json={"items": [{"plan_json": p} for p in plans]}
+    )
+
+    assert response.status_code == 200
+    completeness = [g["dimension_scores"]["completeness"] for g in response.json()]
+    # Plan 2 is empty (no model call), plan 4 was left out of its batch reply
+    # and re-graded on its own
+    assert completeness == [10, 11, 0, 13, 5, 15]
+    # Two packed completions for the five non-empty plans, one re-grade
+    assert len(fake.chat.completions.calls) == 3
+
+
+def test_qa_batch_maps_model_failure_to_500(client, monkeypatch):
+    def reply(kwargs):
+        raise RuntimeError("model unavailable")
+
+    fake = fake_openai_client(reply)
+    monkeypatch.setattr(qa_router, "get_async_openai_client", lambda: fake)
+
+    response = client.post(
+        "/api/qa/grade/batch", json={"items": [{"plan_json": {"project_name": "P"}}]}
+    )
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Failed to grade plans: model unavailable"
+
+
+def test_meeting_batch_reports_failed_item_in_place(client, monkeypatch):
+    def reply(kwargs):
+        prompt = user_prompt(kwargs)
+        if "FAIL" in prompt:
+            raise RuntimeError("model unavailable")
+        name = re.search(r'"project_name":"(\w+)"', prompt)[1]
+        return json.dumps({"project_name": name, "apqp_notes": [{"text": "n"}]})
+
+    fake = fake_openai_client(reply)
+    monkeypatch.setattr(meeting_router, "get_async_openai_client", lambda: fake)
+    items = [
+        {"plan_json": {"project_name": "A"}, "transcript": TRANSCRIPT},
+        {"plan_json": {"project_name": "B"}, "transcript": "FAIL " + TRANSCRIPT},
+        {"plan_json": {"project_name": "C"}, "transcript": TRANSCRIPT},
+    ]
+
+    response = client.post("/api/meeting/apply/batch", json={"items": items})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r.get("plan_json", {}).get("project_name") for r in results] == [
+        "A",
+        None,
+        "C",
+    ]
+    assert results[1] == {
+        "project_name": "B",
+        "error": "Failed to process meeting transcript: model unavailable",
+    }
+
+
+def test_checklist_batch_reports_failed_item_in_place(client, monkeypatch):
+    calls = []
+
+    async def generate_checklist(
+        vector_store_id, project_name, customer=None, category_ids=None, mode="fast"
+    ):
+        calls.append((project_name, mode))
+        if project_name == "B":
+            raise RuntimeError("vector store expired")
+        return {"project_name": project_name, "categories": []}
+
+    monkeypatch.setattr(
+        checklist_router.optimized_checklist_service,
+        "generate_checklist",
+        generate_checklist,
+    )
+    items = [
+        {"vector_store_id": "vs_a", "project_name": "A"},
+        {"vector_store_id": "vs_b", "project_name": "B"},
+        {"vector_store_id": "vs_c", "project_name": "C", "optimized": False},
+    ]
+
+    response = client.post("/api/checklist/batch", json={"items": items})
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"project_name": "A", "categories": []},
+        {
+            "project_name": "B",
+            "vector_store_id": "vs_b",
+            "error": "vector store expired",
+        },
+        {"project_name": "C", "categories": []},
+    ]
+    assert sorted(calls) == [("A", "fast"), ("B", "fast"), ("C", "accurate")]
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["/api/qa/grade/batch", "/api/meeting/apply/batch", "/api/checklist/batch"],
+)
+def test_batch_rejects_empty_item_list(client, url):
+    assert client.post(url, json={"items": []}).status_code == 422
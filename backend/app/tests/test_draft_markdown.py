@@ -0,0 +1,75 @@
+"""
+Tests for streaming a plan's Markdown from /draft/markdown
+"""
+
+from collections import OrderedDict
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import draft as draft_router
+from app.routers.draft import MARKDOWN_CHUNK_SIZE, plan_etag, plan_to_markdown
+
+
+def _key_point(text):
+    return {"text": text, "confidence": 0.9, "source_hint": {"document": "spec.pdf"}}
+
+
+# Enough content that the document is streamed in several chunks
+PLAN = {
+    "project_name": "Conveyor Frame",
+    "customer": "Northern Manufacturing",
+    "family_of_parts": "Weldments",
+    "generated_at": "2025-01-01T00:00:00",
+    "keys_to_project": [_key_point(f"Key point {i}") for i in range(100)],
+    "quality_plan": {
+        "control_plan_items": [_key_point(f"Control {i}") for i in range(100)],
+    },
+    "asana_todos": [{"title": "Confirm material grade", "priority": "high"}],
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(draft_router, "_markdown_cache", OrderedDict())
+    return TestClient(app)
+
+
+def test_streams_the_same_markdown_as_plan_to_markdown(client):
+    response = client.post("/api/draft/markdown", json=PLAN)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/markdown")
+    assert response.headers["etag"] == plan_etag(PLAN)
+    assert len(response.text) > MARKDOWN_CHUNK_SIZE
+    assert response.text == plan_to_markdown(PLAN)
+
+
+def test_repeat_request_is_served_from_cache(client):
+    first = client.post("/api/draft/markdown", json=PLAN)
+    assert list(draft_router._markdown_cache) == [plan_etag(PLAN)]
+
+    second = client.post("/api/draft/markdown", json=PLAN)
+
+    assert second.text == first.text
+    assert "content-length" in second.headers  # not streamed this time
+
+
+def test_plan_without_generated_at_is_not_cached(client):
+    plan = {key: value for key, value in PLAN.items() if key != "generated_at"}
+
+    response = client.post("/api/draft/markdown", json=plan)
+
+    assert response.status_code == 200
+    assert response.text.startswith("# Strategic Build Plan: Conveyor Frame")
+    assert not draft_router._markdown_cache
+
+
+def test_post_never_returns_not_modified(client):
+    response = client.post(
+        "/api/draft/markdown", json=PLAN, headers={"If-None-Match": plan_etag(PLAN)}
+    )
+
+    assert response.status_code == 200
+    assert response.text == plan_to_markdown(PLAN)
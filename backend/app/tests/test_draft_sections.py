@@ -0,0 +1,18 @@
+"""
+Unit tests keeping the Markdown section table in sync with the plan schema
+"""
+
+import pytest
+
+from app.models.plan_schema import StrategicBuildPlan
+from app.routers.draft import _PLAN_SECTIONS
+
+
+@pytest.mark.parametrize(
+    "key, subsections", [(key, subsections) for _, key, subsections in _PLAN_SECTIONS]
+)
+def test_plan_sections_match_schema(key, subsections):
+    section_model = StrategicBuildPlan.model_fields[key].annotation
+    assert [sub_key for _, sub_key, _ in subsections] == list(
+        section_model.model_fields
+    ), f"_PLAN_SECTIONS is out of sync with {section_model.__name__}"
@@ -0,0 +1,51 @@
+"""
+Unit tests for splitting long meeting transcripts before summarization
+"""
+
+from app.routers.meeting import TRANSCRIPT_CHUNK_CHARS, _split_transcript
+
+
+def _assert_within_limit(chunks):
+    assert chunks
+    assert all(len(chunk) <= TRANSCRIPT_CHUNK_CHARS for chunk in chunks)
+
+
+def test_splits_punctuated_transcript_on_sentence_ends():
+    sentence = "We agreed to move the weld inspection to second shift. "
+    transcript = sentence * 1000
+
+    chunks = _split_transcript(transcript)
+
+    _assert_within_limit(chunks)
+    assert len(chunks) > 1
+    assert all(chunk.endswith("shift.") for chunk in chunks)
+    assert " ".join(chunks) == transcript.strip()
+
+
+def test_splits_line_based_transcript_on_line_breaks():
+    lines = [f"Speaker {i % 3}: item {i} needs a first article" for i in range(20000)]
+    transcript = "\n".join(lines)
+
+    chunks = _split_transcript(transcript)
+
+    _assert_within_limit(chunks)
+    assert len(chunks) > 1
+    # Lines are never cut in half and come back in order
+    assert [line for chunk in chunks for line in chunk.split("\n")] == lines
+
+
+def test_slices_unpunctuated_single_line_transcript():
+    transcript = "word " * 120000
+
+    chunks = _split_transcript(transcript)
+
+    _assert_within_limit(chunks)
+    assert len(chunks) >= len(transcript) // TRANSCRIPT_CHUNK_CHARS
+    # Only whitespace at the cut points is dropped
+    assert "".join(chunks).replace(" ", "") == transcript.replace(" ", "")
+
+
+def test_short_transcript_is_one_chunk():
+    assert _split_transcript("Short meeting. Nothing decided.") == [
+        "Short meeting. Nothing decided."
+    ]
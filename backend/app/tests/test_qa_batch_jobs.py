@@ -0,0 +1,192 @@
+"""
+Tests for Batch API grading jobs: the submitted JSONL and how the poller
+reads the job's output and error files back into grades
+"""
+
+import json
+from types import SimpleNamespace
+
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+from openai import NotFoundError
+from openai.types import Batch
+
+from app.main import app
+from app.routers import qa as qa_router
+
+FULL_SCORES = {
+    "completeness": 18,
+    "specificity": 17,
+    "actionability": 16,
+    "manufacturability": 15,
+    "risk_coverage": 14,
+}
+
+
+def _output_record(custom_id, status_code, body):
+    return {
+        "id": f"req_{custom_id}",
+        "custom_id": custom_id,
+        "response": {"status_code": status_code, "body": body},
+        "error": None,
+    }
+
+
+def _completion_body(content):
+    return {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+
+OUTPUT_FILE = [
+    _output_record(
+        "0", 200, _completion_body(json.dumps({"dimension_scores": FULL_SCORES}))
+    ),
+    _output_record("1", 200, _completion_body("not json")),
+    _output_record("3", 400, {"error": {"message": "context_length_exceeded"}}),
+]
+
+ERROR_FILE = [
+    {
+        "id": "req_2",
+        "custom_id": "2",
+        "response": None,
+        "error": {"code": "batch_expired", "message": "Request expired"},
+    }
+]
+
+
+def _batch(status="completed", output_file_id=None, error_file_id=None, metadata=None):
+    return Batch(
+        id="batch_abc",
+        object="batch",
+        endpoint="/v1/chat/completions",
+        input_file_id="file-in",
+        completion_window="24h",
+        status=status,
+        created_at=1760000000,
+        output_file_id=output_file_id,
+        error_file_id=error_file_id,
+        metadata=(
+            {"job": "qa_grade", "total_plans": "4"} if metadata is None else metadata
+        ),
+        request_counts={"total": 4, "completed": 1, "failed": 3},
+    )
+
+
+class FakeFiles:
+    def __init__(self):
+        self.uploads = []
+
+    async def create(self, file, purpose):
+        self.uploads.append((file, purpose))
+        return SimpleNamespace(id="file-in")
+
+    async def content(self, file_id):
+        records = {"file-out": OUTPUT_FILE, "file-err": ERROR_FILE}[file_id]
+        return SimpleNamespace(
+            content=b"\n".join(orjson.dumps(r) for r in records) + b"\n"
+        )
+
+
+class FakeBatches:
+    def __init__(self, batch):
+        self.batch = batch
+        self.created = []
+
+    async def create(self, **kwargs):
+        self.created.append(kwargs)
+        return self.batch
+
+    async def retrieve(self, batch_id):
+        if batch_id != self.batch.id:
+            raise NotFoundError(
+                "No batch found",
+                response=httpx.Response(
+                    404, request=httpx.Request("GET", "https://api")
+                ),
+                body=None,
+            )
+        return self.batch
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def _use_client(monkeypatch, batch):
+    fake = SimpleNamespace(files=FakeFiles(), batches=FakeBatches(batch))
+    monkeypatch.setattr(qa_router, "get_async_openai_client", lambda: fake)
+    return fake
+
+
+def test_submit_writes_one_request_per_plan(client, monkeypatch):
+    fake = _use_client(monkeypatch, _batch(status="validating"))
+    plans = [{"project_name": "A"}, {"project_name": "B"}]
+
+    response = client.post(
+        "/api/qa/grade/batch-async",
+        json={"items": [{"plan_json": p} for p in plans]},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["batch_id"] == "batch_abc"
+    assert response.json()["status"] == "validating"
+
+    (filename, content), purpose = fake.files.uploads[0]
+    assert purpose == "batch"
+    lines = [orjson.loads(line) for line in content.splitlines()]
+    assert [line["custom_id"] for line in lines] == ["0", "1"]
+    assert all(line["url"] == "/v1/chat/completions" for line in lines)
+    assert '"project_name":"B"' in lines[1]["body"]["messages"][-1]["content"]
+    assert fake.batches.created[0]["metadata"] == {
+        "job": "qa_grade",
+        "total_plans": "2",
+    }
+
+
+def test_poll_reads_output_and_error_files(client, monkeypatch):
+    _use_client(
+        monkeypatch, _batch(output_file_id="file-out", error_file_id="file-err")
+    )
+
+    response = client.get("/api/qa/grade/batch-async/batch_abc")
+
+    assert response.status_code == 200
+    job = response.json()
+    assert job["total_plans"] == 4
+    assert (job["completed_plans"], job["failed_plans"]) == (1, 3)
+
+    assert list(job["results"]) == ["0"]
+    assert job["results"]["0"]["dimension_scores"] == FULL_SCORES
+    assert job["results"]["0"]["overall_score"] == 80
+
+    errors = job["errors"]
+    assert sorted(errors) == ["1", "2", "3"]
+    assert errors["1"].startswith("Unreadable grade:")
+    assert "batch_expired" in errors["2"]
+    assert "context_length_exceeded" in errors["3"]
+
+
+def test_poll_while_running_returns_status_only(client, monkeypatch):
+    _use_client(monkeypatch, _batch(status="in_progress"))
+
+    job = client.get("/api/qa/grade/batch-async/batch_abc").json()
+
+    assert job["status"] == "in_progress"
+    assert job["results"] == {}
+    assert job["errors"] == {}
+
+
+@pytest.mark.parametrize(
+    "batch_id, metadata",
+    [("batch_missing", None), ("batch_abc", {"job": "something_else"})],
+)
+def test_poll_unknown_or_foreign_batch_is_404(client, monkeypatch, batch_id, metadata):
+    _use_client(monkeypatch, _batch(metadata=metadata))
+
+    response = client.get(f"/api/qa/grade/batch-async/{batch_id}")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == f"Grading job not found: {batch_id}"
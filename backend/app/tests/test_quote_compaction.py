@@ -0,0 +1,113 @@
+"""
+Unit tests for trimming long vendor quotes before assumption extraction
+"""
+
+import pytest
+
+from app.services import quote_comparison_service as qcs
+
+
+def _vendor_quote() -> str:
+    """A long quote laid out the way fabrication vendors usually send them"""
+    header = (
+        "ACME PRECISION FABRICATION INC.\n"
+        "1200 Industrial Parkway, Duluth MN 55811\n"
+        "QUOTATION Q-24-0817 Rev B\n"
+        "Customer: Northern Manufacturing Co.\n"
+        "Project: Conveyor Frame Weldment CF-2200\n"
+        "Quote date: 2024-08-17   Valid for 30 days\n"
+        "Contact: Dana Ruiz, Inside Sales\n"
+    )
+    header += "Reference drawings: CF-2200-001 through CF-2200-014\n" * 25
+
+    pricing = "\nLINE ITEMS AND PRICING\n" + "".join(
+        f"Line {i:03d}  Part CF-2200-{i:03d}  Laser cut 304 SS bracket  "
+        f"qty 250  unit $12.40  ext $3,100.00\n"
+        for i in range(1, 121)
+    )
+
+    notes = (
+        "\nASSUMPTIONS\n"
+        "1. Material is 304 stainless, domestic mill certs supplied.\n"
+        "2. Welding per AWS D1.6, visual inspection only.\n"
+        "3. Customer supplies fixtures for the final assembly.\n"
+        "4. Lead time is 6 weeks after receipt of approved drawings.\n"
+        "\nEXCLUSIONS\n"
+        "- Passivation and electropolish are not included.\n"
+        "- First article inspection report is not included.\n"
+        "- Freight is FOB origin.\n"
+    )
+
+    terms = (
+        "\nSTANDARD TERMS AND CONDITIONS\n"
+        + (
+            "Prices are firm for the validity period stated above. Orders are "
+            "subject to credit approval and acceptance at our Duluth office.\n"
+        )
+        * 20
+    )
+
+    warranty = (
+        "\nWARRANTY AND REMEDIES\n"
+        + (
+            "Seller warrants workmanship for twelve months from shipment. "
+            "Remedy is limited to repair or replacement at seller's option.\n"
+        )
+        * 20
+    )
+    warranty += "Payment terms net 45 days from invoice.\n"
+
+    return header + pricing + notes + terms + warranty
+
+
+@pytest.fixture
+def compaction_enabled(monkeypatch):
+    monkeypatch.setattr(qcs, "QUOTE_COMPACT_ENABLED", True)
+
+
+def test_compaction_is_off_by_default():
+    quote = _vendor_quote()
+
+    assert qcs.QUOTE_COMPACT_ENABLED is False
+    assert qcs._compact_quote_text(quote) == quote
+
+
+def test_keeps_header_and_assumption_sections(compaction_enabled):
+    quote = _vendor_quote()
+
+    compacted = qcs._compact_quote_text(quote)
+
+    assert len(compacted) < len(quote)
+    # Header: vendor and quote identification
+    assert compacted.startswith("ACME PRECISION FABRICATION INC.")
+    assert "QUOTATION Q-24-0817 Rev B" in compacted
+    # Every assumption and exclusion line
+    for line in quote[quote.index("\nASSUMPTIONS\n") :].splitlines()[:11]:
+        assert line in compacted
+    # The section runs on to the next heading after the minimum length
+    assert "STANDARD TERMS AND CONDITIONS" in compacted
+
+
+def test_drops_pricing_table_and_trailing_boilerplate(compaction_enabled):
+    compacted = qcs._compact_quote_text(_vendor_quote())
+
+    # Pricing rows past the fixed-size header window are cut
+    assert "Line 030  Part CF-2200-030" not in compacted
+    assert "Line 090  Part CF-2200-090" not in compacted
+    # Sections past the assumption notes' heading boundary are cut
+    assert "WARRANTY AND REMEDIES" not in compacted
+    assert "Payment terms net 45" not in compacted
+    assert "\n[...]\n" in compacted
+
+
+def test_keeps_full_quote_when_no_notes_section_is_found(compaction_enabled):
+    quote = _vendor_quote()
+    quote = quote.replace("ASSUMPTIONS", "NOTES").replace("EXCLUSIONS", "OTHER")
+
+    assert qcs._compact_quote_text(quote) == quote
+
+
+def test_keeps_short_quotes_whole(compaction_enabled):
+    quote = _vendor_quote()[:5000]
+
+    assert qcs._compact_quote_text(quote) == quote
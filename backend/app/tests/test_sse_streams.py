@@ -0,0 +1,227 @@
+"""
+Tests for the Server-Sent Event streams of /quote/full-workflow and
+/review/grade-process
+"""
+
+import json
+from collections import OrderedDict
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import quote as quote_router
+from app.routers import review as review_router
+from app.services import quote_comparison_service
+from app.tests.fakes import fake_openai_client, user_prompt
+
+SSE_HEADERS = {"Accept": "text/event-stream"}
+
+CHECKLIST = {
+    "project_name": "Conveyor Frame",
+    "categories": [
+        {
+            "id": "material_standards",
+            "name": "Material Standards",
+            "items": [
+                {
+                    "prompt_id": "m1",
+                    "question": "Material?",
+                    "answer": "316 SS",
+                    "status": "requirement_found",
+                    "source": "spec",
+                }
+            ],
+        }
+    ],
+}
+
+QUOTE_EXTRACTION = {
+    "vendor_name": "Acme Fabrication",
+    "quote_number": "Q-24-0817",
+    "assumptions": [
+        {
+            "category_id": "material_standards",
+            "category_name": "Material Standards",
+            "text": "Material is 304 SS",
+            "implication": "Lower corrosion resistance than 316",
+            "confidence": 0.9,
+        }
+    ],
+    "general_notes": [],
+}
+
+QUOTE_COMPARISON = {
+    "matches": [],
+    "conflicts": [
+        {
+            "quote_assumption": "Material is 304 SS",
+            "checklist_requirement": "316 SS",
+            "category": "material_standards",
+            "conflict_description": "Quote assumes a different grade",
+            "severity": "high",
+            "resolution_suggestion": "Requote in 316 SS",
+        }
+    ],
+    "quote_only": [],
+    "checklist_only": [],
+}
+
+PROCESS_GRADE = {
+    "dimension_scores": {
+        "discussion_coverage": 15,
+        "stakeholder_participation": 12,
+        "decision_quality": 18,
+        "action_assignment": 9,
+        "risk_discussion": 20,
+    },
+    "strengths": ["Risks were discussed in depth"],
+    "improvements": ["Assign owners to every action"],
+}
+
+TRANSCRIPT = (
+    "Dana: The customer confirmed 316 stainless for the frame. "
+    "Lee: I will update the routing and send it by Friday."
+)
+
+
+def _events(body: str):
+    """(event, data) pairs of an SSE body, skipping keep-alive comments"""
+    events = []
+    for block in body.split("\n\n"):
+        fields = dict(
+            line.split(": ", 1)
+            for line in block.splitlines()
+            if not line.startswith(":")
+        )
+        if fields:
+            events.append((fields["event"], orjson.loads(fields["data"])))
+    return events
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def quote_openai(monkeypatch):
+    """Fake quote model; set fail_compare to make the comparison call raise"""
+    state = {"fail_compare": False}
+
+    def reply(kwargs):
+        prompt = user_prompt(kwargs)
+        if "QUOTE DOCUMENT:" in prompt:
+            return json.dumps(QUOTE_EXTRACTION)
+        if state["fail_compare"]:
+            raise RuntimeError("model unavailable")
+        return json.dumps(QUOTE_COMPARISON)
+
+    fake = fake_openai_client(reply)
+    monkeypatch.setattr(
+        quote_comparison_service, "get_async_openai_client", lambda: fake
+    )
+    monkeypatch.setattr(quote_router.quote_service, "_completion_cache", OrderedDict())
+    return state
+
+
+def _post_workflow(client, headers=None):
+    return client.post(
+        "/api/quote/full-workflow",
+        data={"checklist": json.dumps(CHECKLIST), "project_name": "Conveyor Frame"},
+        files={"quote_file": ("quote.txt", b"Material is 304 SS.", "text/plain")},
+        headers=headers,
+    )
+
+
+def test_quote_workflow_streams_one_event_per_step(client, quote_openai):
+    response = _post_workflow(client, SSE_HEADERS)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert [name for name, _ in events] == [
+        "quote_assumptions",
+        "comparison",
+        "merge_preview",
+        "done",
+    ]
+    assert events[0][1]["vendor_name"] == "Acme Fabrication"
+    assert events[1][1]["statistics"]["high_severity_conflicts"] == 1
+    assert events[3][1] == {"workflow_complete": True}
+
+
+def test_quote_workflow_stream_matches_json_response(client, quote_openai):
+    events = dict(_events(_post_workflow(client, SSE_HEADERS).text))
+    result = _post_workflow(client).json()
+
+    assert events["quote_assumptions"]["assumptions"] == (
+        result["quote_assumptions"]["assumptions"]
+    )
+    assert events["comparison"]["conflicts"] == result["comparison"]["conflicts"]
+
+
+def test_quote_workflow_stream_ends_with_error_event(client, quote_openai):
+    quote_openai["fail_compare"] = True
+
+    events = _events(_post_workflow(client, SSE_HEADERS).text)
+
+    assert [name for name, _ in events] == ["quote_assumptions", "error"]
+    assert "model unavailable" in events[1][1]["detail"]
+
+
+@pytest.fixture
+def review_openai(monkeypatch):
+    """Fake process grader; set "content" to change what the model replies"""
+    replies = {"content": json.dumps(PROCESS_GRADE)}
+    fake = fake_openai_client(lambda kwargs: replies["content"])
+    monkeypatch.setattr(review_router, "get_async_openai_client", lambda: fake)
+    monkeypatch.setattr(review_router, "_review_cache", OrderedDict())
+    return replies
+
+
+def test_process_grade_streams_dimensions_then_grade(client, review_openai):
+    response = client.post(
+        "/api/review/grade-process",
+        json={"transcript": TRANSCRIPT},
+        headers=SSE_HEADERS,
+    )
+
+    assert response.status_code == 200
+    events = _events(response.text)
+    assert [name for name, _ in events] == ["dimension"] * 5 + ["grade"]
+    assert [data for _, data in events[:5]] == [
+        {"dimension": dimension, "score": score}
+        for dimension, score in PROCESS_GRADE["dimension_scores"].items()
+    ]
+    grade = events[-1][1]
+    assert grade["overall_score"] == 74
+    assert grade["dimension_scores"] == PROCESS_GRADE["dimension_scores"]
+
+
+def test_process_grade_stream_replays_cached_reply(client, review_openai, monkeypatch):
+    monkeypatch.setattr(review_router, "REVIEW_CACHE_ENABLED", True)
+    request = {"json": {"transcript": TRANSCRIPT}, "headers": SSE_HEADERS}
+    first = _events(client.post("/api/review/grade-process", **request).text)
+    review_openai["content"] = "the model must not be called again"
+
+    second = _events(client.post("/api/review/grade-process", **request).text)
+
+    assert [name for name, _ in second] == [name for name, _ in first]
+    assert second[-1][1]["overall_score"] == first[-1][1]["overall_score"]
+
+
+def test_process_grade_stream_ends_with_error_event(client, review_openai):
+    review_openai["content"] = "not json"
+
+    events = _events(
+        client.post(
+            "/api/review/grade-process",
+            json={"transcript": TRANSCRIPT},
+            headers=SSE_HEADERS,
+        ).text
+    )
+
+    assert [name for name, _ in events] == ["error"]
+    assert events[0][1]["detail"].startswith("Failed to grade process:")